@@ -6,6 +6,7 @@ from backend.app.services.f1_service import (
     get_session_metadata,
     get_track_data,
     get_race_frames,
+    FPS,
 )
 
 router = APIRouter(prefix="/api/years/{year}/rounds/{round_number}/sessions/{session}", tags=["race"])
@@ -39,11 +40,13 @@ async def get_track(year: int, round_number: int, session: str):
 
 
 @router.get("/frames")
-async def get_frames(year: int, round_number: int, session: str):
-    """Get all telemetry frames for race/sprint playback."""
+async def get_frames(year: int, round_number: int, session: str, fps: float = FPS):
+    """Get all telemetry frames for race/sprint playback (``fps`` picks the timeline rate)."""
     if session not in ['R', 'S']:
         raise HTTPException(status_code=400, detail="Frames endpoint only available for Race (R) or Sprint (S) sessions")
+    if not 0 < fps <= FPS:
+        raise HTTPException(status_code=400, detail=f"fps must be between 0 and {FPS}")
     try:
-        return get_race_frames(year, round_number, session)
+        return get_race_frames(year, round_number, session, fps=fps)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
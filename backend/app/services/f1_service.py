@@ -15,6 +15,7 @@ from src.f1_data import (
     get_quali_telemetry,
     get_driver_colors,
     get_circuit_rotation,
+    FPS,
 )
 from src.ui_components import build_track_from_example_lap
 import fastf1
@@ -150,10 +151,10 @@ def get_track_data(year: int, round_number: int, session_type: str) -> dict:
     }
 
 
-def get_race_frames(year: int, round_number: int, session_type: str) -> dict:
-    """Get all race telemetry frames for playback."""
+def get_race_frames(year: int, round_number: int, session_type: str, fps: float = FPS) -> dict:
+    """Get all race telemetry frames for playback, sampled at ``fps``."""
     session = load_session(year, round_number, session_type)
-    telemetry_data = get_race_telemetry(session, session_type=session_type)
+    telemetry_data = get_race_telemetry(session, session_type=session_type, fps=fps)
 
     # Convert driver colors to hex
     driver_colors = telemetry_data.get('driver_colors', {})
@@ -162,12 +163,15 @@ def get_race_frames(year: int, round_number: int, session_type: str) -> dict:
         for code, (r, g, b) in driver_colors.items()
     }
 
+    frames = telemetry_data['frames']
+
     return {
-        'frames': telemetry_data['frames'],
+        'frames': frames.to_list(),
         'driver_colors': driver_colors_hex,
         'track_statuses': telemetry_data.get('track_statuses', []),
         'total_laps': telemetry_data.get('total_laps', 0),
-        'total_frames': len(telemetry_data['frames']),
+        'total_frames': len(frames),
+        'fps': frames.fps,
         # New metadata
         'pit_stops': telemetry_data.get('pit_stops', []),
         'lap_times': telemetry_data.get('lap_times', {}),
@@ -205,7 +209,7 @@ def get_qualifying_driver_telemetry(year: int, round_number: int, session_type:
         return {'frames': [], 'error': 'No telemetry data found'}
 
     return {
-        'frames': segment_data.get('frames', []),
+        'frames': list(segment_data.get('frames', [])),
         'drs_zones': segment_data.get('drs_zones', []),
         'max_speed': segment_data.get('max_speed', 0),
         'min_speed': segment_data.get('min_speed', 0),
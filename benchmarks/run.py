@@ -0,0 +1,254 @@
+"""
+Benchmark the telemetry pipeline on synthetic sessions (no network needed).
+
+    python -m benchmarks.run                       # run and compare with benchmarks/baseline.json
+    python -m benchmarks.run --save-baseline       # record a new baseline
+    python -m benchmarks.run --laps 78 --repeat 3  # longer race, best of three
+
+Every race pipeline stage, the cached load, the replay frame loop and the
+qualifying pipeline are timed separately, with the peak RSS of the process
+(and of the worker processes) while each one ran. Stages that are slower
+than the baseline by more than the tolerance are reported as regressions
+and make the command exit with status 1, as does a missing baseline.
+Baselines are machine-specific, so record one locally before a change.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from multiprocessing import cpu_count
+
+import numpy as np
+
+import src.f1_data as f1_data
+from src.lib.storage import save_stage
+from src.lib.track_status import TrackStatusIndex
+from src.ui_components import flag_events
+from benchmarks.synthetic import SyntheticSession, default_race_laps, driver_colors
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_TOLERANCE = 0.25   # 25% slower than the baseline counts as a regression
+MIN_REGRESSION_SECONDS = 0.05  # ignore noise on very short stages
+FRAME_LOOP_FRAMES = 2500   # 100 seconds of 1x playback at 25 FPS
+
+
+# --- memory ---------------------------------------------------------------------
+
+def _reset_peak_rss():
+    # Linux only: writing 5 to clear_refs resets the VmHWM high-water mark,
+    # so each stage reports its own peak instead of the whole run's
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _children_peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _measure(results, name, func):
+    """Run ``func``, record its wall time and peak memory under ``name``, return its result."""
+    _reset_peak_rss()
+    start = time.perf_counter()
+    value = func()
+    elapsed = time.perf_counter() - start
+    results[name] = {
+        "seconds": elapsed,
+        "peak_rss_mb": _peak_rss_mb(),
+        "children_peak_rss_mb": _children_peak_rss_mb(),
+    }
+    print(f"  {name:<28} {elapsed:8.3f}s  {results[name]['peak_rss_mb']:8.1f} MB")
+    return value
+
+
+# --- suite ----------------------------------------------------------------------
+
+def _frame_loop(frames, track_statuses, total_laps):
+    # What the replay window does per drawn frame: build the frame view at
+    # the current playback position, plus the flag markers set up at start-up
+    flag_events(TrackStatusIndex(track_statuses, frames.t))
+    n = min(len(frames), FRAME_LOOP_FRAMES)
+    for i in range(n):
+        frames[i]
+    return n
+
+
+def run_suite(config):
+    results = {}
+    fps, caution_fps = config["fps"], config["caution_fps"]
+
+    race = _measure(results, "synthetic.race_session", lambda: SyntheticSession(
+        "R", n_drivers=config["drivers"], n_laps=config["laps"], seed=config["seed"]))
+
+    stages = {}
+    stages["driver_telemetry"] = _measure(results, "race.driver_telemetry",
+                                          lambda: f1_data._stage_driver_telemetry(race))
+    caution_periods = f1_data._caution_periods(race) if caution_fps else ()
+    stages["timeline"] = _measure(results, "race.timeline", lambda: f1_data._stage_timeline(
+        stages["driver_telemetry"], fps, caution_fps, caution_periods))
+    stages["standings"] = _measure(results, "race.standings",
+                                   lambda: f1_data._stage_standings(stages["timeline"]))
+    stages["progress"] = _measure(results, "race.progress", lambda: f1_data._stage_progress(
+        stages["timeline"], stages["standings"]))
+    stages["track_status"] = _measure(results, "race.track_status",
+                                      lambda: f1_data._stage_track_status(race, stages["timeline"]))
+    stages["weather"] = _measure(results, "race.weather",
+                                 lambda: f1_data._stage_weather(race, stages["timeline"]))
+    stages["race_metadata"] = _measure(results, "race.race_metadata",
+                                       lambda: f1_data._stage_race_metadata(race))
+    stages["events"] = _measure(results, "race.events", lambda: f1_data._stage_events(
+        stages["timeline"], stages["standings"], stages["progress"], stages["race_metadata"]))
+
+    keys = f1_data._race_stage_keys(race.event["EventDate"].year, race.event["RoundNumber"], "R", fps, caution_fps)
+
+    def _write_stages():
+        for name, stage in stages.items():
+            f1_data.cache_manager.put(keys[name], stage, save_stage)
+
+    _measure(results, "race.cache_write", _write_stages)
+    data = _measure(results, "race.cache_load",
+                    lambda: f1_data.get_race_telemetry(race, "R", fps=fps, caution_fps=caution_fps))
+    _measure(results, "race.frame_loop",
+             lambda: _frame_loop(data["frames"], data["track_statuses"], data["total_laps"]))
+    del data, stages, race
+
+    quali = _measure(results, "synthetic.quali_session", lambda: SyntheticSession(
+        "Q", n_drivers=config["drivers"], seed=config["seed"]))
+    _measure(results, "quali.pipeline", lambda: f1_data.get_quali_telemetry(quali, "Q", fps=fps))
+    _measure(results, "quali.cache_load", lambda: f1_data.get_quali_telemetry(quali, "Q", fps=fps))
+
+    return results
+
+
+def run(config, repeat=1):
+    """Run the suite ``repeat`` times in a scratch cache and keep each stage's best time."""
+    # Synthetic sessions have no online driver data for FastF1 to colour from
+    f1_data.get_driver_colors = driver_colors
+
+    best = {}
+    cache_root = f1_data.cache_manager.root
+    for attempt in range(repeat):
+        print(f"Run {attempt + 1}/{repeat}:")
+        scratch = tempfile.mkdtemp(prefix="f1-benchmark-")
+        f1_data.cache_manager.root = scratch
+        try:
+            results = run_suite(config)
+        finally:
+            f1_data.cache_manager.root = cache_root
+            shutil.rmtree(scratch, ignore_errors=True)
+        for name, result in results.items():
+            if name not in best or result["seconds"] < best[name]["seconds"]:
+                best[name] = result
+    return best
+
+
+# --- baseline -------------------------------------------------------------------
+
+def _environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": cpu_count(),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print current vs baseline per stage and return the names of regressed stages."""
+    regressions = []
+    print(f"\n{'stage':<28} {'baseline':>10} {'current':>10} {'change':>8}  {'peak RSS':>10}")
+    for name, result in results.items():
+        seconds = result["seconds"]
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:<28} {'-':>10} {seconds:9.3f}s {'new':>8}  {result['peak_rss_mb']:8.1f} MB")
+            continue
+
+        change = seconds / reference["seconds"] - 1 if reference["seconds"] > 0 else 0.0
+        regressed = change > tolerance and seconds - reference["seconds"] > MIN_REGRESSION_SECONDS
+        if name.startswith("synthetic."):
+            regressed = False  # generating the test data is reported, not judged
+        flag = "  <-- regression" if regressed else ""
+        print(f"{name:<28} {reference['seconds']:9.3f}s {seconds:9.3f}s {change:+8.1%}  "
+              f"{result['peak_rss_mb']:8.1f} MB{flag}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the telemetry pipeline on synthetic sessions.")
+    parser.add_argument("--drivers", type=int, default=20)
+    parser.add_argument("--laps", type=int, default=None, help="race laps (default: 50-78, picked by the seed)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fps", type=float, default=f1_data.FPS)
+    parser.add_argument("--caution-fps", type=float, default=None)
+    parser.add_argument("--repeat", type=int, default=1, help="run the suite N times and keep the best times")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to --baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--output", help="also write the results JSON here")
+    args = parser.parse_args(argv)
+
+    config = {
+        "drivers": args.drivers,
+        "laps": args.laps or default_race_laps(args.seed),
+        "seed": args.seed,
+        "fps": args.fps,
+        "caution_fps": args.caution_fps,
+    }
+    results = run(config, repeat=max(1, args.repeat))
+    report = {"config": config, "environment": _environment(), "results": results}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        # Nothing to compare with is a failed check, not a pass
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 1
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("config") != config:
+        print(f"\nWarning: baseline was recorded with {baseline.get('config')}, this run used {config}")
+
+    regressions = compare(results, baseline.get("results", {}), args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} stage(s) slower than the baseline by more than {args.tolerance:.0%}: "
+              f"{', '.join(regressions)}")
+        return 1
+    print("\nNo regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
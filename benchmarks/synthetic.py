@@ -0,0 +1,322 @@
+"""
+Synthetic FastF1-like sessions for benchmarking the telemetry pipeline offline.
+
+The sessions expose the parts of the fastf1 Session API the pipeline uses
+(laps, car_data, pos_data, track_status, weather_data, results, event,
+drivers, get_driver) with realistic sizes: 20 drivers, 50-78 race laps and
+~4 Hz car/position streams, like the live timing data FastF1 serves.
+"""
+import numpy as np
+import pandas as pd
+
+TRACK_LENGTH = 5000.0      # metres
+SAMPLE_HZ = 4.0            # car and position data rate
+GRID_SPACING = 0.25        # seconds between grid slots at the start
+SESSION_START = 3600.0     # session seconds when the race / Q1 starts
+PIT_LOSS = 22.0            # seconds lost on a pit stop lap
+COMPOUNDS = ("SOFT", "MEDIUM", "HARD")
+
+
+def default_race_laps(seed):
+    """Race length (50-78 laps) used when none is given; fixed per seed."""
+    return int(np.random.default_rng(seed).integers(50, 79))
+
+
+class SyntheticLaps(pd.DataFrame):
+    """Laps table with the fastf1.core.Laps helpers the pipeline calls."""
+
+    @property
+    def _constructor(self):
+        return SyntheticLaps
+
+    def pick_drivers(self, identifier):
+        identifier = str(identifier)
+        return self[(self["DriverNumber"] == identifier) | (self["Driver"] == identifier)]
+
+    def pick_fastest(self):
+        timed = self.dropna(subset=["LapTime"])
+        if timed.empty:
+            return None
+        return timed.loc[timed["LapTime"].idxmin()]
+
+    def split_qualifying_sessions(self):
+        if "QualifyingSession" not in self:
+            return None, None, None
+        return tuple(
+            self[self["QualifyingSession"] == segment] if (self["QualifyingSession"] == segment).any() else None
+            for segment in (1, 2, 3)
+        )
+
+
+class SyntheticTrack:
+    """A closed circuit with a speed profile that slows into the corners."""
+
+    def __init__(self, rng, length=TRACK_LENGTH, resolution=1.0):
+        self.length = length
+        self.s = np.arange(0.0, length, resolution)
+        phase = 2 * np.pi * self.s / length
+
+        # A few harmonics give a wobbly loop with distinct corners and straights
+        a = rng.uniform(0.1, 0.25, 3)
+        radius = 1.0 + a[0] * np.sin(2 * phase) + a[1] * np.cos(3 * phase + 1.0) + a[2] * np.sin(5 * phase)
+        x = 1.5 * radius * np.cos(phase)
+        y = radius * np.sin(phase)
+
+        # Scale the loop to the lap length (metres), then store X/Y in the
+        # 1/10 m units of FastF1 position data
+        perimeter = np.sum(np.hypot(np.diff(x, append=x[0]), np.diff(y, append=y[0])))
+        x, y = x * length / perimeter, y * length / perimeter
+        self.x = x * 10.0
+        self.y = y * 10.0
+
+        # Fastest on the straights, slowest at the tightest corner (km/h)
+        heading = np.unwrap(np.arctan2(np.gradient(y), np.gradient(x)))
+        curvature = np.abs(np.gradient(heading)) / resolution
+        curvature = np.convolve(curvature, np.ones(60) / 60, mode="same")
+        self.speed = 330.0 - 245.0 * np.sqrt(curvature / curvature.max())
+
+        # Seconds from the line to each point of the reference lap
+        self.t = np.concatenate([[0.0], np.cumsum(resolution / (self.speed[:-1] / 3.6))])
+        self.lap_time = float(self.t[-1] + resolution / (self.speed[-1] / 3.6))
+
+    def at(self, distance):
+        s = np.mod(distance, self.length)
+        return (
+            np.interp(s, self.s, self.x, period=self.length),
+            np.interp(s, self.s, self.y, period=self.length),
+            np.interp(s, self.s, self.speed, period=self.length),
+        )
+
+
+def _drive(track, rng, t_start, lap_factors):
+    """
+    Samples for consecutive laps starting at ``t_start``. ``lap_factors``
+    scale the reference lap time of each lap (>1 is slower).
+    """
+    n_laps = len(lap_factors)
+    lap_durations = track.lap_time * np.asarray(lap_factors)
+    lap_starts = t_start + np.concatenate([[0.0], np.cumsum(lap_durations)[:-1]])
+    lap_ends = lap_starts + lap_durations
+
+    # Piecewise map from time to race distance, one reference lap per lap
+    knots_t = (lap_starts[:, None] + track.t[None, :] * np.asarray(lap_factors)[:, None]).ravel()
+    knots_d = (np.arange(n_laps)[:, None] * track.length + track.s[None, :]).ravel()
+    knots_t = np.append(knots_t, lap_ends[-1])
+    knots_d = np.append(knots_d, n_laps * track.length)
+
+    def _sample(offset):
+        times = np.arange(t_start + offset, lap_ends[-1], 1 / SAMPLE_HZ)
+        times = times + rng.uniform(0.0, 0.03, len(times))
+        return times, np.interp(times, knots_t, knots_d)
+
+    car_t, car_d = _sample(0.0)
+    lap_of_sample = np.minimum((car_d // track.length).astype(int), n_laps - 1)
+    _, _, ref_speed = track.at(car_d)
+    speed = ref_speed / np.asarray(lap_factors)[lap_of_sample] + rng.normal(0.0, 2.0, len(car_t))
+    gear = np.clip(np.ceil(speed / 42.0), 1, 8).astype(int)
+    acceleration = np.gradient(speed)
+    throttle = np.clip(60.0 + acceleration * 20.0, 0.0, 100.0)
+    brake = acceleration < -2.0
+    drs = np.where(speed > 300.0, 12, 8)
+
+    pos_t, pos_d = _sample(0.11)
+    x, y, _ = track.at(pos_d)
+
+    car = pd.DataFrame({
+        "SessionTime": pd.to_timedelta(car_t, unit="s"),
+        "Speed": speed,
+        "nGear": gear,
+        "Throttle": throttle,
+        "Brake": brake,
+        "DRS": drs,
+    })
+    pos = pd.DataFrame({
+        "SessionTime": pd.to_timedelta(pos_t, unit="s"),
+        "X": x + rng.normal(0.0, 0.5, len(x)),
+        "Y": y + rng.normal(0.0, 0.5, len(y)),
+    })
+    return car, pos, lap_starts, lap_ends
+
+
+def _lap_row(number, code, lap_number, start, end, compound, pit_in=None, pit_out=None, segment=None):
+    lap_time = end - start
+    row = {
+        "DriverNumber": number,
+        "Driver": code,
+        "LapNumber": float(lap_number),
+        "LapStartTime": pd.Timedelta(seconds=start),
+        "Time": pd.Timedelta(seconds=end),
+        "LapTime": pd.Timedelta(seconds=lap_time),
+        "Compound": compound,
+        "PitInTime": pd.Timedelta(seconds=pit_in) if pit_in is not None else pd.NaT,
+        "PitOutTime": pd.Timedelta(seconds=pit_out) if pit_out is not None else pd.NaT,
+        "Sector1Time": pd.Timedelta(seconds=lap_time * 0.32),
+        "Sector2Time": pd.Timedelta(seconds=lap_time * 0.36),
+        "Sector3Time": pd.Timedelta(seconds=lap_time * 0.32),
+    }
+    if segment is not None:
+        row["QualifyingSession"] = segment
+    return row
+
+
+class SyntheticSession:
+    """
+    A race (``session_type='R'``/``'S'``) or qualifying (``'Q'``/``'SQ'``)
+    session. ``n_laps`` defaults to a random race length between 50 and 78.
+    """
+
+    def __init__(self, session_type="R", n_drivers=20, n_laps=None, seed=0, year=2024, round_number=1):
+        rng = np.random.default_rng(seed)
+        self.session_type = session_type
+        self.name = "Qualifying" if session_type in ("Q", "SQ") else "Race"
+        self.event = pd.Series({
+            "EventDate": pd.Timestamp(f"{year}-06-01"),
+            "RoundNumber": round_number,
+            "EventName": "Synthetic Grand Prix",
+            "Location": "Synthetic",
+            "Country": "Nowhere",
+        })
+        self.track = SyntheticTrack(rng)
+
+        self.drivers = [str(number) for number in range(1, n_drivers + 1)]
+        self._info = {
+            number: {
+                "DriverNumber": number,
+                "Abbreviation": f"D{int(number):02d}",
+                "FullName": f"Driver {number}",
+            }
+            for number in self.drivers
+        }
+        self.car_data = {}
+        self.pos_data = {}
+
+        if session_type in ("Q", "SQ"):
+            rows = self._build_qualifying(rng)
+        else:
+            self.total_laps = int(n_laps or default_race_laps(seed))
+            rows = self._build_race(rng, self.total_laps)
+        self.laps = SyntheticLaps(rows)
+
+        session_end = max(self.laps["Time"]).total_seconds()
+        self._build_track_status(rng, session_end)
+        self._build_weather(session_end)
+
+    # --- session API --------------------------------------------------------
+
+    def get_driver(self, identifier):
+        identifier = str(identifier)
+        for info in self._info.values():
+            if identifier in (info["DriverNumber"], info["Abbreviation"]):
+                return pd.Series(info)
+        raise ValueError(f"Invalid driver identifier '{identifier}'")
+
+    def __str__(self):
+        return f"{self.event['EventDate'].year} Season Round {self.event['RoundNumber']}: {self.event['EventName']} - {self.name}"
+
+    # --- generators ---------------------------------------------------------
+
+    def _build_race(self, rng, n_laps):
+        rows = []
+        retirements = set(rng.choice(self.drivers, size=2, replace=False))
+        for slot, number in enumerate(self.drivers):
+            code = self._info[number]["Abbreviation"]
+            pace = 1.0 + slot * 0.002 + rng.uniform(0.0, 0.002)
+            laps_run = int(rng.integers(n_laps // 3, n_laps)) if number in retirements else n_laps
+            pit_lap = int(rng.integers(n_laps // 3, 2 * n_laps // 3))
+
+            factors = pace * (1.0 + rng.normal(0.0, 0.004, laps_run) + 0.0004 * np.arange(laps_run))
+            factors[0] *= 1.08  # standing start
+            if pit_lap < laps_run:
+                factors[pit_lap - 1] += PIT_LOSS / self.track.lap_time
+
+            car, pos, starts, ends = _drive(self.track, rng, SESSION_START + slot * GRID_SPACING, factors)
+            self.car_data[number] = car
+            self.pos_data[number] = pos
+
+            for k in range(laps_run):
+                lap_number = k + 1
+                compound = COMPOUNDS[1] if lap_number <= pit_lap else COMPOUNDS[2]
+                rows.append(_lap_row(
+                    number, code, lap_number, starts[k], ends[k], compound,
+                    pit_in=ends[k] - 5.0 if lap_number == pit_lap else None,
+                    pit_out=starts[k] + 5.0 if lap_number == pit_lap + 1 else None,
+                ))
+        return rows
+
+    def _build_qualifying(self, rng):
+        # Q1: everyone, Q2: top 15, Q3: top 10; each segment is one
+        # out-lap / push lap / in-lap run per driver
+        segment_length = 18 * 60.0
+        pace = {number: 1.0 + rng.uniform(0.0, 0.02) for number in self.drivers}
+        ranking = sorted(self.drivers, key=pace.get)
+        entrants = {1: ranking, 2: ranking[:15], 3: ranking[:10]}
+
+        rows = []
+        car_parts = {number: [] for number in self.drivers}
+        pos_parts = {number: [] for number in self.drivers}
+        best = {number: {} for number in self.drivers}
+        for segment, numbers in entrants.items():
+            segment_start = SESSION_START + (segment - 1) * (segment_length + 8 * 60.0)
+            for number in numbers:
+                code = self._info[number]["Abbreviation"]
+                t_start = segment_start + rng.uniform(60.0, segment_length - 5 * self.track.lap_time)
+                push = pace[number] * (1.0 + rng.normal(0.0, 0.002)) * (1.0 - 0.003 * segment)
+                car, pos, starts, ends = _drive(self.track, rng, t_start, [1.35, push, 1.4])
+                car_parts[number].append(car)
+                pos_parts[number].append(pos)
+                for k in range(3):
+                    rows.append(_lap_row(
+                        number, code, (segment - 1) * 3 + k + 1, starts[k], ends[k], "SOFT",
+                        pit_in=ends[k] - 5.0 if k == 2 else None,
+                        pit_out=starts[k] + 5.0 if k == 0 else None,
+                        segment=segment,
+                    ))
+                best[number][segment] = pd.Timedelta(seconds=ends[1] - starts[1])
+
+        for number in self.drivers:
+            self.car_data[number] = pd.concat(car_parts[number], ignore_index=True)
+            self.pos_data[number] = pd.concat(pos_parts[number], ignore_index=True)
+
+        self.results = pd.DataFrame([
+            {
+                "Abbreviation": self._info[number]["Abbreviation"],
+                "FullName": self._info[number]["FullName"],
+                "Position": float(position),
+                "Q1": best[number].get(1, pd.NaT),
+                "Q2": best[number].get(2, pd.NaT),
+                "Q3": best[number].get(3, pd.NaT),
+            }
+            for position, number in enumerate(ranking, start=1)
+        ])
+        return rows
+
+    def _build_track_status(self, rng, session_end):
+        # Green, a yellow, one safety car period and back to green
+        sc_start = SESSION_START + rng.uniform(0.3, 0.6) * (session_end - SESSION_START)
+        times = [0.0, SESSION_START + 600.0, SESSION_START + 640.0, sc_start, sc_start + 240.0]
+        self.track_status = pd.DataFrame({
+            "Time": pd.to_timedelta(times, unit="s"),
+            "Status": ["1", "2", "1", "4", "1"],
+        })
+
+    def _build_weather(self, session_end):
+        times = np.arange(0.0, session_end + 60.0, 60.0)
+        self.weather_data = pd.DataFrame({
+            "Time": pd.to_timedelta(times, unit="s"),
+            "AirTemp": 24.0 + 2.0 * np.sin(times / 3000.0),
+            "TrackTemp": 38.0 + 4.0 * np.sin(times / 3000.0),
+            "Humidity": np.full(len(times), 55.0),
+            "WindSpeed": 1.5 + np.cos(times / 900.0),
+            "WindDirection": np.full(len(times), 180),
+            "Rainfall": np.zeros(len(times), dtype=bool),
+        })
+
+
+def driver_colors(session):
+    """Stand-in for f1_data.get_driver_colors, which needs FastF1's online driver data."""
+    palette = [(225, 6, 0), (0, 210, 190), (255, 135, 0), (55, 190, 221), (39, 244, 210),
+               (100, 196, 255), (182, 186, 189), (82, 226, 82), (0, 90, 255), (255, 255, 255)]
+    return {
+        session.get_driver(number)["Abbreviation"]: palette[i % len(palette)]
+        for i, number in enumerate(session.drivers)
+    }
@@ -1,4 +1,4 @@
-from src.f1_data import get_race_telemetry, enable_cache, get_circuit_rotation, load_session, get_quali_telemetry, list_rounds, list_sprints
+from src.f1_data import get_race_telemetry, enable_cache, get_circuit_rotation, load_session, get_quali_telemetry, list_rounds, list_sprints, list_cached_telemetry, cache_manager, FPS
 from src.arcade_replay import run_arcade_replay
 
 from src.interfaces.qualifying import run_qualifying_replay
@@ -14,7 +14,7 @@ def run_web_server(host: str = "0.0.0.0", port: int = 8000):
     print("API docs available at http://localhost:8000/docs")
     uvicorn.run("backend.app.main:app", host=host, port=port, reload=True)
 
-def main(year=None, round_number=None, playback_speed=1, session_type='R', visible_hud=True, ready_file=None):
+def main(year=None, round_number=None, playback_speed=1, session_type='R', visible_hud=True, ready_file=None, fps=FPS, caution_fps=None):
   print(f"Loading F1 {year} Round {round_number} Session '{session_type}'")
   session = load_session(year, round_number, session_type)
 
@@ -27,7 +27,7 @@ def main(year=None, round_number=None, playback_speed=1, session_type='R', visib
 
     # Get the drivers who participated and their lap times
 
-    qualifying_session_data = get_quali_telemetry(session, session_type=session_type)
+    qualifying_session_data = get_quali_telemetry(session, session_type=session_type, fps=fps)
 
     # Run the arcade screen showing qualifying results
 
@@ -44,7 +44,7 @@ def main(year=None, round_number=None, playback_speed=1, session_type='R', visib
 
     # Get the drivers who participated in the race
 
-    race_telemetry = get_race_telemetry(session, session_type=session_type)
+    race_telemetry = get_race_telemetry(session, session_type=session_type, fps=fps, caution_fps=caution_fps)
 
     # Get example lap for track layout
     # Qualifying lap preferred for DRS zones (fallback to fastest race lap (no DRS data))
@@ -104,7 +104,8 @@ def main(year=None, round_number=None, playback_speed=1, session_type='R', visib
       circuit_rotation=circuit_rotation,
       visible_hud=visible_hud,
       ready_file=ready_file,
-      session_info=session_info
+      session_info=session_info,
+      race_events=race_telemetry.get('race_events')
     )
 
 if __name__ == "__main__":
@@ -124,6 +125,16 @@ if __name__ == "__main__":
     run_web_server(host=host, port=port)
     sys.exit(0)
 
+  # Disk budget for computed_data/ in GB (least recently used entries are evicted)
+  if "--cache-budget" in sys.argv:
+    idx = sys.argv.index("--cache-budget") + 1
+    if idx < len(sys.argv):
+      cache_manager.budget_bytes = int(float(sys.argv[idx]) * 1e9)
+
+  if "--list-cache" in sys.argv:
+    list_cached_telemetry()
+    sys.exit(0)
+
   # CLI mode
   if "--cli" in sys.argv:
     cli_load()
@@ -152,6 +163,42 @@ if __name__ == "__main__":
 
   playback_speed = 1
 
+  # Timeline frame rate (and optional lower rate under safety car / red flag)
+  fps = FPS
+  if "--fps" in sys.argv:
+    idx = sys.argv.index("--fps") + 1
+    if idx < len(sys.argv):
+      fps = float(sys.argv[idx])
+  caution_fps = None
+  if "--caution-fps" in sys.argv:
+    idx = sys.argv.index("--caution-fps") + 1
+    if idx < len(sys.argv):
+      caution_fps = float(sys.argv[idx])
+
+  # Headless season pre-compute: warm computed_data/ without opening the viewer
+  if "--precompute" in sys.argv:
+    from src.cli.precompute import run_precompute, parse_rounds, parse_sessions, SESSION_TYPES
+
+    rounds = None
+    if "--rounds" in sys.argv:
+      idx = sys.argv.index("--rounds") + 1
+      if idx < len(sys.argv):
+        rounds = parse_rounds(sys.argv[idx])
+    sessions = list(SESSION_TYPES)
+    if "--sessions" in sys.argv:
+      idx = sys.argv.index("--sessions") + 1
+      if idx < len(sys.argv):
+        sessions = parse_sessions(sys.argv[idx])
+    jobs = 1
+    if "--jobs" in sys.argv:
+      idx = sys.argv.index("--jobs") + 1
+      if idx < len(sys.argv):
+        jobs = int(sys.argv[idx])
+
+    result = run_precompute(year, rounds=rounds, sessions=sessions, jobs=jobs, fps=fps,
+                            caution_fps=caution_fps, refresh="--refresh-data" in sys.argv)
+    sys.exit(1 if result["failed"] else 0)
+
   # Direct viewer mode
   if "--viewer" in sys.argv:
 
@@ -169,7 +216,7 @@ if __name__ == "__main__":
       if idx < len(sys.argv):
         ready_file = sys.argv[idx]
 
-    main(year, round_number, playback_speed, session_type=session_type, visible_hud=visible_hud, ready_file=ready_file)
+    main(year, round_number, playback_speed, session_type=session_type, visible_hud=visible_hud, ready_file=ready_file, fps=fps, caution_fps=caution_fps)
     sys.exit(0)
 
   # Default: Run the GUI (PySide6)
@@ -4,7 +4,7 @@ from src.interfaces.race_replay import F1RaceReplayWindow
 
 def run_arcade_replay(frames, track_statuses, example_lap, drivers, title,
                       playback_speed=1.0, driver_colors=None, circuit_rotation=0.0, total_laps=None,
-                      visible_hud=True, ready_file=None, session_info=None):
+                      visible_hud=True, ready_file=None, session_info=None, race_events=None):
     window = F1RaceReplayWindow(
         frames=frames,
         track_statuses=track_statuses,
@@ -17,6 +17,7 @@ def run_arcade_replay(frames, track_statuses, example_lap, drivers, title,
         circuit_rotation=circuit_rotation,
         visible_hud=visible_hud,
         session_info=session_info,
+        race_events=race_events,
     )
     # Signal readiness to parent process (if requested) after window created
     if ready_file:
@@ -0,0 +1,133 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import cpu_count
+
+from src.f1_data import (
+    FPS,
+    cache_manager,
+    enable_cache,
+    get_quali_telemetry,
+    get_race_telemetry,
+    get_race_weekends_by_year,
+    is_session_cached,
+    load_session,
+)
+
+SESSION_TYPES = ("R", "S", "Q", "SQ")
+SPRINT_SESSION_TYPES = ("S", "SQ")
+SPRINT_FORMATS = ("sprint", "sprint_shootout", "sprint_qualifying")
+
+
+def parse_rounds(value):
+    """Parse a round selection such as "1-24", "3" or "1,5,10-12" into a sorted list."""
+    rounds = set()
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            start, end = int(start), int(end)
+            if start > end:
+                raise ValueError(f"Invalid round range '{part}'")
+            rounds.update(range(start, end + 1))
+        else:
+            rounds.add(int(part))
+    return sorted(rounds)
+
+
+def parse_sessions(value):
+    """Parse a session list such as "R,Q" (case-insensitive)."""
+    sessions = [part.strip().upper() for part in value.split(",") if part.strip()]
+    invalid = [session for session in sessions if session not in SESSION_TYPES]
+    if invalid:
+        raise ValueError(f"Unknown session type(s) {invalid}, expected some of {list(SESSION_TYPES)}")
+    return sessions
+
+
+def _precompute_session(args):
+    """Load one session and run its pipeline (top-level so the process pool can pickle it)."""
+    year, round_number, session_type, fps, caution_fps, processes, budget_bytes = args
+    # Spawned workers do not inherit main.py's settings
+    cache_manager.budget_bytes = budget_bytes
+    enable_cache()
+
+    start = time.perf_counter()
+    session = load_session(year, round_number, session_type)
+    if session_type in ("Q", "SQ"):
+        get_quali_telemetry(session, session_type=session_type, fps=fps, processes=processes)
+    else:
+        get_race_telemetry(session, session_type=session_type, fps=fps, caution_fps=caution_fps, processes=processes)
+    return time.perf_counter() - start
+
+
+def run_precompute(year, rounds=None, sessions=SESSION_TYPES, jobs=1, fps=FPS, caution_fps=None, refresh=False):
+    """
+    Warm computed_data/ for a whole season without opening the viewer.
+
+    Sessions are scheduled on a pool of ``jobs`` processes. Sessions that are
+    already cached are skipped, and every finished session is written to the
+    cache straight away, so an interrupted run resumes where it stopped when
+    the same command is run again.
+    """
+    enable_cache()
+    jobs = max(1, int(jobs))
+
+    weekends = get_race_weekends_by_year(year)
+    if rounds is not None:
+        weekends = [weekend for weekend in weekends if int(weekend["round_number"]) in rounds]
+
+    queue = []
+    skipped = 0
+    for weekend in weekends:
+        round_number = int(weekend["round_number"])
+        for session_type in sessions:
+            if session_type in SPRINT_SESSION_TYPES and weekend["type"] not in SPRINT_FORMATS:
+                continue
+            if not refresh and is_session_cached(year, round_number, session_type, fps, caution_fps):
+                skipped += 1
+                continue
+            queue.append((round_number, session_type))
+
+    print(f"Pre-computing {len(queue)} session(s) for {year} with {jobs} job(s) "
+          f"({skipped} already cached)")
+    if not queue:
+        return {"computed": [], "failed": [], "skipped": skipped}
+
+    # Each job runs its own per-driver pool; share the CPUs between jobs
+    processes = max(1, cpu_count() // jobs)
+    computed, failed = [], []
+    started = time.perf_counter()
+
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        futures = {
+            executor.submit(
+                _precompute_session,
+                (year, round_number, session_type, fps, caution_fps, processes, cache_manager.budget_bytes),
+            ): (round_number, session_type)
+            for round_number, session_type in queue
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            round_number, session_type = futures[future]
+            label = f"[{done}/{len(queue)}] {year} Round {round_number} {session_type}"
+            try:
+                elapsed = future.result()
+            except Exception as e:
+                failed.append((round_number, session_type, str(e)))
+                print(f"{label}: failed ({e})")
+                continue
+            computed.append((round_number, session_type, elapsed))
+            print(f"{label}: done in {elapsed:.1f}s")
+    except KeyboardInterrupt:
+        print("Interrupted; finished sessions are cached, run the same command again to resume.")
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+    total = time.perf_counter() - started
+    print(f"Pre-computed {len(computed)} session(s) in {total:.1f}s "
+          f"({len(failed)} failed, {skipped} already cached)")
+    for round_number, session_type, error in failed:
+        print(f"  Round {round_number} {session_type}: {error}")
+    return {"computed": computed, "failed": failed, "skipped": skipped}
@@ -6,11 +6,16 @@ from multiprocessing import Pool, cpu_count
 import numpy as np
 import json
 import pickle
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 
 from src.lib.tyres import get_tyre_compound_int
 from src.lib.time import parse_time_string, format_time
+from src.lib.frames import (
+    DRIVER_CHANNELS, LAP_CHANNELS, LapFrames, RaceFrames, compute_progress, compute_race_events, compute_standings,
+)
+from src.lib.storage import load_race_data, load_quali_data, save_quali_data, load_stage, save_stage
+from src.lib.cache import CacheKey, CacheManager
 
 import pandas as pd
 
@@ -183,113 +188,194 @@ def enable_cache():
     # Enable local cache
     fastf1.Cache.enable_cache('.fastf1-cache')
 
+# Default timeline rate. Pipelines take an ``fps`` argument so the web/API
+# tier can precompute at 5 or 10 Hz while the desktop viewer uses 25 Hz;
+# the rate is part of the cache key and stored with the timeline.
 FPS = 25
 DT = 1 / FPS
 
+# Track statuses during which cars barely move (safety car, red flag); the
+# timeline can optionally be sampled at a lower ``caution_fps`` there
+CAUTION_TRACK_STATUSES = ("4", "5")
+
+# Bump whenever a change in this module alters the computed telemetry, so
+# cached entries from the previous pipeline are no longer picked up
+PIPELINE_VERSION = 4
+
+# Version that entries migrated from the files written before the cache
+# manager are keyed with: they were computed by an older pipeline, so they
+# are reused as they are but never mistaken for current results
+LEGACY_PIPELINE_VERSION = 0
+
+# Shared cache for computed_data/ (main.py sets the disk budget)
+cache_manager = CacheManager()
+
+
+def _load_legacy_cache(event_name, cache_suffix, load):
+    """Entries written before the cache manager: computed_data/{event}_{suffix}_telemetry[.pkl]"""
+    legacy_path = f"computed_data/{event_name}_{cache_suffix}_telemetry"
+    data = load(legacy_path)
+    if data is None and os.path.exists(f"{legacy_path}.pkl"):
+        with open(f"{legacy_path}.pkl", "rb") as f:
+            data = pickle.load(f)
+    return data
+
+def _driver_telemetry_buffers(session, driver_no):
+    """
+    Pull the raw car and position streams for one driver out of the session
+    as plain NumPy arrays (times in session seconds).
+
+    These are what the worker processes receive instead of the Session
+    object, so each worker only unpickles its own driver's data.
+    """
+    try:
+        car = session.car_data[driver_no]
+        pos = session.pos_data[driver_no]
+    except KeyError:
+        return None
+
+    if car.empty or pos.empty:
+        return None
+
+    return {
+        "car_t": car["SessionTime"].dt.total_seconds().to_numpy(),
+        "speed": car["Speed"].to_numpy(dtype=float),
+        "gear": car["nGear"].to_numpy(),
+        "drs": car["DRS"].to_numpy(),
+        "throttle": car["Throttle"].to_numpy(dtype=float),
+        "brake": car["Brake"].to_numpy().astype(float),
+        "pos_t": pos["SessionTime"].dt.total_seconds().to_numpy(),
+        "x": pos["X"].to_numpy(dtype=float),
+        "y": pos["Y"].to_numpy(dtype=float),
+    }
+
+
+def _driver_lap_table(laps_driver):
+    """Per-lap columns (sorted by lap number) needed to slice a driver's telemetry."""
+    laps_driver = laps_driver.sort_values('LapNumber')
+    return {
+        "lap_number": laps_driver["LapNumber"].to_numpy(dtype=float),
+        "start": laps_driver["LapStartTime"].dt.total_seconds().to_numpy(),
+        "end": laps_driver["Time"].dt.total_seconds().to_numpy(),
+        "compound": np.array([get_tyre_compound_int(str(c)) for c in laps_driver["Compound"]], dtype=float),
+        "in_pit": (laps_driver["PitInTime"].notna() | laps_driver["PitOutTime"].notna()).to_numpy(),
+    }
+
+
+def _padded_window(t, start, end):
+    # Index range covering [start, end] plus one sample either side (like FastF1's pad=1)
+    i0 = max(np.searchsorted(t, start, side='left') - 1, 0)
+    i1 = min(np.searchsorted(t, end, side='right') + 1, len(t))
+    return i0, i1
+
+
+def _merge_lap_telemetry(buffers, start, end):
+    """
+    NumPy equivalent of ``Lap.get_telemetry()`` for the channels the replay uses.
+
+    Car and position samples inside the lap are merged onto one time base
+    (continuous channels interpolated, discrete ones forward-filled), the lap
+    edges are interpolated in, and Distance is integrated from Speed starting
+    at zero, as FastF1's add_distance does.
+    """
+    return _merge_laps_telemetry(buffers, np.array([start]), np.array([end]))
+
+
+def _merge_laps_telemetry(buffers, starts, ends):
+    """
+    Merge a driver's car and position streams once for a whole run of laps.
+
+    ``starts``/``ends`` are the lap bounds in session seconds, sorted by lap.
+    Samples are assigned to laps with one searchsorted over the lap starts,
+    and per-lap Distance comes from a single cumulative sum of Speed minus
+    each lap's offset, instead of one merge and integration per lap.
+    The returned dict carries ``lap_index`` (position in ``starts``) per sample.
+    """
+    first, last = starts.min(), ends.max()
+    car_t, pos_t = buffers["car_t"], buffers["pos_t"]
+    c0, c1 = _padded_window(car_t, first, last)
+    p0, p1 = _padded_window(pos_t, first, last)
+    if c1 - c0 < 1 or p1 - p0 < 1:
+        return None
+
+    ct = car_t[c0:c1]
+    pt = pos_t[p0:p1]
+    t = np.union1d(ct, pt)
+    t = np.union1d(t[(t > first) & (t < last)], np.concatenate([starts, ends]))
+
+    # Slice into laps: drop samples that fall between one lap's end and the next start
+    lap_index = np.searchsorted(starts, t, side='right') - 1
+    keep = (lap_index >= 0) & (t <= ends[np.maximum(lap_index, 0)])
+    t = t[keep]
+    lap_index = lap_index[keep]
+    if len(t) == 0:
+        return None
+
+    merged = {
+        "t": t,
+        "lap_index": lap_index,
+        "x": np.interp(t, pt, buffers["x"][p0:p1]),
+        "y": np.interp(t, pt, buffers["y"][p0:p1]),
+        "speed": np.interp(t, ct, buffers["speed"][c0:c1]),
+        "throttle": np.interp(t, ct, buffers["throttle"][c0:c1]),
+    }
+
+    idxs = np.clip(np.searchsorted(ct, t, side='right') - 1, 0, len(ct) - 1)
+    for name in ("gear", "drs", "brake"):
+        merged[name] = buffers[name][c0:c1][idxs]
+
+    # Integrate Speed once; every lap restarts at zero from its own offset
+    lap_first = np.flatnonzero(np.diff(lap_index, prepend=-1))
+    lap_sizes = np.diff(np.append(lap_first, len(t)))
+    cum = np.cumsum(merged["speed"] / 3.6 * np.diff(t, prepend=t[0]))
+    run = np.repeat(np.arange(len(lap_first)), lap_sizes)
+    dist = cum - cum[lap_first][run]
+
+    # Lap length runs up to the lap's end time (that sample opens the next lap)
+    lap_last = lap_first + lap_sizes - 1
+    lap_length = dist[lap_last] + merged["speed"][lap_last] / 3.6 * (ends[lap_index[lap_last]] - t[lap_last])
+    lap_length = lap_length[run]
+    rel_dist = np.zeros_like(dist)
+    np.divide(dist, lap_length, out=rel_dist, where=lap_length > 0)
+
+    merged["dist"] = dist
+    merged["rel_dist"] = rel_dist
+    return merged
+
+
 def _process_single_driver(args):
     """Process telemetry data for a single driver - must be top-level for multiprocessing"""
-    driver_no, session, driver_code = args
+    driver_code, laps, buffers = args
 
     print(f"Getting telemetry for driver: {driver_code}")
 
-    laps_driver = session.laps.pick_drivers(driver_no)
-    if laps_driver.empty:
+    if len(laps["lap_number"]) == 0:
         return None
 
-    driver_max_lap = laps_driver.LapNumber.max() if not laps_driver.empty else 0
-
-    t_all = []
-    x_all = []
-    y_all = []
-    race_dist_all = []
-    rel_dist_all = []
-    lap_numbers = []
-    tyre_compounds = []
-    speed_all = []
-    gear_all = []
-    drs_all = []
-    throttle_all = []
-    brake_all = []
-    tyre_age_all = []  # Track tyre age (laps on current set)
-    in_pit_all = []    # Track if driver is in pit lane
-
-    total_dist_so_far = 0.0
-
-    # Track stint information for tyre age calculation
-    current_compound = None
-    stint_start_lap = 1
-
-    # iterate laps in order
-    for _, lap in laps_driver.sort_values('LapNumber').iterlaps():
-        # get telemetry for THIS lap only
-        lap_tel = lap.get_telemetry()
-        lap_number = lap.LapNumber
-        tyre_compound_as_int = get_tyre_compound_int(lap.Compound)
-
-        if lap_tel.empty:
-            continue
+    driver_max_lap = laps["lap_number"].max()
 
-        # Calculate tyre age
-        if current_compound is None or current_compound != tyre_compound_as_int:
-            current_compound = tyre_compound_as_int
-            stint_start_lap = lap_number
-
-        tyre_age = int(lap_number - stint_start_lap + 1)
-
-        # Check if driver is in pit lane this lap
-        is_pit_lap = pd.notna(lap.get('PitInTime')) or pd.notna(lap.get('PitOutTime'))
-
-        t_lap = lap_tel["SessionTime"].dt.total_seconds().to_numpy()
-        x_lap = lap_tel["X"].to_numpy()
-        y_lap = lap_tel["Y"].to_numpy()
-        d_lap = lap_tel["Distance"].to_numpy()
-        rd_lap = lap_tel["RelativeDistance"].to_numpy()
-        speed_kph_lap = lap_tel["Speed"].to_numpy()
-        gear_lap = lap_tel["nGear"].to_numpy()
-        drs_lap = lap_tel["DRS"].to_numpy()
-        throttle_lap = lap_tel["Throttle"].to_numpy()
-        brake_lap = lap_tel["Brake"].to_numpy().astype(float)
-
-        # race distance = distance before this lap + distance within this lap
-        race_d_lap = total_dist_so_far + d_lap
-
-        t_all.append(t_lap)
-        x_all.append(x_lap)
-        y_all.append(y_lap)
-        race_dist_all.append(race_d_lap)
-        rel_dist_all.append(rd_lap)
-        lap_numbers.append(np.full_like(t_lap, lap_number))
-        tyre_compounds.append(np.full_like(t_lap, tyre_compound_as_int))
-        speed_all.append(speed_kph_lap)
-        gear_all.append(gear_lap)
-        drs_all.append(drs_lap)
-        throttle_all.append(throttle_lap)
-        brake_all.append(brake_lap)
-        tyre_age_all.append(np.full_like(t_lap, tyre_age))
-        in_pit_all.append(np.full_like(t_lap, 1.0 if is_pit_lap else 0.0))
-
-    if not t_all:
+    # Laps without timing bounds have no telemetry to slice
+    valid = ~(np.isnan(laps["start"]) | np.isnan(laps["end"]))
+    if not valid.any():
         return None
+    laps = {name: column[valid] for name, column in laps.items()}
 
-    # Concatenate all arrays at once for better performance
-    all_arrays = [t_all, x_all, y_all, race_dist_all, rel_dist_all,
-                  lap_numbers, tyre_compounds, speed_all, gear_all, drs_all,
-                  tyre_age_all, in_pit_all]
-
-    t_all, x_all, y_all, race_dist_all, rel_dist_all, lap_numbers, \
-    tyre_compounds, speed_all, gear_all, drs_all, tyre_age_all, in_pit_all = [np.concatenate(arr) for arr in all_arrays]
+    # Merge car + position data once for the whole race, then split into laps
+    merged = _merge_laps_telemetry(buffers, laps["start"], laps["end"])
+    if merged is None:
+        return None
 
-    # Sort all arrays by time in one operation
-    order = np.argsort(t_all)
-    all_data = [t_all, x_all, y_all, race_dist_all, rel_dist_all,
-                lap_numbers, tyre_compounds, speed_all, gear_all, drs_all,
-                tyre_age_all, in_pit_all]
+    lap_number = laps["lap_number"]
+    compound = laps["compound"]
 
-    t_all, x_all, y_all, race_dist_all, rel_dist_all, lap_numbers, \
-    tyre_compounds, speed_all, gear_all, drs_all, tyre_age_all, in_pit_all = [arr[order] for arr in all_data]
+    # Tyre age = laps since the compound last changed (laps on current set)
+    new_stint = np.ones(len(compound), dtype=bool)
+    new_stint[1:] = compound[1:] != compound[:-1]
+    stint_start_lap = lap_number[new_stint][np.cumsum(new_stint) - 1]
+    tyre_age = lap_number - stint_start_lap + 1
 
-    throttle_all = np.concatenate(throttle_all)[order]
-    brake_all = np.concatenate(brake_all)[order]
+    k = merged["lap_index"]
+    t_all = merged["t"]
 
     print(f"Completed telemetry for driver: {driver_code}")
 
@@ -297,19 +383,19 @@ def _process_single_driver(args):
         "code": driver_code,
         "data": {
             "t": t_all,
-            "x": x_all,
-            "y": y_all,
-            "dist": race_dist_all,
-            "rel_dist": rel_dist_all,
-            "lap": lap_numbers,
-            "tyre": tyre_compounds,
-            "speed": speed_all,
-            "gear": gear_all,
-            "drs": drs_all,
-            "throttle": throttle_all,
-            "brake": brake_all,
-            "tyre_age": tyre_age_all,
-            "in_pit": in_pit_all,
+            "x": merged["x"],
+            "y": merged["y"],
+            "dist": merged["dist"],
+            "rel_dist": merged["rel_dist"],
+            "lap": lap_number[k],
+            "tyre": compound[k],
+            "speed": merged["speed"],
+            "gear": merged["gear"],
+            "drs": merged["drs"],
+            "throttle": merged["throttle"],
+            "brake": merged["brake"],
+            "tyre_age": tyre_age[k],
+            "in_pit": laps["in_pit"][k].astype(float),
         },
         "t_min": t_all.min(),
         "t_max": t_all.max(),
@@ -339,24 +425,74 @@ def get_circuit_rotation(session):
     circuit = session.get_circuit_info()
     return circuit.rotation
 
-def get_race_telemetry(session, session_type='R'):
+# The race pipeline is split into named stages, each cached on its own.
+# A stage's cache key includes its version and the keys of the stages it
+# depends on, so bumping one stage's version (e.g. after changing the gap
+# maths) recomputes that stage and everything downstream of it while the
+# earlier stages are loaded from computed_data/.
+# Stages marked "rate" depend on the timeline frame rate; the others are
+# keyed with fps=0 and shared by every rate the event is computed at.
+RACE_STAGES = {
+    "driver_telemetry": {"version": 1, "depends": (), "rate": False},
+    "timeline": {"version": 2, "depends": ("driver_telemetry",), "rate": True},
+    "standings": {"version": 1, "depends": ("timeline",), "rate": True},
+    "progress": {"version": 1, "depends": ("timeline", "standings"), "rate": True},
+    "weather": {"version": 1, "depends": ("timeline",), "rate": True},
+    "track_status": {"version": 1, "depends": ("timeline",), "rate": True},
+    "race_metadata": {"version": 1, "depends": (), "rate": False},
+    "events": {"version": 1, "depends": ("timeline", "standings", "progress", "race_metadata"), "rate": True},
+}
+
+# Channels resampled onto the timeline; the standings stage adds the rest of DRIVER_CHANNELS
+TIMELINE_CHANNELS = ("x", "y", "dist", "rel_dist", "lap", "tyre", "speed", "gear",
+                     "drs", "throttle", "brake", "tyre_age", "in_pit")
+
+
+def _race_stage_keys(year, round_number, session_type, fps=FPS, caution_fps=None, pipeline_version=PIPELINE_VERSION):
+    """Cache keys for every race stage (computable without running any of them)."""
+    keys = {}
+    for name, stage in RACE_STAGES.items():
+        params = {
+            "stage_version": stage["version"],
+            "upstream": {dep: keys[dep].digest for dep in stage["depends"]},
+        }
+        if name == "timeline" and caution_fps:
+            params["caution_fps"] = float(caution_fps)
+        keys[name] = CacheKey(
+            year, round_number, session_type, f"race.{name}", pipeline_version,
+            fps if stage["rate"] else 0, params=params,
+        )
+    return keys
 
-    event_name = str(session).replace(' ', '_')
-    cache_suffix = 'sprint' if session_type == 'S' else 'race'
 
-    # Check if this data has already been computed
+def _quali_cache_key(year, round_number, session_type, fps=FPS, pipeline_version=PIPELINE_VERSION):
+    return CacheKey(year, round_number, session_type, "quali", pipeline_version, fps)
 
-    try:
-        if "--refresh-data" not in sys.argv:
-            with open(f"computed_data/{event_name}_{cache_suffix}_telemetry.pkl", "rb") as f:
-                frames = pickle.load(f)
-                print(f"Loaded precomputed {cache_suffix} telemetry data.")
-                print("The replay should begin in a new window shortly!")
-                return frames
-    except FileNotFoundError:
-        pass  # Need to compute from scratch
 
+def is_session_cached(year, round_number, session_type='R', fps=FPS, caution_fps=None):
+    """True if the replay data for a session is in computed_data/ (no FastF1 load needed)."""
+    if session_type in ('Q', 'SQ'):
+        return cache_manager.contains(_quali_cache_key(year, round_number, session_type, fps))
+    if caution_fps is not None and caution_fps >= fps:
+        caution_fps = None
+    keys = _race_stage_keys(year, round_number, session_type, fps, caution_fps)
+    return all(cache_manager.contains(keys[name]) for name in RACE_STAGES if name != "driver_telemetry")
+
+
+def _run_stage(name, key, compute, refresh=False):
+    if not refresh:
+        result = cache_manager.get(key, load_stage)
+        if result is not None:
+            return result
+
+    print(f"Computing stage '{name}'...")
+    result = compute()
+    cache_manager.put(key, result, save_stage)
+    return result
 
+
+def _stage_driver_telemetry(session, processes=None):
+    """Stage 1: per-driver telemetry arrays at their native sample rate."""
     drivers = session.drivers
 
     driver_codes = {
@@ -364,95 +500,142 @@ def get_race_telemetry(session, session_type='R'):
         for num in drivers
     }
 
-    driver_data = {}
-
-    global_t_min = None
-    global_t_max = None
-    
-    max_lap_number = 0
-
-    # 1. Get all of the drivers telemetry data using multiprocessing
+    # Get all of the drivers telemetry data using multiprocessing
     # Prepare arguments for parallel processing
     print(f"Processing {len(drivers)} drivers in parallel...")
-    driver_args = [(driver_no, session, driver_codes[driver_no]) for driver_no in drivers]
-    
-    num_processes = min(cpu_count(), len(drivers))
-    
+    # Workers only receive each driver's lap table and raw telemetry arrays,
+    # never the Session itself (pickling it once per worker dominated start-up)
+    driver_args = []
+    for driver_no in drivers:
+        buffers = _driver_telemetry_buffers(session, driver_no)
+        laps_driver = session.laps.pick_drivers(driver_no)
+        if buffers is None or laps_driver.empty:
+            continue
+        driver_args.append((driver_codes[driver_no], _driver_lap_table(laps_driver), buffers))
+
+    num_processes = max(1, min(processes or cpu_count(), len(driver_args)))
+
     with Pool(processes=num_processes) as pool:
         results = pool.map(_process_single_driver, driver_args)
-    
-    # Process results
+
+    arrays = {}
+    max_laps = {}
     for result in results:
         if result is None:
             continue
-        
         code = result["code"]
-        driver_data[code] = result["data"]
-        
-        t_min = result["t_min"]
-        t_max = result["t_max"]
-        max_lap_number = max(max_lap_number, result["max_lap"])
-        
-        global_t_min = t_min if global_t_min is None else min(global_t_min, t_min)
-        global_t_max = t_max if global_t_max is None else max(global_t_max, t_max)
+        for name, values in result["data"].items():
+            arrays[f"{code}.{name}"] = values
+        max_laps[code] = result["max_lap"]
 
     # Ensure we have valid time bounds
-    if global_t_min is None or global_t_max is None:
+    if not max_laps:
         raise ValueError("No valid telemetry data found for any driver")
 
-    # 2. Create a timeline (start from zero)
-    timeline = np.arange(global_t_min, global_t_max, DT) - global_t_min
+    return {"arrays": arrays, "metadata": {"codes": list(max_laps), "max_laps": max_laps}}
 
-    # 3. Resample each driver's telemetry (x, y, gap) onto the common timeline
-    resampled_data = {}
 
-    for code, data in driver_data.items():
-        t = data["t"] - global_t_min  # Shift
+def _caution_periods(session):
+    """(start, end) session times of every safety car / red flag period."""
+    track_status = session.track_status
+    times = track_status["Time"].dt.total_seconds().to_numpy()
+    statuses = [str(status) for status in track_status["Status"]]
+
+    periods = []
+    for i, status in enumerate(statuses):
+        if status not in CAUTION_TRACK_STATUSES:
+            continue
+        end = times[i + 1] if i + 1 < len(times) else np.inf
+        if periods and periods[-1][1] >= times[i]:
+            periods[-1] = (periods[-1][0], end)  # SC straight into a red flag
+        else:
+            periods.append((times[i], end))
+    return periods
+
+
+def _build_timeline(t_min, t_max, fps, caution_fps=None, caution_periods=()):
+    """
+    Frame times from t_min to t_max at ``fps``, dropping to ``caution_fps``
+    inside the caution periods. With no caution rate this is a plain arange.
+    """
+    if not caution_fps or not caution_periods:
+        return np.arange(t_min, t_max, 1 / fps)
+
+    pieces = []
+    cursor = t_min
+    for start, end in caution_periods:
+        start, end = max(start, cursor), min(end, t_max)
+        if end <= start:
+            continue
+        pieces.append(np.arange(cursor, start, 1 / fps))
+        pieces.append(np.arange(start, end, 1 / caution_fps))
+        cursor = end
+    pieces.append(np.arange(cursor, t_max, 1 / fps))
+    return np.concatenate(pieces)
+
+
+def _stage_timeline(driver_stage, fps=FPS, caution_fps=None, caution_periods=()):
+    """Stage 2: resample every driver onto one common timeline (start from zero)."""
+    codes = driver_stage["metadata"]["codes"]
+    raw = driver_stage["arrays"]
+
+    global_t_min = min(float(raw[f"{code}.t"].min()) for code in codes)
+    global_t_max = max(float(raw[f"{code}.t"].max()) for code in codes)
+    timeline = _build_timeline(global_t_min, global_t_max, fps, caution_fps, caution_periods) - global_t_min
+
+    num_frames = len(timeline)
+    channels = {
+        name: np.empty((num_frames, len(codes)), dtype=DRIVER_CHANNELS[name])
+        for name in TIMELINE_CHANNELS
+    }
+
+    for j, code in enumerate(codes):
+        t = raw[f"{code}.t"] - global_t_min  # Shift
 
         # ensure sorted by time
         order = np.argsort(t)
         t_sorted = t[order]
 
-        # Vectorize all resampling in one operation for speed
-        arrays_to_resample = [
-            data["x"][order],
-            data["y"][order],
-            data["dist"][order],
-            data["rel_dist"][order],
-            data["lap"][order],
-            data["tyre"][order],
-            data["speed"][order],
-            data["gear"][order],
-            data["drs"][order],
-            data["throttle"][order],
-            data["brake"][order],
-            data["tyre_age"][order],
-            data["in_pit"][order],
-        ]
-
-        resampled = [np.interp(timeline, t_sorted, arr) for arr in arrays_to_resample]
-        x_resampled, y_resampled, dist_resampled, rel_dist_resampled, lap_resampled, \
-        tyre_resampled, speed_resampled, gear_resampled, drs_resampled, throttle_resampled, \
-        brake_resampled, tyre_age_resampled, in_pit_resampled = resampled
-
-        resampled_data[code] = {
-            "t": timeline,
-            "x": x_resampled,
-            "y": y_resampled,
-            "dist": dist_resampled,   # race distance (metres since Lap 1 start)
-            "rel_dist": rel_dist_resampled,
-            "lap": lap_resampled,
-            "tyre": tyre_resampled,
-            "speed": speed_resampled,
-            "gear": gear_resampled,
-            "drs": drs_resampled,
-            "throttle": throttle_resampled,
-            "brake": brake_resampled,
-            "tyre_age": tyre_age_resampled,
-            "in_pit": in_pit_resampled,
-        }
+        for name in TIMELINE_CHANNELS:
+            resampled = np.interp(timeline, t_sorted, raw[f"{code}.{name}"][order])
+            if name in ("lap", "tyre_age"):
+                resampled = np.round(resampled)
+            elif name == "in_pit":
+                resampled = resampled > 0.5
+            channels[name][:, j] = resampled
+
+    max_lap_number = max(driver_stage["metadata"]["max_laps"].values())
+
+    return {
+        "arrays": {"t": timeline, **channels},
+        "metadata": {
+            "codes": codes,
+            "global_t_min": global_t_min,
+            "total_laps": int(max_lap_number),
+            "fps": fps,
+            "caution_fps": caution_fps,
+        },
+    }
+
+
+def _stage_standings(timeline_stage):
+    """Stage 3: positions (sorted by lap, then race distance) and gaps for every frame."""
+    arrays = timeline_stage["arrays"]
+    standings = compute_standings(arrays["lap"], arrays["dist"], arrays["speed"])
+    return {"arrays": standings, "metadata": {}}
+
 
-    # 4. Incorporate track status data into the timeline (for safety car, VSC, etc.)
+def _stage_progress(timeline_stage, standings_stage):
+    """Stage 4: along-track progress and leaderboard order for every frame."""
+    arrays = timeline_stage["arrays"]
+    progress = compute_progress(arrays["t"], arrays["x"], arrays["y"], arrays["lap"], arrays["in_pit"],
+                                arrays["dist"], standings_stage["arrays"]["position"])
+    return {"arrays": progress, "metadata": {}}
+
+
+def _stage_track_status(session, timeline_stage):
+    """Stage 5: track status periods (safety car, VSC, ...) in timeline seconds."""
+    global_t_min = timeline_stage["metadata"]["global_t_min"]
 
     track_status = session.track_status
 
@@ -475,8 +658,15 @@ def get_race_telemetry(session, session_type='R'):
             'end_time': end_time, 
         })
 
-    # 4.1. Resample weather data onto the same timeline for playback
-    weather_resampled = None
+    return {"arrays": {}, "metadata": {"track_statuses": formatted_track_statuses}}
+
+
+def _stage_weather(session, timeline_stage):
+    """Stage 6: weather resampled onto the same timeline for playback."""
+    global_t_min = timeline_stage["metadata"]["global_t_min"]
+    timeline = timeline_stage["arrays"]["t"]
+
+    weather = {}
     weather_df = getattr(session, "weather_data", None)
     if weather_df is not None and not weather_df.empty:
         try:
@@ -485,187 +675,202 @@ def get_race_telemetry(session, session_type='R'):
                 order = np.argsort(weather_times)
                 weather_times = weather_times[order]
 
-                def _maybe_get(name):
-                    return weather_df[name].to_numpy()[order] if name in weather_df else None
-
-                def _resample(series):
-                    if series is None:
-                        return None
-                    return np.interp(timeline, weather_times, series)
-
-                track_temp = _resample(_maybe_get("TrackTemp"))
-                air_temp = _resample(_maybe_get("AirTemp"))
-                humidity = _resample(_maybe_get("Humidity"))
-                wind_speed = _resample(_maybe_get("WindSpeed"))
-                wind_direction = _resample(_maybe_get("WindDirection"))
-                rainfall_raw = _maybe_get("Rainfall")
-                rainfall = _resample(rainfall_raw.astype(float)) if rainfall_raw is not None else None
-
-                weather_resampled = {
-                    "track_temp": track_temp,
-                    "air_temp": air_temp,
-                    "humidity": humidity,
-                    "wind_speed": wind_speed,
-                    "wind_direction": wind_direction,
-                    "rainfall": rainfall,
+                columns = {
+                    "track_temp": "TrackTemp",
+                    "air_temp": "AirTemp",
+                    "humidity": "Humidity",
+                    "wind_speed": "WindSpeed",
+                    "wind_direction": "WindDirection",
+                    "rainfall": "Rainfall",
                 }
+                for name, column in columns.items():
+                    if column in weather_df:
+                        series = weather_df[column].to_numpy().astype(float)[order]
+                        weather[name] = np.interp(timeline, weather_times, series).astype(np.float32)
         except Exception as e:
             print(f"Weather data could not be processed: {e}")
+            weather = {}
 
-    # 5. Build the frames + LIVE LEADERBOARD
-    frames = []
-    num_frames = len(timeline)
-
-    # Pre-extract data references for faster access
-    driver_codes_list = list(resampled_data.keys())
-    driver_arrays = {code: resampled_data[code] for code in driver_codes_list}
-
-    # Calculate average speed for gap estimation (approximate, used for time-based gaps)
-    # We'll use ~200 km/h as an average F1 race speed for gap calculations
-    AVG_SPEED_MS = 200 * 1000 / 3600  # ~55.5 m/s
-
-    for i in range(num_frames):
-        t = timeline[i]
-        snapshot = []
-        for code in driver_codes_list:
-            d = driver_arrays[code]
-            snapshot.append({
-                "code": code,
-                "dist": float(d["dist"][i]),
-                "x": float(d["x"][i]),
-                "y": float(d["y"][i]),
-                "lap": int(round(d["lap"][i])),
-                "rel_dist": float(d["rel_dist"][i]),
-                "tyre": float(d["tyre"][i]),
-                "speed": float(d['speed'][i]),
-                "gear": int(d['gear'][i]),
-                "drs": int(d['drs'][i]),
-                "throttle": float(d['throttle'][i]),
-                "brake": float(d['brake'][i]),
-                "tyre_age": int(round(d['tyre_age'][i])),
-                "in_pit": float(d['in_pit'][i]) > 0.5,
-            })
-
-        # If for some reason we have no drivers at this instant
-        if not snapshot:
-            continue
-
-        # 5b. Sort by race distance to get POSITIONS (1–20)
-        # Leader = largest race distance covered
-        snapshot.sort(key=lambda r: (r.get("lap", 0), r["dist"]), reverse=True)
-
-        leader = snapshot[0]
-        leader_lap = leader["lap"]
-        leader_dist = leader["dist"]
-
-        # 5c. Compute gaps (to leader and to car ahead)
-        frame_data = {}
-
-        for idx, car in enumerate(snapshot):
-            code = car["code"]
-            position = idx + 1
-
-            # Calculate gap to leader (in seconds and meters)
-            dist_to_leader = leader_dist - car["dist"]
-
-            # Use actual speed for more accurate gap calculation (if speed > 0)
-            car_speed_ms = car["speed"] * 1000 / 3600 if car["speed"] > 10 else AVG_SPEED_MS
-            gap_to_leader_sec = dist_to_leader / car_speed_ms if car_speed_ms > 0 else 0
-
-            # Calculate interval to car ahead
-            if position == 1:
-                interval_sec = None
-                interval_dist = None
-            else:
-                car_ahead = snapshot[idx - 1]
-                dist_to_ahead = car_ahead["dist"] - car["dist"]
-                interval_dist = dist_to_ahead
-                interval_sec = dist_to_ahead / car_speed_ms if car_speed_ms > 0 else 0
-
-            # Handle lapped cars - add lap indicator
-            laps_behind = leader_lap - car["lap"]
-
-            frame_data[code] = {
-                "x": car["x"],
-                "y": car["y"],
-                "dist": car["dist"],
-                "lap": car["lap"],
-                "rel_dist": round(car["rel_dist"], 4),
-                "tyre": car["tyre"],
-                "position": position,
-                "speed": car['speed'],
-                "gear": car['gear'],
-                "drs": car['drs'],
-                "throttle": car['throttle'],
-                "brake": car['brake'],
-                "tyre_age": car['tyre_age'],
-                "in_pit": car['in_pit'],
-                # Gap data
-                "gap_to_leader": round(gap_to_leader_sec, 3) if position > 1 else None,
-                "gap_to_leader_dist": round(dist_to_leader, 1) if position > 1 else None,
-                "interval": round(interval_sec, 3) if interval_sec is not None else None,
-                "interval_dist": round(interval_dist, 1) if interval_dist is not None else None,
-                "laps_behind": laps_behind if laps_behind > 0 else None,
-            }
-
-        weather_snapshot = {}
-        if weather_resampled:
-            try:
-                wt = weather_resampled
-                rain_val = wt["rainfall"][i] if wt.get("rainfall") is not None else 0.0
-                weather_snapshot = {
-                    "track_temp": float(wt["track_temp"][i]) if wt.get("track_temp") is not None else None,
-                    "air_temp": float(wt["air_temp"][i]) if wt.get("air_temp") is not None else None,
-                    "humidity": float(wt["humidity"][i]) if wt.get("humidity") is not None else None,
-                    "wind_speed": float(wt["wind_speed"][i]) if wt.get("wind_speed") is not None else None,
-                    "wind_direction": float(wt["wind_direction"][i]) if wt.get("wind_direction") is not None else None,
-                    "rain_state": "RAINING" if rain_val and rain_val >= 0.5 else "DRY",
-                }
-            except Exception as e:
-                print(f"Failed to attach weather data to frame {i}: {e}")
+    return {"arrays": weather, "metadata": {}}
 
-        frame_payload = {
-            "t": round(t, 3),
-            "lap": leader_lap,   # leader's lap at this time
-            "drivers": frame_data,
-        }
-        if weather_snapshot:
-            frame_payload["weather"] = weather_snapshot
 
-        frames.append(frame_payload)
-    print("Completed telemetry frame extraction...")
+def _stage_race_metadata(session):
+    """Stage 7: per-lap data that does not depend on the telemetry (pit stops, lap times, ...)."""
     print("Extracting additional race data (pit stops, lap times, sectors, stints)...")
+    return {
+        "arrays": {},
+        "metadata": {
+            "driver_colors": get_driver_colors(session),
+            "pit_stops": extract_pit_stops(session),
+            "lap_times": extract_lap_times(session),
+            "sector_times": extract_sector_times(session),
+            "tyre_stints": calculate_tyre_stints(session),
+        },
+    }
 
-    # Extract additional race metadata
-    pit_stops = extract_pit_stops(session)
-    lap_times = extract_lap_times(session)
-    sector_times = extract_sector_times(session)
-    tyre_stints = calculate_tyre_stints(session)
-
-    print("Saving to cache file...")
-    # If computed_data/ directory doesn't exist, create it
-    if not os.path.exists("computed_data"):
-        os.makedirs("computed_data")
 
-    result_data = {
+def _stage_events(timeline_stage, standings_stage, progress_stage, metadata_stage):
+    """Stage 8: race events for the progress bar (retirements, leader changes, overtakes, ...)."""
+    arrays = timeline_stage["arrays"]
+    # Lap numbers are JSON object keys (strings) once the metadata has been cached
+    lap_times = {code: {int(lap): t for lap, t in laps.items()}
+                 for code, laps in metadata_stage["metadata"].get("lap_times", {}).items()}
+    events = compute_race_events(arrays["t"], arrays["lap"], arrays["dist"], arrays["in_pit"],
+                                 standings_stage["arrays"]["position"], progress_stage["arrays"]["order"],
+                                 timeline_stage["metadata"]["codes"], timeline_stage["metadata"]["total_laps"],
+                                 lap_times)
+    return {"arrays": {}, "metadata": {"events": events}}
+
+
+def _assemble_race_data(stages):
+    timeline = stages["timeline"]
+    standings = dict(stages["standings"]["arrays"])
+    leader_lap = standings.pop("leader_lap")
+
+    channels = {name: timeline["arrays"][name] for name in TIMELINE_CHANNELS}
+    channels.update(standings)
+    channels["progress"] = stages["progress"]["arrays"]["progress"]
+
+    frames = RaceFrames(
+        t=timeline["arrays"]["t"],
+        codes=timeline["metadata"]["codes"],
+        channels=channels,
+        leader_lap=leader_lap,
+        weather=dict(stages["weather"]["arrays"]),
+        fps=timeline["metadata"].get("fps"),
+        order=stages["progress"]["arrays"]["order"],
+    )
+
+    metadata = stages["race_metadata"]["metadata"]
+    return {
         "frames": frames,
-        "driver_colors": get_driver_colors(session),
-        "track_statuses": formatted_track_statuses,
-        "total_laps": int(max_lap_number),
+        "fps": frames.fps,
+        "driver_colors": {code: tuple(rgb) for code, rgb in metadata["driver_colors"].items()},
+        "track_statuses": stages["track_status"]["metadata"]["track_statuses"],
+        "race_events": stages["events"]["metadata"]["events"],
+        "total_laps": timeline["metadata"]["total_laps"],
         # New metadata
-        "pit_stops": pit_stops,
-        "lap_times": lap_times,
-        "sector_times": sector_times,
-        "tyre_stints": tyre_stints,
+        "pit_stops": metadata["pit_stops"],
+        # JSON object keys are strings; lap numbers are ints everywhere else
+        "lap_times": {code: {int(lap): t for lap, t in laps.items()} for code, laps in metadata["lap_times"].items()},
+        "sector_times": {code: {int(lap): s for lap, s in laps.items()} for code, laps in metadata["sector_times"].items()},
+        "tyre_stints": metadata["tyre_stints"],
     }
 
-    # Save using pickle (10-100x faster than JSON)
-    with open(f"computed_data/{event_name}_{cache_suffix}_telemetry.pkl", "wb") as f:
-        pickle.dump(result_data, f, protocol=pickle.HIGHEST_PROTOCOL)
 
+def _migrate_legacy_race_data(data, keys):
+    """
+    Split a result written before the staged pipeline into stage cache entries.
+
+    The migrated stages are only ever used together, as one complete set: the
+    timeline lacks the session start offset, so no stage is recomputed from it.
+    """
+    frames = data["frames"]
+    if isinstance(frames, list):
+        # Older caches hold a list of frame dicts; convert them to columns
+        frames = RaceFrames.from_frame_dicts(frames)
+
+    stages = {
+        "timeline": {
+            "arrays": {"t": frames.t, **{name: frames.channels[name] for name in TIMELINE_CHANNELS}},
+            # The original session start offset was not stored (see above)
+            "metadata": {"codes": frames.codes, "global_t_min": None, "total_laps": int(data["total_laps"]),
+                         "fps": FPS, "caution_fps": None},
+        },
+        "standings": {
+            "arrays": {
+                **{name: frames.channels[name] for name in DRIVER_CHANNELS if name not in TIMELINE_CHANNELS},
+                "leader_lap": frames.leader_lap,
+            },
+            "metadata": {},
+        },
+        "weather": {"arrays": dict(frames.weather or {}), "metadata": {}},
+        "track_status": {"arrays": {}, "metadata": {"track_statuses": data["track_statuses"]}},
+        "race_metadata": {
+            "arrays": {},
+            "metadata": {name: data.get(name, {}) for name in ("driver_colors", "pit_stops", "lap_times", "sector_times", "tyre_stints")},
+        },
+    }
+    # Older caches predate the progress and events stages; they only need the columns above
+    stages["progress"] = _stage_progress(stages["timeline"], stages["standings"])
+    stages["events"] = _stage_events(stages["timeline"], stages["standings"], stages["progress"],
+                                     stages["race_metadata"])
+    for name, stage in stages.items():
+        cache_manager.put(keys[name], stage, save_stage)
+    return stages
+
+
+def get_race_telemetry(session, session_type='R', fps=FPS, caution_fps=None, processes=None):
+    """
+    Build (or load) the race replay timeline at ``fps`` frames per second.
+    With ``caution_fps`` set, safety car and red flag periods are sampled at
+    that lower rate instead. ``processes`` caps the worker pool (default: one
+    per CPU).
+    """
+    if fps <= 0 or (caution_fps is not None and caution_fps <= 0):
+        raise ValueError("fps and caution_fps must be positive")
+    if caution_fps is not None and caution_fps >= fps:
+        caution_fps = None  # nothing to save
+
+    event_name = str(session).replace(' ', '_')
+    cache_suffix = 'sprint' if session_type == 'S' else 'race'
+
+    refresh = "--refresh-data" in sys.argv
+    year, round_number = session.event["EventDate"].year, session.event["RoundNumber"]
+    keys = _race_stage_keys(year, round_number, session_type, fps, caution_fps)
+
+    # Check if this data has already been computed
+    if not refresh:
+        stages = {name: cache_manager.get(keys[name], load_stage) for name in RACE_STAGES if name != "driver_telemetry"}
+        # Legacy caches were always computed at the default rate. They stand in
+        # for the whole pipeline only when none of its stages is cached; a
+        # partly cached pipeline recomputes just its missing stages below
+        if all(stage is None for stage in stages.values()) and fps == FPS and not caution_fps:
+            legacy_keys = _race_stage_keys(year, round_number, session_type, fps,
+                                           pipeline_version=LEGACY_PIPELINE_VERSION)
+            legacy_stages = {name: cache_manager.get(legacy_keys[name], load_stage)
+                             for name in RACE_STAGES if name != "driver_telemetry"}
+            if any(stage is None for stage in legacy_stages.values()):
+                legacy = _load_legacy_cache(event_name, cache_suffix, load_race_data)
+                if legacy is not None:
+                    # Migrate entries written by older versions into the managed cache
+                    legacy_stages = _migrate_legacy_race_data(legacy, legacy_keys)
+            if all(stage is not None for stage in legacy_stages.values()):
+                stages = legacy_stages
+        if all(stage is not None for stage in stages.values()):
+            print(f"Loaded precomputed {cache_suffix} telemetry data.")
+            print("The replay should begin in a new window shortly!")
+            return _assemble_race_data(stages)
+
+    # Run only the stages whose cache entry is missing; the driver telemetry
+    # stage is only needed (and loaded) when the timeline has to be rebuilt
+    stages = {}
+
+    def _timeline():
+        driver_stage = _run_stage("driver_telemetry", keys["driver_telemetry"],
+                                  lambda: _stage_driver_telemetry(session, processes), refresh)
+        caution_periods = _caution_periods(session) if caution_fps else ()
+        return _stage_timeline(driver_stage, fps, caution_fps, caution_periods)
+
+    stages["timeline"] = _run_stage("timeline", keys["timeline"], _timeline, refresh)
+    stages["standings"] = _run_stage("standings", keys["standings"],
+                                     lambda: _stage_standings(stages["timeline"]), refresh)
+    stages["progress"] = _run_stage("progress", keys["progress"],
+                                    lambda: _stage_progress(stages["timeline"], stages["standings"]), refresh)
+    stages["track_status"] = _run_stage("track_status", keys["track_status"],
+                                        lambda: _stage_track_status(session, stages["timeline"]), refresh)
+    stages["weather"] = _run_stage("weather", keys["weather"],
+                                   lambda: _stage_weather(session, stages["timeline"]), refresh)
+    stages["race_metadata"] = _run_stage("race_metadata", keys["race_metadata"],
+                                         lambda: _stage_race_metadata(session), refresh)
+    stages["events"] = _run_stage("events", keys["events"],
+                                  lambda: _stage_events(stages["timeline"], stages["standings"],
+                                                        stages["progress"], stages["race_metadata"]), refresh)
+
+    print("Completed telemetry frame extraction...")
     print("Saved Successfully!")
     print("The replay should begin in a new window shortly")
-    return result_data
+    return _assemble_race_data(stages)
 
 
 def get_qualifying_results(session):
@@ -704,75 +909,158 @@ def get_qualifying_results(session):
         })
     return qualifying_data
 
-def get_driver_quali_telemetry(session, driver_code: str, quali_segment: str):
+QUALI_SEGMENTS = ("Q1", "Q2", "Q3")
 
-    # Split Q1/Q2/Q3 sections
-    q1, q2, q3 = session.laps.split_qualifying_sessions()
 
-    segments = {
-        "Q1": q1,
-        "Q2": q2,
-        "Q3": q3
-    }
+def get_quali_fastest_laps(session):
+    """
+    Split the lap table into Q1/Q2/Q3 once and pick every driver's fastest
+    lap in each segment with one grouped pass, the same lap Laps.pick_fastest()
+    would choose (personal best laps only, the first one on a tie).
+
+    Returns {segment: {driver_code: lap index}}, with None for segments the
+    session does not have and for drivers without a valid lap in a segment.
+    Callers that load several laps compute it once and pass it along.
+    """
+    fastest = {}
+    for segment, segment_laps in zip(QUALI_SEGMENTS, session.laps.split_qualifying_sessions()):
+        if segment_laps is None:
+            fastest[segment] = None
+            continue
+        timed = segment_laps[segment_laps["LapTime"].notna()]
+        if "IsPersonalBest" in timed:
+            timed = timed[timed["IsPersonalBest"] == True]  # noqa: E712
+        fastest[segment] = dict.fromkeys(segment_laps["Driver"].unique().tolist())
+        if not timed.empty:
+            fastest[segment].update(timed.groupby("Driver")["LapTime"].idxmin().to_dict())
+
+    return fastest
+
+
+def get_driver_quali_telemetry(session, driver_code: str, quali_segment: str, fps: float = FPS, fastest_laps=None):
 
     # Validate the segment
-    if quali_segment not in segments:
+    if quali_segment not in QUALI_SEGMENTS:
         raise ValueError("quali_segment must be 'Q1', 'Q2', or 'Q3'")
 
-    segment_laps = segments[quali_segment]
+    # Fastest laps per segment, as returned by get_quali_fastest_laps()
+    if fastest_laps is None:
+        fastest_laps = get_quali_fastest_laps(session)
+    segment_laps = fastest_laps[quali_segment]
     if segment_laps is None:
         raise ValueError(f"{quali_segment} does not exist for this session.")
 
-    # Filter laps for the driver
-    driver_laps = segment_laps.pick_drivers(driver_code)
-    if driver_laps.empty:
+    # Fastest lap for the driver
+    if driver_code not in segment_laps:
         raise ValueError(f"No laps found for driver '{driver_code}' in {quali_segment}")
+    lap_id = segment_laps[driver_code]
+    if lap_id is None:
+        raise ValueError(f"No valid laps for driver '{driver_code}' in {quali_segment}")
 
-    # Pick fastest lap
-    fastest_lap = driver_laps.pick_fastest()
+    lap_input = _quali_lap_inputs(session, session.laps.loc[lap_id])
+    if lap_input is None:
+        return {"frames": [], "track_statuses": []}
 
-    # Extract telemetry with xyz coordinates
+    return _build_quali_lap_telemetry(lap_input, _quali_session_context(session, fps))
 
-    if fastest_lap is None:
-        raise ValueError(f"No valid laps for driver '{driver_code}' in {quali_segment}")
 
-    telemetry = fastest_lap.get_telemetry()
+def _quali_session_context(session, fps=FPS):
+    """Session-wide track status and weather series shared by every qualifying lap."""
+    track_status = session.track_status
+    context = {
+        "fps": fps,
+        "track_status_t": track_status["Time"].dt.total_seconds().to_numpy(),
+        "track_status": list(track_status["Status"]),
+        "weather": None,
+    }
 
-    # Guard: if telemetry has no time data, return empty
-    if telemetry is None or telemetry.empty or 'Time' not in telemetry or len(telemetry) == 0:
-        return {"frames": [], "track_statuses": []}
+    weather_df = getattr(session, "weather_data", None)
+    if weather_df is not None and not weather_df.empty:
+        context["weather"] = {"t": weather_df["Time"].dt.total_seconds().to_numpy()}
+        for name in ("TrackTemp", "AirTemp", "Humidity", "WindSpeed", "WindDirection", "Rainfall"):
+            if name in weather_df:
+                context["weather"][name] = weather_df[name].to_numpy().astype(float)
+
+    return context
+
+
+def _quali_lap_inputs(session, lap, buffers=None):
+    """
+    Everything needed to build one qualifying lap's telemetry, as plain values
+    and NumPy arrays (the raw car/position samples are cut down to the lap).
+    ``buffers`` are the driver's full streams when the caller already has them.
+    """
+    if buffers is None:
+        buffers = _driver_telemetry_buffers(session, str(lap["DriverNumber"]))
+    lap_start = lap["LapStartTime"]
+    lap_end = lap["Time"]
+    if buffers is None or pd.isna(lap_start) or pd.isna(lap_end):
+        return None
+
+    lap_start = lap_start.total_seconds()
+    lap_end = lap_end.total_seconds()
 
-    global_t_min = telemetry["Time"].dt.total_seconds().min()
-    global_t_max = telemetry["Time"].dt.total_seconds().max()
+    c0, c1 = _padded_window(buffers["car_t"], lap_start, lap_end)
+    p0, p1 = _padded_window(buffers["pos_t"], lap_start, lap_end)
+    buffers = {
+        **{name: buffers[name][c0:c1] for name in ("car_t", "speed", "gear", "drs", "throttle", "brake")},
+        **{name: buffers[name][p0:p1] for name in ("pos_t", "x", "y")},
+    }
 
-    max_speed = telemetry["Speed"].max()
-    min_speed = telemetry["Speed"].min()
+    # Extract tyre compound from the lap
+    compound = str(lap.get("Compound", "UNKNOWN")) if pd.notna(lap.get("Compound")) else "UNKNOWN"
 
-    # An array of objects containing the start and end disances of each time the driver used DRS during the lap
-    lap_drs_zones = []
+    return {
+        "buffers": buffers,
+        "start": lap_start,
+        "end": lap_end,
+        "lap_time": parse_time_string(str(lap["LapTime"])),
+        "sector_times": {
+            "sector1": parse_time_string(str(lap.get("Sector1Time"))) if pd.notna(lap.get("Sector1Time")) else None,
+            "sector2": parse_time_string(str(lap.get("Sector2Time"))) if pd.notna(lap.get("Sector2Time")) else None,
+            "sector3": parse_time_string(str(lap.get("Sector3Time"))) if pd.notna(lap.get("Sector3Time")) else None,
+        },
+        "compound": get_tyre_compound_int(compound),
+    }
 
-    # Build arrays directly from dataframes
-    t_arr = telemetry["Time"].dt.total_seconds().to_numpy()
-    x_arr = telemetry["X"].to_numpy()
-    y_arr = telemetry["Y"].to_numpy()
-    dist_arr = telemetry["Distance"].to_numpy()
-    rel_dist_arr = telemetry["RelativeDistance"].to_numpy()
-    speed_arr = telemetry["Speed"].to_numpy()
-    gear_arr = telemetry["nGear"].to_numpy()
-    throttle_arr = telemetry["Throttle"].to_numpy()
-    brake_arr = telemetry["Brake"].to_numpy()
-    drs_arr = telemetry["DRS"].to_numpy()
 
-    # Recompute time bounds from the (possibly modified) telemetry times
+def _build_quali_lap_telemetry(lap_input, context):
+    """Resample one qualifying lap into replay frames (runs in worker processes)."""
+    telemetry = _merge_lap_telemetry(lap_input["buffers"], lap_input["start"], lap_input["end"])
+
+    # Guard: if telemetry has no time data, return empty
+    if telemetry is None or len(telemetry["t"]) == 0:
+        return {"frames": [], "track_statuses": []}
+
+    # Lap-relative times, like the "Time" column of Lap.get_telemetry()
+    lap_times = telemetry["t"] - lap_input["start"]
+
+    max_speed = telemetry["speed"].max()
+    min_speed = telemetry["speed"].min()
+
+    # Build arrays directly from the merged telemetry
+    t_arr = lap_times
+    x_arr = telemetry["x"]
+    y_arr = telemetry["y"]
+    dist_arr = telemetry["dist"]
+    rel_dist_arr = telemetry["rel_dist"]
+    speed_arr = telemetry["speed"]
+    gear_arr = telemetry["gear"]
+    throttle_arr = telemetry["throttle"]
+    brake_arr = telemetry["brake"]
+    drs_arr = telemetry["drs"]
+
+    # Time bounds of the lap's samples (lap-relative)
     global_t_min = float(t_arr.min())
     global_t_max = float(t_arr.max())
 
     # Create timeline (relative times starting at zero) and include endpoint
-    timeline = np.arange(global_t_min, global_t_max + DT/2, DT) - global_t_min
+    dt = 1 / context.get("fps", FPS)
+    timeline = np.arange(global_t_min, global_t_max + dt/2, dt) - global_t_min
 
-    # Ensure we have at least one sample
-    if t_arr.size == 0:
-        return {"frames": [], "track_statuses": []}
+    # Session time of the first frame: track status and weather are on the
+    # session clock and are shifted onto the lap's timeline from here
+    session_t0 = lap_input["start"] + global_t_min
 
     # Shift telemetry times to same reference as timeline (relative to global_t_min)
     t_rel = t_arr - global_t_min
@@ -825,14 +1113,10 @@ def get_driver_quali_telemetry(session, driver_code: str, quali_segment: str):
         "drs": drs_resampled,
     }
 
-    track_status = session.track_status
-
     formatted_track_statuses = []
 
-    for status in track_status.to_dict('records'):
-        seconds = timedelta.total_seconds(status['Time'])
-
-        start_time = seconds - global_t_min # Shift to match timeline
+    for seconds, status in zip(context["track_status_t"], context["track_status"]):
+        start_time = seconds - session_t0 # Shift to match timeline
         end_time = None
 
         # Set the end time of the previous status
@@ -840,134 +1124,82 @@ def get_driver_quali_telemetry(session, driver_code: str, quali_segment: str):
             formatted_track_statuses[-1]['end_time'] = start_time
 
         formatted_track_statuses.append({
-            'status': status['Status'],
+            'status': status,
             'start_time': start_time,
             'end_time': end_time, 
         })
 
-    # 4.1. Resample weather data onto the same timeline for playback
-    weather_resampled = None
-    weather_df = getattr(session, "weather_data", None)
-    if weather_df is not None and not weather_df.empty:
+    # 4.1. Weather barely moves over a single lap, so it is kept as one
+    # sample per lap (interpolated at the lap start) rather than per frame
+    lap_weather = None
+    weather = context["weather"]
+    if weather is not None:
         try:
-            weather_times = weather_df["Time"].dt.total_seconds().to_numpy() - global_t_min
+            weather_times = weather["t"]
             if len(weather_times) > 0:
                 order_w = np.argsort(weather_times)
                 weather_times = weather_times[order_w]
-
-                def _maybe_get(name):
-                    return weather_df[name].to_numpy()[order_w] if name in weather_df else None
-
-                def _resample(series):
-                    if series is None:
-                        return None
-                    return np.interp(timeline, weather_times, series)
-
-                track_temp = _resample(_maybe_get("TrackTemp"))
-                air_temp = _resample(_maybe_get("AirTemp"))
-                humidity = _resample(_maybe_get("Humidity"))
-                wind_speed = _resample(_maybe_get("WindSpeed"))
-                wind_direction = _resample(_maybe_get("WindDirection"))
-                rainfall_raw = _maybe_get("Rainfall")
-                rainfall = _resample(rainfall_raw.astype(float)) if rainfall_raw is not None else None
-
-                weather_resampled = {
-                    "track_temp": track_temp,
-                    "air_temp": air_temp,
-                    "humidity": humidity,
-                    "wind_speed": wind_speed,
-                    "wind_direction": wind_direction,
-                    "rainfall": rainfall,
+                channels = {
+                    "track_temp": "TrackTemp",
+                    "air_temp": "AirTemp",
+                    "humidity": "Humidity",
+                    "wind_speed": "WindSpeed",
+                    "wind_direction": "WindDirection",
+                    "rainfall": "Rainfall",
+                }
+                lap_weather = {
+                    name: np.array([np.interp(session_t0, weather_times, weather[column][order_w])], dtype=np.float32)
+                    for name, column in channels.items()
+                    if column in weather
                 }
         except Exception as e:
             print(f"Weather data could not be processed: {e}")
 
-    # Build the frames
-    frames = []
-    num_frames = len(timeline)
-
-    for i in range(num_frames):
-        t = timeline[i]
-
-        weather_snapshot = {}
-        if weather_resampled:
-            try:
-                wt = weather_resampled
-                rain_val = wt["rainfall"][i] if wt.get("rainfall") is not None else 0.0
-                weather_snapshot = {
-                    "track_temp": float(wt["track_temp"][i]) if wt.get("track_temp") is not None else None,
-                    "air_temp": float(wt["air_temp"][i]) if wt.get("air_temp") is not None else None,
-                    "humidity": float(wt["humidity"][i]) if wt.get("humidity") is not None else None,
-                    "wind_speed": float(wt["wind_speed"][i]) if wt.get("wind_speed") is not None else None,
-                    "wind_direction": float(wt["wind_direction"][i]) if wt.get("wind_direction") is not None else None,
-                    "rain_state": "RAINING" if rain_val and rain_val >= 0.5 else "DRY",
-                }
-            except Exception as e:
-                print(f"Failed to attach weather data to frame {i}: {e}")
-
-        # Check if drs has changed from the previous frame
-
-        if i > 0:
-            drs_prev = resampled_data["drs"][i - 1]
-            drs_curr = resampled_data["drs"][i]
-
-            if (drs_curr >= 10) and (drs_prev < 10):
-                # DRS activated
-                lap_drs_zones.append({
-                    "zone_start": float(resampled_data["dist"][i]),
-                    "zone_end": None,
-                })
-            elif (drs_curr < 10) and (drs_prev >= 10):
-                # DRS deactivated
-                if lap_drs_zones and lap_drs_zones[-1]["zone_end"] is None:
-                    lap_drs_zones[-1]["zone_end"] = float(resampled_data["dist"][i])
-
-        frame_payload = {
-            "t": round(t, 3),
-            "telemetry": {
-                "x": float(resampled_data["x"][i]),
-                "y": float(resampled_data["y"][i]),
-                "dist": float(resampled_data["dist"][i]),
-                "rel_dist": float(resampled_data["rel_dist"][i]),
-                "speed": float(resampled_data["speed"][i]),
-                "gear": int(resampled_data["gear"][i]),
-                "throttle": float(resampled_data["throttle"][i]),
-                "brake": float(resampled_data["brake"][i]),
-                "drs": int(resampled_data["drs"][i]),
-            }
-        } 
-        if weather_snapshot:
-            frame_payload["weather"] = weather_snapshot
-
-        frames.append(frame_payload)
+    # DRS zones: rising and falling edges of the "DRS open" mask. A zone
+    # still open at the end of the lap has no end; a falling edge before
+    # the first opening belongs to no zone
+    drs_open = resampled_data["drs"] >= 10
+    edges = np.diff(drs_open.astype(np.int8))
+    zone_starts = np.flatnonzero(edges == 1) + 1
+    zone_ends = np.flatnonzero(edges == -1) + 1
+    if len(zone_starts):
+        zone_ends = zone_ends[zone_ends > zone_starts[0]]
+    zone_dist = resampled_data["dist"]
+    lap_drs_zones = [
+        {
+            "zone_start": float(zone_dist[start]),
+            "zone_end": float(zone_dist[zone_ends[k]]) if k < len(zone_ends) else None,
+        }
+        for k, start in enumerate(zone_starts.tolist())
+    ]
 
+    # Columnar frames; frames[i] still gives the {"t", "telemetry", "weather"} dict
+    frame_times = timeline.copy()
     # Set the time of the final frame to the exact lap time
-            
-    frames[-1]["t"] = round(parse_time_string(str(fastest_lap["LapTime"])), 3)
+    frame_times[-1] = lap_input["lap_time"]
+    frames = LapFrames(
+        t=frame_times,
+        telemetry={
+            name: np.asarray(resampled_data[name]).astype(dtype)
+            for name, dtype in LAP_CHANNELS.items()
+        },
+        weather=lap_weather,
+    )
 
-    sector_times = {
-        "sector1": parse_time_string(str(fastest_lap.get("Sector1Time"))) if pd.notna(fastest_lap.get("Sector1Time")) else None,
-        "sector2": parse_time_string(str(fastest_lap.get("Sector2Time"))) if pd.notna(fastest_lap.get("Sector2Time")) else None,
-        "sector3": parse_time_string(str(fastest_lap.get("Sector3Time"))) if pd.notna(fastest_lap.get("Sector3Time")) else None,
-    }
-    
-    # Extract tyre compound from the lap
-    compound = str(fastest_lap.get("Compound", "UNKNOWN")) if pd.notna(fastest_lap.get("Compound")) else "UNKNOWN"
-    compound_number = get_tyre_compound_int(compound)
     return {
         "frames": frames,
         "track_statuses": formatted_track_statuses,
         "drs_zones": lap_drs_zones,
         "max_speed": max_speed,
         "min_speed": min_speed,
-        "sector_times": sector_times,
-        "compound": compound_number,
+        "sector_times": lap_input["sector_times"],
+        "compound": lap_input["compound"],
     }
 
 
 def _process_quali_driver(args):
     """Process qualifying telemetry data for a single driver - must be top-level for multiprocessing"""
-    session, driver_code = args
+    driver_code, full_name, segment_inputs, context = args
     print(f"Getting qualifying telemetry for driver: {driver_code}")
 
     driver_telemetry_data = {}
@@ -976,30 +1208,33 @@ def _process_quali_driver(args):
     min_speed = 0.0
 
     for segment in ["Q1", "Q2", "Q3"]:
-        try:
-            segment_telemetry = get_driver_quali_telemetry(session, driver_code, segment)
-            driver_telemetry_data[segment] = segment_telemetry
+        lap_input = segment_inputs.get(segment)
+        if lap_input is None:
+            driver_telemetry_data[segment] = {"frames": [], "track_statuses": []}
+            continue
 
-            # Update global max/min speed
-            if segment_telemetry["max_speed"] > max_speed:
-                max_speed = segment_telemetry["max_speed"]
-            if segment_telemetry["min_speed"] < min_speed or min_speed == 0.0:
-                min_speed = segment_telemetry["min_speed"]
+        segment_telemetry = _build_quali_lap_telemetry(lap_input, context)
+        driver_telemetry_data[segment] = segment_telemetry
+        if not segment_telemetry["frames"]:
+            continue
 
-        except ValueError:
-            driver_telemetry_data[segment] = {"frames": [], "track_statuses": []}
+        # Update global max/min speed
+        if segment_telemetry["max_speed"] > max_speed:
+            max_speed = segment_telemetry["max_speed"]
+        if segment_telemetry["min_speed"] < min_speed or min_speed == 0.0:
+            min_speed = segment_telemetry["min_speed"]
 
-    print(f"Finished processing qualifying telemetry for driver: {driver_code}, {session.get_driver(driver_code)['FullName']},")
+    print(f"Finished processing qualifying telemetry for driver: {driver_code}, {full_name},")
     return {
         "driver_code": driver_code,
-        "driver_full_name": session.get_driver(driver_code)["FullName"],
+        "driver_full_name": full_name,
         "driver_telemetry_data": driver_telemetry_data,
         "max_speed": max_speed,
         "min_speed": min_speed,
     }
 
 
-def get_quali_telemetry(session, session_type='Q'):
+def get_quali_telemetry(session, session_type='Q', fps=FPS, processes=None):
     # This function is going to get the results from qualifying and the telemetry for each drivers' fastest laps in each qualifying segment
 
     # The structure of the returned data will be:
@@ -1018,16 +1253,30 @@ def get_quali_telemetry(session, session_type='Q'):
     event_name = str(session).replace(' ', '_')
     cache_suffix = 'sprintquali' if session_type == 'SQ' else 'quali'
 
+    if fps <= 0:
+        raise ValueError("fps must be positive")
+
+    year, round_number = session.event["EventDate"].year, session.event["RoundNumber"]
+    cache_key = _quali_cache_key(year, round_number, session_type, fps)
+
     # Check if this data has already been computed
-    try:
-        if "--refresh-data" not in sys.argv:
-            with open(f"computed_data/{event_name}_{cache_suffix}_telemetry.pkl", "rb") as f:
-                data = pickle.load(f)
-                print(f"Loaded precomputed {cache_suffix} telemetry data.")
-                print("The replay should begin in a new window shortly!")
-                return data
-    except FileNotFoundError:
-        pass  # Need to compute from scratch
+    if "--refresh-data" not in sys.argv:
+        data = cache_manager.get(cache_key, load_quali_data)
+        if data is None and fps == FPS:
+            legacy_key = _quali_cache_key(year, round_number, session_type, fps,
+                                          pipeline_version=LEGACY_PIPELINE_VERSION)
+            data = cache_manager.get(legacy_key, load_quali_data)
+            if data is None:
+                data = _load_legacy_cache(event_name, cache_suffix, load_quali_data)
+                if data is not None:
+                    data.setdefault("fps", FPS)
+                    # Migrate entries written by older versions into the managed cache
+                    cache_manager.put(legacy_key, data, save_quali_data)
+                    data = cache_manager.get(legacy_key, load_quali_data)
+        if data is not None:
+            print(f"Loaded precomputed {cache_suffix} telemetry data.")
+            print("The replay should begin in a new window shortly!")
+            return data
 
     qualifying_results = get_qualifying_results(session)
 
@@ -1043,11 +1292,31 @@ def get_quali_telemetry(session, session_type='Q'):
 
     telemetry_data = {}
 
-    driver_args = [(session, driver_codes[driver_no]) for driver_no in session.drivers]
+    # Split Q1/Q2/Q3 and pick the fastest laps once for the whole session,
+    # then hand each worker only its own laps as NumPy arrays instead of
+    # pickling the whole session per worker
+    fastest_laps = get_quali_fastest_laps(session)
+    context = _quali_session_context(session, fps)
+
+    driver_args = []
+    for driver_no in session.drivers:
+        driver_code = driver_codes[driver_no]
+        lap_ids = {
+            segment: segment_laps[driver_code]
+            for segment, segment_laps in fastest_laps.items()
+            if segment_laps and segment_laps.get(driver_code) is not None
+        }
+        # The driver's streams are converted once and cut down per lap
+        buffers = _driver_telemetry_buffers(session, str(driver_no)) if lap_ids else None
+        segment_inputs = {
+            segment: _quali_lap_inputs(session, session.laps.loc[lap_id], buffers)
+            for segment, lap_id in lap_ids.items()
+        } if buffers is not None else {}
+        driver_args.append((driver_code, session.get_driver(driver_code)["FullName"], segment_inputs, context))
 
     print(f"Processing {len(session.drivers)} drivers in parallel...")
     
-    num_processes = min(cpu_count(), len(session.drivers))
+    num_processes = max(1, min(processes or cpu_count(), len(session.drivers)))
     
     with Pool(processes=num_processes) as pool:
         results = pool.map(_process_quali_driver, driver_args)
@@ -1065,22 +1334,20 @@ def get_quali_telemetry(session, session_type='Q'):
 
     # Save to the compute_data directory
 
-    if not os.path.exists("computed_data"):
-        os.makedirs("computed_data")
-
-    with open(f"computed_data/{event_name}_{cache_suffix}_telemetry.pkl", "wb") as f:
-        pickle.dump({
-            "results": qualifying_results,
-            "telemetry": telemetry_data,
-            "max_speed": max_speed,
-            "min_speed": min_speed,
-        }, f, protocol=pickle.HIGHEST_PROTOCOL)
+    cache_manager.put(cache_key, {
+        "results": qualifying_results,
+        "telemetry": telemetry_data,
+        "max_speed": max_speed,
+        "min_speed": min_speed,
+        "fps": fps,
+    }, save_quali_data)
 
     return {
         "results": qualifying_results,
         "telemetry": telemetry_data,
         "max_speed": max_speed,
         "min_speed": min_speed,
+        "fps": fps,
     }
 
 
@@ -1124,4 +1391,28 @@ def list_sprints(year):
         print(f"No sprint races found for {year}.")
     else:
         for _, event in sprints.iterrows():
-            print(f"{event['RoundNumber']}: {event['EventName']}")
\ No newline at end of file
+            print(f"{event['RoundNumber']}: {event['EventName']}")
+
+
+def list_cached_telemetry():
+    """Lists the computed telemetry entries in computed_data/, least recently used first."""
+    entries = cache_manager.list()
+    if not entries:
+        print("No cached telemetry found.")
+        return
+    print(f"Cached telemetry ({cache_manager.total_bytes() / 1e9:.2f} GB)")
+    for entry in entries:
+        key = entry["key"]
+        if key["pipeline_version"] == LEGACY_PIPELINE_VERSION:
+            stale = " (legacy)"
+        elif key["pipeline_version"] != PIPELINE_VERSION:
+            stale = " (stale)"
+        else:
+            stale = ""
+        last_used = datetime.fromtimestamp(entry["last_access"]).strftime("%Y-%m-%d %H:%M")
+        rate = f"{key['fps']:g} FPS" if key["fps"] else "native rate"
+        if key["params"].get("caution_fps"):
+            rate += f" ({key['params']['caution_fps']:g} FPS under caution)"
+        print(f"{key['year']} R{key['round_number']} {key['session_type']} {key['kind']} "
+              f"@ {rate}, v{key['pipeline_version']}{stale}: "
+              f"{entry['byte_size'] / 1e6:.1f} MB, last used {last_used}")
@@ -2,10 +2,14 @@ import arcade
 import threading
 import time
 import numpy as np
-from src.ui_components import build_track_from_example_lap, LapTimeLeaderboardComponent, QualifyingSegmentSelectorComponent, RaceControlsComponent, draw_finish_line, LegendComponent, QualifyingLapTimeComponent
-from src.f1_data import get_driver_quali_telemetry
+from src.ui_components import build_track_from_example_lap, LapTimeLeaderboardComponent, QualifyingSegmentSelectorComponent, RaceControlsComponent, draw_finish_line, LegendComponent, QualifyingLapTimeComponent, TextPool
+from src.f1_data import get_driver_quali_telemetry, get_quali_fastest_laps
 from src.f1_data import FPS
+from src.lib.frames import LapFrames
+from src.lib.lap_comparison import LapComparison
 from src.lib.time import format_time
+from src.lib.transform import ScreenTransform
+from arcade.shape_list import ShapeElementList, create_line_strip
 from src.ui_components import LegendComponent
 
 SCREEN_WIDTH = 1280
@@ -19,6 +23,9 @@ RIGHT_MARGIN = 40
 TOP_MARGIN = 40
 BOTTOM_MARGIN = 40
 
+# Laps that can be overlaid on the loaded one (pinned laps plus the pole lap)
+MAX_COMPARISON_LAPS = 9
+
 class QualifyingReplay(arcade.Window):
     def __init__(self, session, data, circuit_rotation=0, left_ui_margin=340, right_ui_margin=0, title="Qualifying Results"):
         super().__init__(width=SCREEN_WIDTH, height=SCREEN_HEIGHT, title=title, resizable=True)
@@ -26,6 +33,9 @@ class QualifyingReplay(arcade.Window):
         
         self.session = session
         self.data = data
+        self._bind_lap_frames(data)
+        # Frame rate the telemetry was computed at (older caches were always FPS)
+        self.fps = data.get("fps", FPS)
         self.leaderboard = LapTimeLeaderboardComponent(
             x=LEFT_MARGIN,
         )
@@ -51,11 +61,31 @@ class QualifyingReplay(arcade.Window):
         self.g_min = 0
         self.g_max = 8
 
-        # cached arrays for fast indexing/interpolation when telemetry loaded
+        # Channels of the loaded lap, bound straight from its LapFrames
+        # (no per-frame conversion) when telemetry is loaded
+        self.frames = None
         self._times = None   # numpy array of frame times
         self._xs = None      # numpy array of telemetry x
         self._ys = None      # numpy array of telemetry y
         self._speeds = None  # optional cached speeds
+        # Chart axis ranges, computed once per loaded lap
+        self._rel_dist_range = (0.0, 1.0)
+        self._dist_range = (0.0, 1.0)
+        # Full-lap chart traces (loaded and comparison laps), rebuilt when the
+        # lap, the comparison laps or the chart layout changes
+        self._chart_traces = None
+        self._comparison_traces = []
+        self._chart_traces_key = None
+        # Laps pinned for the overlay as (driver code, segment), and the
+        # comparison engine aligning them with the loaded lap
+        self.pinned_laps = []
+        self._lap_comparison = None
+        self._lap_comparison_key = None
+        # Circuit map outlines and DRS zones, rebuilt when the map area changes
+        self._map_key = None
+        self._map_transform = None
+        self._map_track_shapes = None
+        self._map_drs_shapes = None
 
         # Playback / animation state for the chart
         self.play_time = 0.0          # current play time (seconds)
@@ -64,18 +94,18 @@ class QualifyingReplay(arcade.Window):
         self.paused = True            # start paused by default
         self.playback_speed = 1.0     # 1.0 = realtime
         self.loading_telemetry = False
+        # Fastest lap per driver and segment, picked on the first telemetry fetch
+        self._fastest_laps = None
 
         # Rotation (degrees) to apply to the whole circuit around its centre
         self.circuit_rotation = circuit_rotation
-        self._rot_rad = float(np.deg2rad(self.circuit_rotation)) if self.circuit_rotation else 0.0
-        self._cos_rot = float(np.cos(self._rot_rad))
-        self._sin_rot = float(np.sin(self._rot_rad))
         self.left_ui_margin = left_ui_margin
         self.right_ui_margin = right_ui_margin
 
         self.chart_active = False
         self.show_comparison_telemetry = True
 
+        self.loaded_telemetry = None
         self.loaded_driver_code = None
         self.loaded_driver_segment = None
 
@@ -96,9 +126,11 @@ class QualifyingReplay(arcade.Window):
                 example_lap = self.session.laps.pick_drivers(res['code']).pick_fastest()
                 break
 
-        self.world_scale = 1.0
-        self.tx = 0
-        self.ty = 0
+        # World -> screen mapping for the track area, refitted in update_scaling
+        self.transform = ScreenTransform()
+
+        # Chart titles, value labels and legend text, kept across frames
+        self.texts = TextPool()
 
         (self.plot_x_ref, self.plot_y_ref,
          self.x_inner, self.y_inner,
@@ -106,9 +138,7 @@ class QualifyingReplay(arcade.Window):
          self.x_min, self.x_max,
          self.y_min, self.y_max, self.drs_zones_xy) = build_track_from_example_lap(example_lap.get_telemetry())
          
-        ref_points = self._interpolate_points(self.plot_x_ref, self.plot_y_ref, interp_points=4000)
-        self._ref_xs = np.array([p[0] for p in ref_points])
-        self._ref_ys = np.array([p[1] for p in ref_points])
+        self._ref_xs, self._ref_ys = self._interpolate_points(self.plot_x_ref, self.plot_y_ref, interp_points=4000)
 
         # cumulative distances along the reference polyline (metres)
         diffs = np.sqrt(np.diff(self._ref_xs)**2 + np.diff(self._ref_ys)**2)
@@ -120,9 +150,9 @@ class QualifyingReplay(arcade.Window):
         self.world_inner_points = self._interpolate_points(self.x_inner, self.y_inner)
         self.world_outer_points = self._interpolate_points(self.x_outer, self.y_outer)
 
-        # These will hold the actual screen coordinates to draw
-        self.screen_inner_points = [self.world_to_screen(x, y) for x, y in self.world_inner_points]
-        self.screen_outer_points = [self.world_to_screen(x, y) for x, y in self.world_outer_points]
+        # These will hold the actual screen coordinates to draw (set in update_scaling)
+        self.screen_inner_points = []
+        self.screen_outer_points = []
 
         # Qualifying segment selector modal
         self.selected_driver = None
@@ -136,64 +166,50 @@ class QualifyingReplay(arcade.Window):
         self.is_forwarding = False
         self.was_paused_before_hold = False
 
+        # Redraw on demand: input, hover changes, resizes, playback and
+        # telemetry loading mark the window dirty, and clean ticks skip
+        # drawing altogether
+        self._needs_redraw = True
+        self._view_state = None
+
+    def invalidate(self):
+        """Request a redraw on the next tick."""
+        self._needs_redraw = True
+
+    def draw(self, delta_time: float):
+        # Arcade calls draw() every tick. When nothing changed, skip on_draw
+        # and the buffer swap so the last frame stays on screen.
+        if not self._needs_redraw:
+            return
+        self._needs_redraw = False
+        super().draw(delta_time)
+
+    def on_expose(self):
+        self.invalidate()
+
     def update_scaling(self, screen_w, screen_h):
         """
         Recalculates the scale and translation to fit the track 
         perfectly within the new screen dimensions while maintaining aspect ratio.
         """
-        padding = 0.05
-        # If a rotation is applied, we must compute the rotated bounds
-        world_cx = (self.x_min + self.x_max) / 2
-        world_cy = (self.y_min + self.y_max) / 2
-
-        def _rotate_about_center(x, y):
-            # Translate to centre, rotate, translate back
-            tx = x - world_cx
-            ty = y - world_cy
-            rx = tx * self._cos_rot - ty * self._sin_rot
-            ry = tx * self._sin_rot + ty * self._cos_rot
-            return rx + world_cx, ry + world_cy
-
-        # Build rotated extents from inner/outer world points
-        rotated_points = []
-        for x, y in self.world_inner_points:
-            rotated_points.append(_rotate_about_center(x, y))
-        for x, y in self.world_outer_points:
-            rotated_points.append(_rotate_about_center(x, y))
-
-        xs = [p[0] for p in rotated_points]
-        ys = [p[1] for p in rotated_points]
-        world_x_min = min(xs) if xs else self.x_min
-        world_x_max = max(xs) if xs else self.x_max
-        world_y_min = min(ys) if ys else self.y_min
-        world_y_max = max(ys) if ys else self.y_max
-
-        world_w = max(1.0, world_x_max - world_x_min)
-        world_h = max(1.0, world_y_max - world_y_min)
-        
         # Reserve left/right UI margins before applying padding so the track
         # never overlaps side UI elements (leaderboard, telemetry, legends).
         inner_w = max(1.0, screen_w - self.left_ui_margin - self.right_ui_margin)
-        usable_w = inner_w * (1 - 2 * padding)
-        usable_h = screen_h * (1 - 2 * padding)
 
-        # Calculate scale to fit whichever dimension is the limiting factor
-        scale_x = usable_w / world_w
-        scale_y = usable_h / world_h
-        self.world_scale = min(scale_x, scale_y)
-
-        # Center the world in the screen (rotation done about original centre)
-        # world_cx/world_cy are unchanged by rotation about centre
-        # Center within the available inner area (left_ui_margin .. screen_w - right_ui_margin)
-        screen_cx = self.left_ui_margin + inner_w / 2
-        screen_cy = screen_h / 2
-
-        self.tx = screen_cx - self.world_scale * world_cx
-        self.ty = screen_cy - self.world_scale * world_cy
+        # Fit the rotated track outline into the inner area, rotating about
+        # the centre of the unrotated bounds
+        world_xs = np.concatenate((self.world_inner_points[0], self.world_outer_points[0]))
+        world_ys = np.concatenate((self.world_inner_points[1], self.world_outer_points[1]))
+        self.transform = ScreenTransform.fit(
+            world_xs, world_ys,
+            self.left_ui_margin, 0, inner_w, screen_h,
+            rotation=self.circuit_rotation, padding=0.05,
+            center=((self.x_min + self.x_max) / 2, (self.y_min + self.y_max) / 2),
+        )
 
         # Update the polyline screen coordinates based on new scale
-        self.screen_inner_points = [self.world_to_screen(x, y) for x, y in self.world_inner_points]
-        self.screen_outer_points = [self.world_to_screen(x, y) for x, y in self.world_outer_points]
+        self.screen_inner_points = self.transform.apply_points(*self.world_inner_points)
+        self.screen_outer_points = self.transform.apply_points(*self.world_outer_points)
 
     def on_draw(self):
         self.clear()
@@ -205,7 +221,8 @@ class QualifyingReplay(arcade.Window):
                 fastest_driver = self.data.get("results", [])[0] if isinstance(self.data.get("results", []), list) and len(self.data.get("results", [])) > 0 else None
                 # Get comparison telemetry if available
                 comparison_data = self.data.get("telemetry", {}).get(fastest_driver.get("code")) if fastest_driver and self.show_comparison_telemetry else None
-                comparison_telemetry = comparison_data.get("Q3").get("frames", []) if comparison_data and self.show_comparison_telemetry and fastest_driver and ((fastest_driver.get("code") != self.loaded_driver_code) or (fastest_driver.get("code") == self.loaded_driver_code and self.loaded_driver_segment != "Q3")) else None
+                # Laps overlaid on the loaded one, aligned on a shared distance grid
+                comparison = self._comparison_for(self._comparison_laps(fastest_driver))
 
                 # right-hand area (to the right of leaderboard)
                 area_left = self.leaderboard.x + getattr(self.leaderboard, "width", 240) + 40
@@ -264,9 +281,9 @@ class QualifyingReplay(arcade.Window):
 
                 # Add Subtitles to the charts
 
-                arcade.Text("Speed (km/h)", chart_left + 10, speed_top + 10, arcade.color.ANTI_FLASH_WHITE, 14).draw()
-                arcade.Text("Gear", chart_left + 10, gear_top + 10, arcade.color.ANTI_FLASH_WHITE, 14).draw()
-                arcade.Text("Throttle / Brake (%)", chart_left + 10, ctrl_top + 10, arcade.color.ANTI_FLASH_WHITE, 14).draw()
+                self.texts.draw("speed_title", "Speed (km/h)", chart_left + 10, speed_top + 10, arcade.color.ANTI_FLASH_WHITE, 14)
+                self.texts.draw("gear_title", "Gear", chart_left + 10, gear_top + 10, arcade.color.ANTI_FLASH_WHITE, 14)
+                self.texts.draw("ctrl_title", "Throttle / Brake (%)", chart_left + 10, ctrl_top + 10, arcade.color.ANTI_FLASH_WHITE, 14)
 
                 # DRS key at right of the speed subtitle (green square + label)
                 key_size = 12
@@ -277,46 +294,17 @@ class QualifyingReplay(arcade.Window):
 
                 drs_key_rect = arcade.XYWH(square_x, key_y, key_size, key_size)
                 arcade.draw_rect_filled(drs_key_rect, arcade.color.GREEN)
-                arcade.Text(
-                    "DRS active",
+                self.texts.draw(
+                    "drs_key", "DRS active",
                     square_x + (key_size * 0.5) + 6,
                     key_y,
                     arcade.color.ANTI_FLASH_WHITE,
                     12,
                     anchor_y="center"
-                ).draw()
-
-                # Comparison driver key (yellow line + label)
-
-                if comparison_telemetry:
-                    comp_key_size = 12
-                    comp_key_padding_right = 350
-                    comp_key_y = speed_top + 10 + (comp_key_size * 0.5)
-                    comp_square_x = chart_right - comp_key_padding_right - (comp_key_size / 2)
-
-                    comp_driver_code = fastest_driver.get("code") if fastest_driver else "N/A"
-
-                    comp_key_rect = arcade.XYWH(comp_square_x, comp_key_y, comp_key_size, 3)
-                    arcade.draw_rect_filled(comp_key_rect, arcade.color.YELLOW)
-                    arcade.Text(
-                        f"Comparison Driver: {comp_driver_code} - Q3",
-                        comp_square_x + (comp_key_size * 0.5) + 6,
-                        comp_key_y,
-                        arcade.color.ANTI_FLASH_WHITE,
-                        12,
-                        anchor_y="center"
-                    ).draw()
-
-                # compute global ranges from all frames (use distance for x-axis) - Should be max of 1.0 rel_dist, but just in case
+                )
 
-                all_dists = [ self._pick_telemetry_value(f.get("telemetry", {}), "rel_dist") for f in frames ]
-                
-                # filter out None
-                all_dists = [d for d in all_dists if d is not None]
-                if not all_dists:
-                    return
-
-                full_d_min, full_d_max = min(all_dists), max(all_dists)
+                # Axis ranges of the loaded lap (rel_dist on the x-axis), computed at load
+                full_d_min, full_d_max = self._rel_dist_range
                 full_s_min, full_s_max = self.min_speed, self.max_speed
 
                 # avoid zero-range
@@ -325,19 +313,17 @@ class QualifyingReplay(arcade.Window):
                 if full_s_max == full_s_min:
                     full_s_max = full_s_min + 1.0
 
-                # Prepare arrays for drawing up to current frame index (animate)
+                # Current frame of the loaded lap, and where every compared lap
+                # was after the same lap time (as fractional grid indices)
                 self.frame_index = max(0, min(self.frame_index, len(frames) - 1))
-                draw_pos = []         # along-track distance used as x-axis
-                draw_speeds = []
-                draw_throttle = []
-                draw_brake = []
-                draw_gears = []
-                
-                draw_comparison_pos = []
-                draw_comparison_speeds = []
-                draw_comparison_throttle = []
-                draw_comparison_brake = []
-                draw_comparison_gears = []
+                lap = frames.telemetry
+                if comparison is not None:
+                    comparison_index = comparison.index_at(float(frames.t[self.frame_index] - frames.t[0]))
+                    # Time lost to the loaded lap by the time each lap reached
+                    # the loaded car's current distance
+                    reference_index = comparison_index[comparison.row(comparison.reference)]
+                    comparison_delta = comparison.sample("delta", np.full(len(comparison), reference_index))
+
                 # The speed chart background will have sections of it shaded green to indicate where DRS was active
 
                 # find the drs zones for this lap that the driver has already passed.
@@ -345,10 +331,7 @@ class QualifyingReplay(arcade.Window):
 
                 drs_zones_to_show = []
 
-                current_frame = frames[self.frame_index]
-                current_tel = current_frame.get("telemetry", {}) if isinstance(current_frame.get("telemetry", {}), dict) else {}
-                current_comparison_tel = comparison_telemetry[self.frame_index].get("telemetry") if comparison_telemetry and self.frame_index < len(comparison_telemetry) else {}
-                current_dist = self._pick_telemetry_value(current_tel, "dist")
+                current_dist = float(lap["dist"][self.frame_index])
                 
                 for dz in self.drs_zones:
                     zone_start = dz.get("zone_start")
@@ -363,6 +346,7 @@ class QualifyingReplay(arcade.Window):
                             "zone_end": shade_end
                         })
 
+                full_abs_d_min, full_abs_d_max = self._dist_range
                 for dz in drs_zones_to_show:
                     # Convert to float to handle string values
                     try:
@@ -371,13 +355,6 @@ class QualifyingReplay(arcade.Window):
                     except (ValueError, TypeError):
                         continue  # Skip invalid zones
                     
-                    # Get the full distance range from all frames
-                    all_abs_dists = [self._pick_telemetry_value(f.get("telemetry", {}), "dist") for f in frames]
-                    all_abs_dists = [d for d in all_abs_dists if d is not None]
-                    if not all_abs_dists:
-                        continue
-                    
-                    full_abs_d_min, full_abs_d_max = min(all_abs_dists), max(all_abs_dists)
                     if full_abs_d_max == full_abs_d_min:
                         continue
                     
@@ -389,152 +366,66 @@ class QualifyingReplay(arcade.Window):
                     drs_rect = arcade.XYWH((x1pix + x2pix) * 0.5, speed_bottom + speed_h * 0.5, x2pix - x1pix, speed_h)
                     arcade.draw_rect_filled(drs_rect, (0, 100, 0, 100)) # semi-transparent green
 
-                # Collect values frame-by-frame (safe for mixed datasets)
-                for f_i, f in enumerate(frames[:self.frame_index + 1]):
-                    tel = f.get("telemetry", {}) if isinstance(f.get("telemetry", {}), dict) else {}
-                    d = self._pick_telemetry_value(tel, "rel_dist")
-                    s = self._pick_telemetry_value(tel, "speed")
-                    if d is None or s is None:
-                        continue
-                    # throttle
-                    th = self._pick_telemetry_value(tel, "throttle")
-                    # brake
-                    br = self._pick_telemetry_value(tel, "brake")
-                    # gear
-                    gr = self._pick_telemetry_value(tel, "gear")
-
-                    draw_pos.append(float(d))
-                    draw_speeds.append(float(s))
-                    draw_throttle.append(float(th) if th is not None else None)
-                    if isinstance(br, (bool, int)):
-                        draw_brake.append(1.0 if br else 0.0)
-                    else:
-                        draw_brake.append(float(br) if br is not None else None)
-                    draw_gears.append(int(gr) if gr is not None else None)
-
-                    # Comparison Driver telemetry
-
-                    if comparison_telemetry and f_i < len(comparison_telemetry):
-
-                        frame_comparison_telemetry = comparison_telemetry[f_i]
-
-                        if frame_comparison_telemetry is not None:
-                            frame_comparison_telemetry = frame_comparison_telemetry.get("telemetry", {}) if isinstance(frame_comparison_telemetry.get("telemetry", {}), dict) else {}
-                            c_d = self._pick_telemetry_value(frame_comparison_telemetry, "rel_dist")
-                            c_s= self._pick_telemetry_value(frame_comparison_telemetry, "speed")
-                            c_th = self._pick_telemetry_value(frame_comparison_telemetry, "throttle")
-                            c_br = self._pick_telemetry_value(frame_comparison_telemetry, "brake")
-                            c_gr = self._pick_telemetry_value(frame_comparison_telemetry, "gear")
-                            draw_comparison_pos.append(float(c_d) if c_d is not None else None)
-                            draw_comparison_speeds.append(float(c_s) if c_s is not None else None)
-                            draw_comparison_throttle.append(float(c_th) if c_th is not None else None)
-                            if isinstance(c_br, (bool, int)):
-                                draw_comparison_brake.append(1.0 if c_br else 0.0)
-                            else:
-                                draw_comparison_brake.append(float(c_br) if c_br is not None else None)
-                            draw_comparison_gears.append(int(c_gr) if c_gr is not None else None)
-
-                if draw_comparison_pos and draw_comparison_speeds:
-                    pts = []
-                    for d, s in zip(draw_comparison_pos, draw_comparison_speeds):
-                        if s is None:
-                            continue
-                        nx = (d - full_d_min) / (full_d_max - full_d_min)
-                        ny = (s - full_s_min) / (full_s_max - full_s_min)
-                        xpix = chart_left + nx * chart_w
-                        ypix = speed_bottom + VP + ny * (speed_h - 2 * VP)
-                        pts.append((xpix, ypix))
-                    try:
-                        arcade.draw_line_strip(pts, arcade.color.YELLOW, 2)
-                        # Show current speed in km/h
-                        current_speed = draw_comparison_speeds[-1] if draw_comparison_speeds else 0
-                        arcade.Text(f"{current_speed:.0f} km/h", pts[-1][0] + 10, pts[-1][1] - 15, arcade.color.YELLOW, 12).draw()
-                    except Exception as e:
-                        print("Chart draw error (comparison speed):", e)
-
-                # Draw speed in the top sub-area (x-axis = distance)
-                if draw_pos and draw_speeds:
-                    pts = []
-                    for d, s in zip(draw_pos, draw_speeds):
-                        nx = (d - full_d_min) / (full_d_max - full_d_min)
-                        ny = (s - full_s_min) / (full_s_max - full_s_min)
-                        xpix = chart_left + nx * chart_w
-                        ypix = speed_bottom + VP + ny * (speed_h - 2 * VP)
-                        pts.append((xpix, ypix))
-                    try:
-                        arcade.draw_line_strip(pts, arcade.color.ANTI_FLASH_WHITE, 2)
-                        # Show current speed in km/h
-                        current_speed = draw_speeds[-1] if draw_speeds else 0
-                        arcade.Text(f"{current_speed:.0f} km/h", pts[-1][0] + 10, pts[-1][1] + 5, arcade.color.ANTI_FLASH_WHITE, 12).draw()
-                    except Exception as e:
-                        print("Chart draw error (speed):", e)
-
-                # Draw gears in the middle sub-area
-                gear_pts = []
-                comparison_gear_pts = []
-                for d, g in zip(draw_pos, draw_gears):
-                    if g is None:
-                        continue
-                    nx = (d - full_d_min) / (full_d_max - full_d_min)
-                    xpix = chart_left + nx * chart_w
-                    # map gear to vertical within gear box (higher gears near top of gear area)
-                    gy = (g - self.g_min) / (self.g_max - self.g_min)
-                    ypix = gear_bottom + VP + gy * (gear_h - 2 * VP)
-                    gear_pts.append((xpix, ypix))
-
-                # Add comparison driver's gears
-                for d, g in zip(draw_comparison_pos, draw_comparison_gears):
-                    if g is None:
-                        continue
-                    nx = (d - full_d_min) / (full_d_max - full_d_min)
-                    xpix = chart_left + nx * chart_w
-                    gy = (g - self.g_min) / (self.g_max - self.g_min)
-                    ypix = gear_bottom + VP + gy * (gear_h - 2 * VP)
-                    comparison_gear_pts.append((xpix, ypix))
-
-                try:
-                    if comparison_gear_pts:
-                        arcade.draw_line_strip(comparison_gear_pts, arcade.color.YELLOW, 2)
-                        
-                    if gear_pts:
-                        arcade.draw_line_strip(gear_pts, arcade.color.LIGHT_GRAY, 2)
-                        
-                        # Show current gear next to the line
-
-                        current_gear = draw_gears[-1] if draw_gears else 0
-                        arcade.Text(f"Gear: {int(current_gear)}", gear_pts[-1][0] + 10, gear_pts[-1][1] + 5, arcade.color.LIGHT_GRAY, 12).draw()
-                        
-                except Exception as e:
-                    print("Chart draw error (gear):", e)
-
-
-                th_min = self.th_min
-                th_max = self.th_max
-
-                br_min = self.br_min
-                br_max = self.br_max
-
-                throttle_pts = []
-                brake_pts = []
-                for d, th, br in zip(draw_pos, draw_throttle, draw_brake):
-                    nx = (d - full_d_min) / (full_d_max - full_d_min)
-                    xpix = chart_left + nx * chart_w
-                    if th is not None:
-                        ny = (th - th_min) / (th_max - th_min)
-                        ypix = ctrl_bottom + VP + ny * (ctrl_h - 2 * VP)
-                        throttle_pts.append((xpix, ypix))
-                    if br is not None:
-                        ny = (br - br_min) / (br_max - br_min)
-                        ypix = ctrl_bottom + VP + ny * (ctrl_h - 2 * VP)
-                        brake_pts.append((xpix, ypix))
-
-                try:
-                    if throttle_pts:
-                        arcade.draw_line_strip(throttle_pts, arcade.color.GREEN, 2)
-                    if brake_pts:
-                        arcade.draw_line_strip(brake_pts, arcade.color.RED, 2)
-                except Exception as e:
-                    print("Chart draw error (controls):", e)
+                # Distance -> chart x, shared by the three charts
+                def _chart_x(dists):
+                    return chart_left + (np.asarray(dists, dtype=float) - full_d_min) / (full_d_max - full_d_min) * chart_w
+
+                def _chart_points(dists, values, bottom, height, v_min, v_max):
+                    ys = bottom + VP + (np.asarray(values, dtype=float) - v_min) / (v_max - v_min) * (height - 2 * VP)
+                    return np.column_stack((_chart_x(dists), ys)).tolist()
+
+                speed_axis = (speed_bottom, speed_h, full_s_min, full_s_max)
+                gear_axis = (gear_bottom, gear_h, self.g_min, self.g_max)
+                throttle_axis = (ctrl_bottom, ctrl_h, self.th_min, self.th_max)
+                brake_axis = (ctrl_bottom, ctrl_h, self.br_min, self.br_max)
+
+                # Full-lap traces are built once per (driver, segment, comparison
+                # laps, chart layout); each frame reveals them up to the current point
+                comparison_rows = [
+                    (row, key) for row, key in enumerate(comparison.keys) if key != comparison.reference
+                ] if comparison is not None else []
+                trace_key = (
+                    self.loaded_driver_code, self.loaded_driver_segment,
+                    tuple(key for _, key in comparison_rows),
+                    chart_left, chart_w, speed_axis, gear_axis, ctrl_bottom, ctrl_h,
+                )
+                if trace_key != self._chart_traces_key:
+                    self._chart_traces_key = trace_key
+                    self._chart_traces = self._build_chart_traces(lap, _chart_points, [
+                        ("speed", speed_axis, arcade.color.ANTI_FLASH_WHITE),
+                        ("gear", gear_axis, arcade.color.LIGHT_GRAY),
+                        ("throttle", throttle_axis, arcade.color.GREEN),
+                        ("brake", brake_axis, arcade.color.RED),
+                    ])
+                    self._comparison_traces = []
+                    for row, (code, _segment) in comparison_rows:
+                        aligned = {"rel_dist": comparison.grid, **{name: values[row] for name, values in comparison.channels.items()}}
+                        color = self._driver_color(code, arcade.color.YELLOW)
+                        self._comparison_traces.append((row, self._build_chart_traces(aligned, _chart_points, [
+                            ("speed", speed_axis, color),
+                            ("gear", gear_axis, color),
+                        ])))
+
+                for row, traces in self._comparison_traces:
+                    self._draw_trace_prefix(traces, chart_left, float(_chart_x(comparison.fraction(comparison_index[row]))))
+                self._draw_trace_prefix(self._chart_traces, chart_left, float(_chart_x(lap["rel_dist"][self.frame_index])))
+
+                # Show current speed in km/h and the current gear next to the lines
+                current = slice(self.frame_index, self.frame_index + 1)
+                if comparison_rows:
+                    # Speed of the first compared lap (the pole lap unless hidden)
+                    row, (code, _segment) = comparison_rows[0]
+                    current_speed = comparison.sample("speed", comparison_index)[row]
+                    px, py = _chart_points(comparison.fraction(comparison_index[row:row + 1]), [current_speed], *speed_axis)[0]
+                    self.texts.draw("comparison_speed", f"{current_speed:.0f} km/h", px + 10, py - 15, self._driver_color(code, arcade.color.YELLOW), 12)
+
+                current_speed = lap["speed"][self.frame_index]
+                px, py = _chart_points(lap["rel_dist"][current], lap["speed"][current], *speed_axis)[0]
+                self.texts.draw("speed_value", f"{current_speed:.0f} km/h", px + 10, py + 5, arcade.color.ANTI_FLASH_WHITE, 12)
+
+                current_gear = lap["gear"][self.frame_index]
+                px, py = _chart_points(lap["rel_dist"][current], lap["gear"][current], *gear_axis)[0]
+                self.texts.draw("gear_value", f"Gear: {int(current_gear)}", px + 10, py + 5, arcade.color.LIGHT_GRAY, 12)
                 
                 # Draw qualifying lap time component at top of map area
                 self.qualifying_lap_time_comp.x = map_left
@@ -544,7 +435,7 @@ class QualifyingReplay(arcade.Window):
                 self.qualifying_lap_time_comp.draw(self)
 
                 y_offset = map_top - 48
-                arcade.Text(f"Playback Speed: {self.playback_speed:.1f}x", map_left + 10, y_offset - 130, arcade.color.ANTI_FLASH_WHITE, 14).draw()
+                self.texts.draw("playback_speed", f"Playback Speed: {self.playback_speed:.1f}x", map_left + 10, y_offset - 130, arcade.color.ANTI_FLASH_WHITE, 14)
 
                 # Legends
                 legend_x = chart_right - 100
@@ -552,119 +443,61 @@ class QualifyingReplay(arcade.Window):
 
                 # Draw circuit map in bottom half (fit inner/outer polylines into map area)
                 if getattr(self, "x_min", None) is not None and getattr(self, "x_max", None) is not None:
-                    world_x_min = float(self.x_min)
-                    world_x_max = float(self.x_max)
-                    world_y_min = float(self.y_min)
-                    world_y_max = float(self.y_max)
-
-                    world_w = max(1.0, world_x_max - world_x_min)
-                    world_h = max(1.0, world_y_max - world_y_min)
-
-                    pad = 0.06
-                    usable_w = map_w * (1 - 2 * pad)
-                    usable_h = map_h * (1 - 2 * pad)
+                    # Fit the (unrotated) track bounds into the map area; the
+                    # outlines and DRS zones are rebuilt only when the area changes
+                    map_key = (map_left, map_bottom, map_w, map_h)
+                    if map_key != self._map_key:
+                        self._map_key = map_key
+                        self._build_map_shapes(map_left, map_bottom, map_w, map_h)
+                    map_transform = self._map_transform
+                    world_to_map = map_transform.apply_point
 
-                    scale_x = usable_w / world_w
-                    scale_y = usable_h / world_h
-                    world_scale = min(scale_x, scale_y)
-
-                    world_cx = (world_x_min + world_x_max) / 2
-                    world_cy = (world_y_min + world_y_max) / 2
-
-                    screen_cx = map_left + map_w / 2
-                    screen_cy = map_bottom + map_h / 2
-
-                    tx = screen_cx - world_scale * world_cx
-                    ty = screen_cy - world_scale * world_cy
-
-                    def world_to_map(x, y):
-                        sx = world_scale * x + tx
-                        sy = world_scale * y + ty
-                        return sx, sy
-
-                    # Use the interpolated world points if available, fallback to raw arrays
-                    inner_world = getattr(self, "world_inner_points", None) or list(zip(self.x_inner, self.y_inner))
-                    outer_world = getattr(self, "world_outer_points", None) or list(zip(self.x_outer, self.y_outer))
-
-                    self.inner_pts = [world_to_map(x, y) for x, y in inner_world if x is not None and y is not None]
-                    self.outer_pts = [world_to_map(x, y) for x, y in outer_world if x is not None and y is not None]
                     try:
-                        if len(self.inner_pts) > 1:
-                            arcade.draw_line_strip(self.inner_pts, arcade.color.GRAY, 2)
-                        if len(self.outer_pts) > 1:
-                            arcade.draw_line_strip(self.outer_pts, arcade.color.GRAY, 2)
+                        self._map_track_shapes.draw()
                         draw_finish_line(self, 'Q')
                     except Exception as e:
                         print("Circuit draw error:", e)
 
-                    # Draw the comparison driver's position (if available - doing this first so that the current driver is on top visually)
-
-                    if comparison_telemetry and self.frame_index < len(comparison_telemetry):
-                        comp_frame = comparison_telemetry[self.frame_index]
-                        comp_tel = comp_frame.get("telemetry", {}) if isinstance(comp_frame.get("telemetry", {}), dict) else {}
-                        c_px = comp_tel.get("x")
-                        c_py = comp_tel.get("y")
-                        c_sx, c_sy = world_to_map(c_px, c_py)
-                        arcade.draw_circle_filled(c_sx, c_sy, 6, arcade.color.YELLOW)
+                    # Draw the compared laps' positions after the same lap time (doing this first so that the current driver is on top visually),
+                    # with a key listing each lap and its running time delta to the loaded lap
+                    if comparison_rows:
+                        comparison_xs = comparison.sample("x", comparison_index)
+                        comparison_ys = comparison.sample("y", comparison_index)
+                        for k, (row, (code, segment)) in enumerate(comparison_rows):
+                            color = self._driver_color(code, arcade.color.YELLOW)
+                            c_sx, c_sy = world_to_map(comparison_xs[row], comparison_ys[row])
+                            arcade.draw_circle_filled(c_sx, c_sy, 6, color)
+
+                            key_x = map_right - 170
+                            key_y = map_top - 16 - k * 18
+                            arcade.draw_rect_filled(arcade.XYWH(key_x + 6, key_y, 12, 3), color)
+                            self.texts.draw(
+                                ("comparison_key", k), f"{code} {segment}  {comparison_delta[row]:+.3f}s",
+                                key_x + 18, key_y,
+                                arcade.color.ANTI_FLASH_WHITE, 12,
+                                anchor_y="center"
+                            )
 
                     # Draw DRS zones on track map as green highlights
-                    if self.drs_zones_xy and self.toggle_drs_zones:
-                        drs_color = (0, 255, 0)
-                        original_length = len(self.x_inner)
-                        # Interpolated world points length
-                        interpolated_length = len(inner_world)
-                        
-                        for dz in self.drs_zones_xy:
-                            orig_start_idx = dz["start"]["index"]
-                            orig_end_idx = dz["end"]["index"]
-
-                            if orig_start_idx is None or orig_end_idx is None:
-                                continue
-                            try:
-                                # Map original indices to interpolated array indices
-                                interp_start_idx = int((orig_start_idx / original_length) * interpolated_length)
-                                interp_end_idx = int((orig_end_idx / original_length) * interpolated_length)
-                                
-                                # Clamp to valid range
-                                interp_start_idx = max(0, min(interp_start_idx, interpolated_length - 1))
-                                interp_end_idx = max(0, min(interp_end_idx, interpolated_length - 1))
-                                
-                                if interp_start_idx < interp_end_idx:
-                                    # Extract segments for this DRS zone using mapped indices
-                                    outer_zone = [world_to_map(x, y) for x, y in outer_world[interp_start_idx:interp_end_idx+1] 
-                                                  if x is not None and y is not None]
-                                    if len(outer_zone) > 1:
-                                        arcade.draw_line_strip(outer_zone, drs_color, 3)
-
-                            except Exception as e:
-                                print(f"DRS zone draw error: {e}")
+                    if self.toggle_drs_zones:
+                        self._map_drs_shapes.draw()
 
                     # Draw current driver's position marker (sync with frame_index)
-                    current_frame = frames[self.frame_index]
-                    tel = current_frame.get("telemetry", {}) if isinstance(current_frame.get("telemetry", {}), dict) else {}
-                    px = tel.get("x")
-                    py = tel.get("y")
+                    px = self._xs[self.frame_index]
+                    py = self._ys[self.frame_index]
                     sx, sy = world_to_map(px, py)
                     # driver colour lookup (fallback to white)
-                    drv_color = (255, 255, 255)
-                    if getattr(self, "loaded_driver_code", None):
-                        for r in self.data.get("results", []):
-                            if r.get("code") == self.loaded_driver_code and r.get("color"):
-                                drv_color = tuple(r.get("color"))
-                                break
+                    drv_color = self._driver_color(self.loaded_driver_code, (255, 255, 255))
                     arcade.draw_circle_filled(sx, sy, 6, drv_color)
 
                     # Overlay current gear near the position marker on the track
-                    cur_gear = tel.get("gear") or tel.get("nGear") or tel.get("Gear")
-                    if cur_gear is None:
-                        cur_gear = draw_gears[-1] if draw_gears else None
-                    arcade.Text(self.loaded_driver_code or "", sx + 10, sy + 4, arcade.color.WHITE, 12).draw()
-                    if cur_gear is not None:
-                        arcade.Text(f"G:{int(cur_gear)}", sx + 10, sy - 10, arcade.color.LIGHT_GRAY, 12).draw()
+                    cur_gear = lap["gear"][self.frame_index]
+                    self.texts.draw("map_driver", self.loaded_driver_code or "", sx + 10, sy + 4, arcade.color.WHITE, 12)
+                    self.texts.draw("map_gear", f"G:{int(cur_gear)}", sx + 10, sy - 10, arcade.color.LIGHT_GRAY, 12)
 
             # Controls Legend - Bottom Left (keeps small offset from left UI edge)
             legend_x = max(12, self.left_ui_margin - 320) if hasattr(self, "left_ui_margin") else 20
-            legend_y = 180 # Height of legend block
+            legend_y = 205 # Height of legend block
             legend_icons = self.legend_comp._control_icons_textures # icons
             legend_lines = [
                 ("Controls:"),
@@ -674,6 +507,7 @@ class QualifyingReplay(arcade.Window):
                 ("[R]       Restart"),
                 ("[D]       Toggle DRS zones on track map"),
                 ("[C]       Toggle comparison driver telemetry"),
+                ("[A]       Pin/unpin lap for comparison"),
                 ("[ESC]    Close Window")
             ]
             for i, lines in enumerate(legend_lines):
@@ -700,32 +534,32 @@ class QualifyingReplay(arcade.Window):
                 # Draw brackets if any
                 if brackets:
                     for j in range(len(brackets)):
-                        arcade.Text(
-                            brackets[j],
+                        self.texts.draw(
+                            ("legend_bracket", i, j), brackets[j],
                             legend_x + (j * (icon_size + 5)),
                             legend_y - (i * 25),
                             arcade.color.LIGHT_GRAY if i > 0 else arcade.color.WHITE,
                             14,
-                        ).draw()
+                        )
                 # Draw the text line
-                arcade.Text(
-                    line,
+                self.texts.draw(
+                    ("legend_line", i), line,
                     legend_x + (60 if icon_keys else 0),
                     legend_y - (i * 25),
                     arcade.color.LIGHT_GRAY if i > 0 else arcade.color.WHITE,
                     14,
                     bold=(i == 0),
-                ).draw()
+                )
         else:
             # Add "click a driver to view their qualifying lap" text in the center of the chart area
 
             info_text = "Click a driver on the left to load their qualifying lap telemetry."
-            arcade.Text(
-                info_text,
+            self.texts.draw(
+                "info", info_text,
                 self.width / 2, self.height / 2,
                 arcade.color.LIGHT_GRAY, 18,
                 anchor_x="center", anchor_y="center"
-            ).draw()
+            )
 
         self.leaderboard.draw(self)
         self.qualifying_segment_selector_modal.draw(self)
@@ -736,48 +570,26 @@ class QualifyingReplay(arcade.Window):
 
     def on_mouse_motion(self, x: int, y: int, dx: int, dy: int):
         """Pass mouse motion events to UI components."""
-        self.race_controls_comp.on_mouse_motion(self, x, y, dx, dy)
+        if self.race_controls_comp.on_mouse_motion(self, x, y, dx, dy):
+            self.invalidate()
     
     def on_resize(self, width: int, height: int):
         """Handle the window being resized."""
         super().on_resize(width, height)
+        self.invalidate()
         self.update_scaling(width, height)
         self.race_controls_comp.on_resize(self)
 
     def _interpolate_points(self, xs, ys, interp_points=2000):
         t_old = np.linspace(0, 1, len(xs))
         t_new = np.linspace(0, 1, interp_points)
-        xs_i = np.interp(t_new, t_old, xs)
-        ys_i = np.interp(t_new, t_old, ys)
-        return list(zip(xs_i, ys_i))
+        return np.interp(t_new, t_old, xs), np.interp(t_new, t_old, ys)
 
     def world_to_screen(self, x, y):
-        # Rotate around the track centre (if rotation is set), then scale+translate
-        world_cx = (self.x_min + self.x_max) / 2
-        world_cy = (self.y_min + self.y_max) / 2
-
-        if self._rot_rad:
-            tx = x - world_cx
-            ty = y - world_cy
-            rx = tx * self._cos_rot - ty * self._sin_rot
-            ry = tx * self._sin_rot + ty * self._cos_rot
-            x, y = rx + world_cx, ry + world_cy
-
-        sx = self.world_scale * x + self.tx
-        sy = self.world_scale * y + self.ty
-        return sx, sy
-
-    def _pick_telemetry_value(self, tel: dict, *keys):
-        """Return the first value for keys that exists in tel and is not None.
-        Preserves falsy-but-valid values like 0.0."""
-        if not isinstance(tel, dict):
-            return None
-        for k in keys:
-            if k in tel and tel[k] is not None:
-                return tel[k]
-        return None
+        return self.transform.apply_point(x, y)
 
     def on_mouse_press(self, x: float, y: float, button: int, modifiers: int):
+        self.invalidate()
         # If the segment-selector modal is visible (a driver selected), give it first chance
         # to handle the click (so its close button can work). If it handled the click,
         # stop further processing so the leaderboard doesn't re-select the driver.
@@ -801,6 +613,7 @@ class QualifyingReplay(arcade.Window):
         return self.chart_active and self.n_frames > 0 and self.frame_index >= self.n_frames - 1
 
     def on_key_press(self, symbol: int, modifiers: int):
+        self.invalidate()
         # Allow ESC to close window at any time
         if symbol == arcade.key.ESCAPE:
             arcade.close_window()
@@ -821,6 +634,10 @@ class QualifyingReplay(arcade.Window):
             # Toggle DRS zones on track map
             self.toggle_drs_zones = not self.toggle_drs_zones
             return
+        elif symbol == arcade.key.A:
+            # Pin the loaded lap so it stays overlaid when another lap is loaded
+            self.toggle_pinned_lap()
+            return
         
         # Disable other controls when lap is complete
         if self.is_lap_complete():
@@ -873,41 +690,7 @@ class QualifyingReplay(arcade.Window):
                 seg = driver_block.get(segment_name)
                 if seg and isinstance(seg, dict) and seg.get("frames"):
                     # Use local telemetry immediately (no background fetch required)
-                    self.loaded_telemetry = seg
-                    self.loaded_driver_code = driver_code
-                    self.loaded_driver_segment = segment_name
-                    self.chart_active = True
-                    # cache arrays for fast access and search
-                    frames = seg.get("frames", [])
-                    drs_zones = seg.get("drs_zones", [])
-                    times = [float(f.get("t")) for f in frames if f.get("t") is not None]
-                    xs = [ (f.get("telemetry") or {}).get("x") for f in frames ]
-                    ys = [ (f.get("telemetry") or {}).get("y") for f in frames ]
-                    speeds = [ (f.get("telemetry") or {}).get("speed") for f in frames ]
-                    # convert to numpy arrays (keep None if any; searchsorted expects numeric times)
-                    self._times = np.array(times) if times else None
-                    self._xs = np.array(xs) if xs else None
-                    self._ys = np.array(ys) if ys else None
-                    self._speeds = np.array([float(s) for s in speeds if s is not None]) if speeds else None
-                    # populate top-level frames/n_frames and min/max speeds for chart scaling
-                    self.frames = frames
-                    self.drs_zones = drs_zones
-                    self.n_frames = len(frames)
-                    if self._speeds is not None and self._speeds.size > 0:
-                        self.min_speed = float(np.min(self._speeds))
-                        self.max_speed = float(np.max(self._speeds))
-                    else:
-                        self.min_speed = 0.0
-                        self.max_speed = 0.0
-                     # initialize playback state based on frames' timestamps
-                    frames = seg.get("frames", [])
-                    if frames:
-                        start_t = frames[0].get("t", 0.0)
-                        self.play_start_t = float(start_t)
-                        self.play_time = float(start_t)
-                        self.frame_index = 0
-                        self.paused = False
-                        self.playback_speed = 1.0
+                    self._bind_loaded_telemetry(seg, driver_code, segment_name)
                     self.loading_telemetry = False
                     self.loading_message = ""
                     return
@@ -924,6 +707,176 @@ class QualifyingReplay(arcade.Window):
             daemon=True
         ).start()
 
+    def _bind_loaded_telemetry(self, telemetry: dict, driver_code: str, segment_name: str):
+        """
+        Make a lap the loaded telemetry: bind its channel arrays, compute the
+        chart axis ranges once and restart playback from its first frame.
+        """
+        frames = telemetry.get("frames")
+        if not isinstance(frames, LapFrames):
+            frames = LapFrames.from_frame_dicts(frames or [])
+        lap = frames.telemetry
+
+        def _range(values):
+            values = values[np.isfinite(values)]
+            return (float(values.min()), float(values.max())) if values.size else (0.0, 0.0)
+
+        self._times = frames.t if len(frames) else None
+        self._xs = lap["x"]
+        self._ys = lap["y"]
+        self._speeds = lap["speed"]
+        self.min_speed, self.max_speed = _range(self._speeds)
+        self._rel_dist_range = _range(lap["rel_dist"])
+        self._dist_range = _range(lap["dist"])
+        self.drs_zones = telemetry.get("drs_zones", [])
+        self.frames = frames
+        self.n_frames = len(frames)
+
+        # initialize playback state based on frames' timestamps
+        if len(frames):
+            self.play_start_t = float(frames.t[0])
+            self.play_time = self.play_start_t
+            self.frame_index = 0
+            self.paused = False
+            self.playback_speed = 1.0
+
+        # Set last, so a draw while the loader thread is still binding the
+        # lap never sees a half-bound one
+        self.loaded_telemetry = {**telemetry, "frames": frames}
+        self.loaded_driver_code = driver_code
+        self.loaded_driver_segment = segment_name
+        self.chart_active = True
+
+    def _driver_color(self, code, default):
+        for r in self.data.get("results", []):
+            if r.get("code") == code and r.get("color"):
+                return tuple(r.get("color"))
+        return default
+
+    def toggle_pinned_lap(self):
+        """Pin the loaded lap for the comparison overlay, or unpin it if already pinned."""
+        if not self.chart_active or self.loaded_driver_code is None:
+            return
+        key = (self.loaded_driver_code, self.loaded_driver_segment)
+        if key in self.pinned_laps:
+            self.pinned_laps.remove(key)
+        elif len(self.pinned_laps) < MAX_COMPARISON_LAPS:
+            self.pinned_laps.append(key)
+
+    def _comparison_laps(self, fastest_driver):
+        """(code, segment) of the laps to overlay: the pole lap (Q3) and the pinned laps, minus the loaded lap."""
+        if not self.show_comparison_telemetry:
+            return []
+        candidates = ([(fastest_driver.get("code"), "Q3")] if fastest_driver else []) + self.pinned_laps
+        telemetry = self.data.get("telemetry", {})
+
+        laps = []
+        for code, segment in candidates:
+            if (code, segment) == (self.loaded_driver_code, self.loaded_driver_segment) or (code, segment) in laps:
+                continue
+            frames = (telemetry.get(code) or {}).get(segment, {}).get("frames")
+            if isinstance(frames, LapFrames) and len(frames) > 1:
+                laps.append((code, segment))
+        return laps[:MAX_COMPARISON_LAPS]
+
+    def _comparison_for(self, laps):
+        """
+        LapComparison of the loaded lap (the reference) and ``laps``, built
+        once per selection and reused until the selection changes.
+        """
+        if not laps or self.frames is None or len(self.frames) < 2:
+            return None
+        reference = (self.loaded_driver_code, self.loaded_driver_segment)
+        key = (reference, tuple(laps))
+        if key != self._lap_comparison_key:
+            telemetry = self.data.get("telemetry", {})
+            self._lap_comparison = LapComparison(
+                {reference: self.frames, **{(code, segment): telemetry[code][segment]["frames"] for code, segment in laps}},
+                reference,
+            )
+            self._lap_comparison_key = key
+        return self._lap_comparison
+
+    def _build_map_shapes(self, map_left, map_bottom, map_w, map_h):
+        """Circuit map outlines and DRS zones for the map area, as shape lists."""
+        self._map_transform = ScreenTransform.fit(
+            [self.x_min, self.x_max], [self.y_min, self.y_max],
+            map_left, map_bottom, map_w, map_h, padding=0.06,
+        )
+        inner_world = self.world_inner_points
+        outer_world = self.world_outer_points
+
+        self.inner_pts = self._map_transform.apply_points(*inner_world)
+        self.outer_pts = self._map_transform.apply_points(*outer_world)
+        self._map_track_shapes = ShapeElementList()
+        if len(self.inner_pts) > 1:
+            self._map_track_shapes.append(create_line_strip(self.inner_pts, arcade.color.GRAY, 2))
+        if len(self.outer_pts) > 1:
+            self._map_track_shapes.append(create_line_strip(self.outer_pts, arcade.color.GRAY, 2))
+
+        self._map_drs_shapes = ShapeElementList()
+        drs_color = (0, 255, 0)
+        original_length = len(self.x_inner)
+        # Interpolated world points length
+        interpolated_length = len(inner_world[0])
+
+        for dz in self.drs_zones_xy or []:
+            orig_start_idx = dz["start"]["index"]
+            orig_end_idx = dz["end"]["index"]
+
+            if orig_start_idx is None or orig_end_idx is None:
+                continue
+            try:
+                # Map original indices to interpolated array indices
+                interp_start_idx = int((orig_start_idx / original_length) * interpolated_length)
+                interp_end_idx = int((orig_end_idx / original_length) * interpolated_length)
+
+                # Clamp to valid range
+                interp_start_idx = max(0, min(interp_start_idx, interpolated_length - 1))
+                interp_end_idx = max(0, min(interp_end_idx, interpolated_length - 1))
+
+                if interp_start_idx < interp_end_idx:
+                    # Extract segments for this DRS zone using mapped indices
+                    zone = slice(interp_start_idx, interp_end_idx + 1)
+                    outer_zone = self._map_transform.apply_points(outer_world[0][zone], outer_world[1][zone])
+                    if len(outer_zone) > 1:
+                        self._map_drs_shapes.append(create_line_strip(outer_zone, drs_color, 3))
+
+            except Exception as e:
+                print(f"DRS zone draw error: {e}")
+
+    def _build_chart_traces(self, lap: dict, chart_points, traces) -> ShapeElementList:
+        """Full-lap polylines for the given (channel, axis, colour) traces, in screen space."""
+        shapes = ShapeElementList()
+        for channel, axis, color in traces:
+            points = chart_points(lap["rel_dist"], lap[channel], *axis)
+            if len(points) > 1:
+                shapes.append(create_line_strip(points, color, 2))
+        return shapes
+
+    def _draw_trace_prefix(self, traces: ShapeElementList, chart_left: float, current_x: float):
+        """
+        Draw the part of the traces up to the current point. The x-axis is
+        the distance along the lap, so the lap so far is everything left of
+        the current x: a scissor box clips the full-lap traces to it.
+        """
+        ratio = self.get_pixel_ratio()
+        # One pixel either side for the line width
+        left = chart_left - 1
+        width = max(0.0, current_x + 1 - left)
+        self.ctx.scissor = (int(left * ratio), 0, int(np.ceil(width * ratio)), int(self.height * ratio))
+        try:
+            traces.draw()
+        finally:
+            self.ctx.scissor = None
+
+    def _bind_lap_frames(self, data: dict):
+        """Older cache entries hold lists of frame dicts; convert them to LapFrames once."""
+        for driver_block in (data.get("telemetry") or {}).values():
+            for segment in driver_block.values():
+                if isinstance(segment, dict) and isinstance(segment.get("frames"), list) and segment["frames"]:
+                    segment["frames"] = LapFrames.from_frame_dicts(segment["frames"])
+
     def _bg_load_telemetry(self, driver_code: str, segment_name: str):
         """Background loader that fetches telemetry if not present locally."""
         try:
@@ -939,7 +892,14 @@ class QualifyingReplay(arcade.Window):
 
             # If not found locally, attempt to fetch via API if a session is available
             if telemetry is None and getattr(self, "session", None) is not None:
-                telemetry = get_driver_quali_telemetry(self.session, driver_code, segment_name)
+                # Segment split and fastest-lap picks are shared by every fetch
+                if self._fastest_laps is None:
+                    self._fastest_laps = get_quali_fastest_laps(self.session)
+                telemetry = get_driver_quali_telemetry(self.session, driver_code, segment_name, fps=self.fps, fastest_laps=self._fastest_laps)
+                # Keep the fetched lap in the store so it can be reloaded and
+                # pinned for the comparison overlay like the precomputed laps
+                if isinstance(telemetry.get("frames"), LapFrames) and len(telemetry["frames"]):
+                    self.data.setdefault("telemetry", {}).setdefault(driver_code, {})[segment_name] = telemetry
             elif telemetry is None:
                 # demo fallback: sleep briefly and leave telemetry None
                 time.sleep(1.0)
@@ -949,37 +909,7 @@ class QualifyingReplay(arcade.Window):
                 self.loaded_telemetry = None
                 self.chart_active = False
             else:
-                self.loaded_telemetry = telemetry
-                self.loaded_driver_code = driver_code
-                self.loaded_driver_segment = segment_name
-                self.chart_active = True
-                # cache arrays for fast indexing/interpolation
-                frames = telemetry.get("frames", [])
-                times = [float(f.get("t")) for f in frames if f.get("t") is not None]
-                xs = [ (f.get("telemetry") or {}).get("x") for f in frames ]
-                ys = [ (f.get("telemetry") or {}).get("y") for f in frames ]
-                speeds = [ (f.get("telemetry") or {}).get("speed") for f in frames ]
-                self._times = np.array(times) if times else None
-                self._xs = np.array(xs) if xs else None
-                self._ys = np.array(ys) if ys else None
-                self._speeds = np.array([float(s) for s in speeds if s is not None]) if speeds else None
-                self.frames = frames
-                self.n_frames = len(frames)
-                if self._speeds is not None and self._speeds.size > 0:
-                    self.min_speed = float(np.min(self._speeds))
-                    self.max_speed = float(np.max(self._speeds))
-                else:
-                    self.min_speed = 0.0
-                    self.max_speed = 0.0
-                # initialize playback state for the newly loaded telemetry
-                frames = telemetry.get("frames", [])
-                if frames:
-                    start_t = frames[0].get("t", 0.0)
-                    self.play_start_t = float(start_t)
-                    self.play_time = float(start_t)
-                    self.frame_index = 0
-                    self.paused = False
-                    self.playback_speed = 1.0
+                self._bind_loaded_telemetry(telemetry, driver_code, segment_name)
         except Exception as e:
             print("Telemetry load failed:", e)
             self.loaded_telemetry = None
@@ -989,8 +919,23 @@ class QualifyingReplay(arcade.Window):
             self.loading_message = ""
 
     def on_update(self, delta_time: float):
+        self._update_playback(delta_time)
+
+        # Telemetry is loaded on a background thread, so compare what the
+        # view shows with the last tick rather than hooking every setter
+        view_state = (self.frame_index, self.n_frames, self.chart_active,
+                      self.loading_telemetry, self.loaded_telemetry is not None)
+        if view_state != self._view_state:
+            self._view_state = view_state
+            self.invalidate()
+
+    def _update_playback(self, delta_time: float):
         if not self.chart_active or self.loaded_telemetry is None:
             return
+        # Keep redrawing while a button flash or sector delta is on screen
+        # (including the tick it disappears)
+        if self.race_controls_comp.animating or self.qualifying_lap_time_comp.animating:
+            self.invalidate()
         self.race_controls_comp.on_update(delta_time)
         self.qualifying_lap_time_comp.on_update(delta_time)
 
@@ -1021,14 +966,15 @@ class QualifyingReplay(arcade.Window):
             if self.frame_index >= self.n_frames - 1:
                 self.paused = True
         else:
-            # fallback: step frame index at FPS if no timestamps available
-            self.frame_index = int(min(self.n_frames - 1, self.frame_index + int(round(delta_time * FPS * self.playback_speed))))
+            # fallback: step frame index at the stored rate if no timestamps available
+            self.frame_index = int(min(self.n_frames - 1, self.frame_index + int(round(delta_time * self.fps * self.playback_speed))))
 
             # Auto-pause when lap completes to prevent errors
             if self.frame_index >= self.n_frames - 1:
                 self.paused = True
 
     def on_key_release(self, symbol: int, modifiers: int):
+        self.invalidate()
         if symbol == arcade.key.RIGHT:
             self.is_forwarding = False
             self.paused = self.was_paused_before_hold
@@ -1037,6 +983,7 @@ class QualifyingReplay(arcade.Window):
             self.paused = self.was_paused_before_hold
 
     def on_mouse_release(self, x: float, y: float, button: int, modifiers: int):
+        self.invalidate()
         if self.is_forwarding or self.is_rewinding:
             self.is_forwarding = False
             self.is_rewinding = False
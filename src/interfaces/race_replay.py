@@ -1,7 +1,6 @@
 import os
 import arcade
 import numpy as np
-from src.f1_data import FPS
 from src.ui_components import (
     LeaderboardComponent, 
     WeatherComponent, 
@@ -11,10 +10,15 @@ from src.ui_components import (
     RaceControlsComponent,
     ControlsPopupComponent,
     SessionInfoComponent,
-    extract_race_events,
+    flag_events,
     build_track_from_example_lap,
-    draw_finish_line
+    create_finish_line_shapes,
+    TextPool
 )
+from arcade.shape_list import ShapeElementList, create_line_strip
+from src.lib.transform import ScreenTransform
+from src.lib.projection import TrackProjection
+from src.lib.track_status import TrackStatusIndex
 
 
 SCREEN_WIDTH = 1280
@@ -22,11 +26,29 @@ SCREEN_HEIGHT = 720
 SCREEN_TITLE = "F1 Race Replay"
 PLAYBACK_SPEEDS = [0.1, 0.2, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0, 256.0]
 
+# Map track status -> colour (R,G,B)
+STATUS_COLORS = {
+    "GREEN": (150, 150, 150),    # normal grey
+    "YELLOW": (220, 180,   0),   # caution
+    "RED": (200,  30,  30),      # red-flag
+    "VSC": (200, 130,  50),      # virtual safety car / amber-brown
+    "SC": (180, 100,  30),       # safety car (darker brown)
+}
+# HUD banner text and colour per track status code
+STATUS_LABELS = {
+    "2": ("YELLOW FLAG", arcade.color.YELLOW),
+    "5": ("RED FLAG", arcade.color.RED),
+    "6": ("VIRTUAL SAFETY CAR", arcade.color.ORANGE),
+    "4": ("SAFETY CAR", arcade.color.BROWN),
+}
+DRS_COLOR = (0, 255, 0)  # Bright green for DRS zones
+CAR_RADIUS = 6
+
 class F1RaceReplayWindow(arcade.Window):
     def __init__(self, frames, track_statuses, example_lap, drivers, title,
                  playback_speed=1.0, driver_colors=None, circuit_rotation=0.0,
                  left_ui_margin=340, right_ui_margin=260, total_laps=None, visible_hud=True,
-                 session_info=None):
+                 session_info=None, race_events=None):
         # Set resizable to True so the user can adjust mid-sim
         super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, title, resizable=True)
         self.maximize()
@@ -40,14 +62,11 @@ class F1RaceReplayWindow(arcade.Window):
         self.frame_index = 0.0  # use float for fractional-frame accumulation
         self.paused = False
         self.total_laps = total_laps
-        self.has_weather = any("weather" in frame for frame in frames) if frames else False
+        self.has_weather = frames.has_weather
         self.visible_hud = visible_hud # If it displays HUD or not (leaderboard, controls, weather, etc)
 
         # Rotation (degrees) to apply to the whole circuit around its centre
         self.circuit_rotation = circuit_rotation
-        self._rot_rad = float(np.deg2rad(self.circuit_rotation)) if self.circuit_rotation else 0.0
-        self._cos_rot = float(np.cos(self._rot_rad))
-        self._sin_rot = float(np.sin(self._rot_rad))
         self.finished_drivers = []
         self.left_ui_margin = left_ui_margin
         self.right_ui_margin = right_ui_margin
@@ -98,12 +117,16 @@ class F1RaceReplayWindow(arcade.Window):
         self.is_forwarding = False
         self.was_paused_before_hold = False
         
-        # Extract race events for the progress bar
-        race_events = extract_race_events(frames, track_statuses, total_laps or 0)
+        # Track status periods as sorted intervals (in seconds and frames),
+        # shared by the track colour, the HUD banner and the progress bar
+        self.track_status_index = TrackStatusIndex(track_statuses, frames.t)
+
+        # Progress bar markers: the race events found by the pipeline plus the flag periods
         self.progress_bar_comp.set_race_data(
             total_frames=len(frames),
             total_laps=total_laps or 0,
-            events=race_events
+            events=list(race_events or []) + flag_events(self.track_status_index),
+            lap_frames=frames.lap_start_frames(total_laps)
         )
 
         # Build track geometry (Raw World Coordinates)
@@ -114,46 +137,34 @@ class F1RaceReplayWindow(arcade.Window):
          self.y_min, self.y_max, self.drs_zones) = build_track_from_example_lap(example_lap)
 
         # Build a dense reference polyline (used for projecting car (x,y) -> along-track distance)
-        ref_points = self._interpolate_points(self.plot_x_ref, self.plot_y_ref, interp_points=4000)
-        # store as numpy arrays for vectorized ops
-        self._ref_xs = np.array([p[0] for p in ref_points])
-        self._ref_ys = np.array([p[1] for p in ref_points])
-
-        # Calculate normals for the reference line
-        dx = np.gradient(self._ref_xs)
-        dy = np.gradient(self._ref_ys)
-        norm = np.sqrt(dx**2 + dy**2)
-        norm[norm == 0] = 1.0
-        self._ref_nx = -dy / norm
-        self._ref_ny = dx / norm
-
-        # Determine track winding using the shoelace formula to ensure normals point outwards.
-        # A positive area indicates counter-clockwise winding (normals point Left=Inside, so we flip).
-        # A negative area indicates clockwise winding (normals point Left=Outside, so we keep).
-        signed_area = np.sum(self._ref_xs[:-1] * self._ref_ys[1:] - self._ref_xs[1:] * self._ref_ys[:-1])
-        signed_area += (self._ref_xs[-1] * self._ref_ys[0] - self._ref_xs[0] * self._ref_ys[-1])
-        if signed_area > 0:
-            self._ref_nx = -self._ref_nx
-            self._ref_ny = -self._ref_ny
-
-        # cumulative distances along the reference polyline (metres)
-        diffs = np.sqrt(np.diff(self._ref_xs)**2 + np.diff(self._ref_ys)**2)
-        self._ref_seg_len = diffs
-        self._ref_cumdist = np.concatenate(([0.0], np.cumsum(diffs)))
-        self._ref_total_length = float(self._ref_cumdist[-1]) if len(self._ref_cumdist) > 0 else 0.0
+        # and index it once, so all cars are projected in one call per frame
+        self.track_projection = TrackProjection(
+            *self._interpolate_points(self.plot_x_ref, self.plot_y_ref, interp_points=4000)
+        )
 
         # Pre-calculate interpolated world points ONCE (optimization)
         self.world_inner_points = self._interpolate_points(self.x_inner, self.y_inner)
         self.world_outer_points = self._interpolate_points(self.x_outer, self.y_outer)
 
+        # World -> screen mapping for the track area, refitted in update_scaling
+        self.transform = ScreenTransform()
+
         # These will hold the actual screen coordinates to draw
         self.screen_inner_points = []
         self.screen_outer_points = []
-        
-        # Scaling parameters (initialized to 0, calculated in update_scaling)
-        self.world_scale = 1.0
-        self.tx = 0
-        self.ty = 0
+
+        # Retained-mode render layers: the geometry is uploaded to the GPU once
+        # and redrawn with a single call per frame. They are rebuilt lazily
+        # after a resize (update_scaling clears them) and, for the track
+        # edges, when the track status colour changes.
+        self._track_shapes = None
+        self._track_shapes_color = None
+        self._drs_shapes = None
+        self._finish_line_shapes = None
+
+        # One sprite per car, moved every frame and drawn as a single batch
+        self.car_sprites = arcade.SpriteList()
+        self._car_sprite_by_code = {}
 
         # Load Background
         bg_path = os.path.join("resources", "background.png")
@@ -165,6 +176,7 @@ class F1RaceReplayWindow(arcade.Window):
         self.lap_text = arcade.Text("", 20, self.height - 40, arcade.color.WHITE, 24, anchor_y="top")
         self.time_text = arcade.Text("", 20, self.height - 80, arcade.color.WHITE, 20, anchor_y="top")
         self.status_text = arcade.Text("", 20, self.height - 120, arcade.color.WHITE, 24, bold=True, anchor_y="top")
+        self.label_texts = TextPool()  # driver labels on track, one slot per driver
 
         # Trigger initial scaling calculation
         self.update_scaling(self.width, self.height)
@@ -173,103 +185,106 @@ class F1RaceReplayWindow(arcade.Window):
         self.selected_driver = None
         self.leaderboard_rects = []  # list of tuples: (code, left, bottom, right, top)
 
+        # Redraw on demand: input, hover changes, resizes and playback mark
+        # the window dirty, and clean ticks skip drawing altogether
+        self._needs_redraw = True
+
     def _interpolate_points(self, xs, ys, interp_points=2000):
         t_old = np.linspace(0, 1, len(xs))
         t_new = np.linspace(0, 1, interp_points)
-        xs_i = np.interp(t_new, t_old, xs)
-        ys_i = np.interp(t_new, t_old, ys)
-        return list(zip(xs_i, ys_i))
-
-    def _project_to_reference(self, x, y):
-        if self._ref_total_length == 0.0:
-            return 0.0
-
-        # Vectorized nearest-point to dense polyline points (sufficient for our purposes)
-        dx = self._ref_xs - x
-        dy = self._ref_ys - y
-        d2 = dx * dx + dy * dy
-        idx = int(np.argmin(d2))
-
-        # For a slightly better estimate, optionally project onto the adjacent segment
-        if idx < len(self._ref_xs) - 1:
-            x1, y1 = self._ref_xs[idx], self._ref_ys[idx]
-            x2, y2 = self._ref_xs[idx+1], self._ref_ys[idx+1]
-            vx, vy = x2 - x1, y2 - y1
-            seg_len2 = vx*vx + vy*vy
-            if seg_len2 > 0:
-                t = ((x - x1) * vx + (y - y1) * vy) / seg_len2
-                t_clamped = max(0.0, min(1.0, t))
-                proj_x = x1 + t_clamped * vx
-                proj_y = y1 + t_clamped * vy
-                # distance along segment from x1,y1
-                seg_dist = np.sqrt((proj_x - x1)**2 + (proj_y - y1)**2)
-                return float(self._ref_cumdist[idx] + seg_dist)
-
-        # Fallback: return the cumulative distance at the closest dense sample
-        return float(self._ref_cumdist[idx])
+        return np.interp(t_new, t_old, xs), np.interp(t_new, t_old, ys)
 
     def update_scaling(self, screen_w, screen_h):
         """
         Recalculates the scale and translation to fit the track 
         perfectly within the new screen dimensions while maintaining aspect ratio.
         """
-        padding = 0.05
-        # If a rotation is applied, we must compute the rotated bounds
-        world_cx = (self.x_min + self.x_max) / 2
-        world_cy = (self.y_min + self.y_max) / 2
-
-        def _rotate_about_center(x, y):
-            # Translate to centre, rotate, translate back
-            tx = x - world_cx
-            ty = y - world_cy
-            rx = tx * self._cos_rot - ty * self._sin_rot
-            ry = tx * self._sin_rot + ty * self._cos_rot
-            return rx + world_cx, ry + world_cy
-
-        # Build rotated extents from inner/outer world points
-        rotated_points = []
-        for x, y in self.world_inner_points:
-            rotated_points.append(_rotate_about_center(x, y))
-        for x, y in self.world_outer_points:
-            rotated_points.append(_rotate_about_center(x, y))
-
-        xs = [p[0] for p in rotated_points]
-        ys = [p[1] for p in rotated_points]
-        world_x_min = min(xs) if xs else self.x_min
-        world_x_max = max(xs) if xs else self.x_max
-        world_y_min = min(ys) if ys else self.y_min
-        world_y_max = max(ys) if ys else self.y_max
-
-        world_w = max(1.0, world_x_max - world_x_min)
-        world_h = max(1.0, world_y_max - world_y_min)
-        
         # Reserve left/right UI margins before applying padding so the track
         # never overlaps side UI elements (leaderboard, telemetry, legends).
         inner_w = max(1.0, screen_w - self.left_ui_margin - self.right_ui_margin)
-        usable_w = inner_w * (1 - 2 * padding)
-        usable_h = screen_h * (1 - 2 * padding)
 
-        # Calculate scale to fit whichever dimension is the limiting factor
-        scale_x = usable_w / world_w
-        scale_y = usable_h / world_h
-        self.world_scale = min(scale_x, scale_y)
+        # Fit the rotated track outline into the inner area, rotating about
+        # the centre of the unrotated bounds
+        world_xs = np.concatenate((self.world_inner_points[0], self.world_outer_points[0]))
+        world_ys = np.concatenate((self.world_inner_points[1], self.world_outer_points[1]))
+        self.transform = ScreenTransform.fit(
+            world_xs, world_ys,
+            self.left_ui_margin, 0, inner_w, screen_h,
+            rotation=self.circuit_rotation, padding=0.05,
+            center=((self.x_min + self.x_max) / 2, (self.y_min + self.y_max) / 2),
+        )
 
-        # Center the world in the screen (rotation done about original centre)
-        # world_cx/world_cy are unchanged by rotation about centre
-        # Center within the available inner area (left_ui_margin .. screen_w - right_ui_margin)
-        screen_cx = self.left_ui_margin + inner_w / 2
-        screen_cy = screen_h / 2
+        # Update the polyline screen coordinates based on new scale
+        self.screen_inner_points = self.transform.apply_points(*self.world_inner_points)
+        self.screen_outer_points = self.transform.apply_points(*self.world_outer_points)
 
-        self.tx = screen_cx - self.world_scale * world_cx
-        self.ty = screen_cy - self.world_scale * world_cy
+        # Screen geometry changed: rebuild the static render layers on next draw
+        self._track_shapes = None
+        self._drs_shapes = None
+        self._finish_line_shapes = None
 
-        # Update the polyline screen coordinates based on new scale
-        self.screen_inner_points = [self.world_to_screen(x, y) for x, y in self.world_inner_points]
-        self.screen_outer_points = [self.world_to_screen(x, y) for x, y in self.world_outer_points]
+    def _build_track_shapes(self, track_color):
+        shapes = ShapeElementList()
+        if len(self.screen_inner_points) > 1:
+            shapes.append(create_line_strip(self.screen_inner_points, track_color, 4))
+        if len(self.screen_outer_points) > 1:
+            shapes.append(create_line_strip(self.screen_outer_points, track_color, 4))
+        self._track_shapes = shapes
+        self._track_shapes_color = track_color
+
+    def _build_drs_shapes(self):
+        # DRS zones are green segments on the outer track edge
+        shapes = ShapeElementList()
+        for zone in self.drs_zones or []:
+            start_idx = zone["start"]["index"]
+            end_idx = zone["end"]["index"]
+
+            # Extract the outer track points for this DRS zone segment
+            end = min(end_idx + 1, len(self.x_outer))
+            drs_outer_points = self.transform.apply_points(
+                self.x_outer.iloc[start_idx:end].to_numpy(),
+                self.y_outer.iloc[start_idx:end].to_numpy(),
+            )
+
+            if len(drs_outer_points) > 1:
+                shapes.append(create_line_strip(drs_outer_points, DRS_COLOR, 6))
+        self._drs_shapes = shapes
+
+    def _build_finish_line_shapes(self):
+        shapes = ShapeElementList()
+        for shape in create_finish_line_shapes(self):
+            shapes.append(shape)
+        self._finish_line_shapes = shapes
+
+    def _car_sprite(self, code):
+        sprite = self._car_sprite_by_code.get(code)
+        if sprite is None:
+            color = self.driver_colors.get(code, arcade.color.WHITE)
+            sprite = arcade.SpriteCircle(CAR_RADIUS, color)
+            self._car_sprite_by_code[code] = sprite
+            self.car_sprites.append(sprite)
+        return sprite
+
+    def invalidate(self):
+        """Request a redraw on the next tick."""
+        self._needs_redraw = True
+
+    def draw(self, delta_time: float):
+        # Arcade calls draw() every tick. When nothing changed, skip on_draw
+        # and the buffer swap so the last frame stays on screen and a paused
+        # replay costs next to nothing.
+        if not self._needs_redraw:
+            return
+        self._needs_redraw = False
+        super().draw(delta_time)
+
+    def on_expose(self):
+        self.invalidate()
 
     def on_resize(self, width, height):
         """Called automatically by Arcade when window is resized."""
         super().on_resize(width, height)
+        self.invalidate()
         self.update_scaling(width, height)
         # notify components
         self.leaderboard_comp.x = max(20, self.width - self.right_ui_margin + 12)
@@ -285,20 +300,7 @@ class F1RaceReplayWindow(arcade.Window):
         self.status_text.y = self.height - 120
 
     def world_to_screen(self, x, y):
-        # Rotate around the track centre (if rotation is set), then scale+translate
-        world_cx = (self.x_min + self.x_max) / 2
-        world_cy = (self.y_min + self.y_max) / 2
-
-        if self._rot_rad:
-            tx = x - world_cx
-            ty = y - world_cy
-            rx = tx * self._cos_rot - ty * self._sin_rot
-            ry = tx * self._sin_rot + ty * self._cos_rot
-            x, y = rx + world_cx, ry + world_cy
-
-        sx = self.world_scale * x + self.tx
-        sy = self.world_scale * y + self.ty
-        return sx, sy
+        return self.transform.apply_point(x, y)
 
     def _format_wind_direction(self, degrees):
         if degrees is None:
@@ -325,21 +327,8 @@ class F1RaceReplayWindow(arcade.Window):
         # 2. Draw Track (using pre-calculated screen points)
         idx = min(int(self.frame_index), self.n_frames - 1)
         frame = self.frames[idx]
-        current_time = frame["t"]
-        current_track_status = "GREEN"
-        for status in self.track_statuses:
-            if status['start_time'] <= current_time and (status['end_time'] is None or current_time < status['end_time']):
-                current_track_status = status['status']
-                break
-
-        # Map track status -> colour (R,G,B)
-        STATUS_COLORS = {
-            "GREEN": (150, 150, 150),    # normal grey
-            "YELLOW": (220, 180,   0),   # caution
-            "RED": (200,  30,  30),      # red-flag
-            "VSC": (200, 130,  50),      # virtual safety car / amber-brown
-            "SC": (180, 100,  30),       # safety car (darker brown)
-        }
+        current_track_status = self.track_status_index.status_at_frame(idx)
+
         track_color = STATUS_COLORS.get("GREEN", (150, 150, 150))
 
         if current_track_status == "2":
@@ -351,32 +340,21 @@ class F1RaceReplayWindow(arcade.Window):
         elif current_track_status == "6" or current_track_status == "7":
             track_color = STATUS_COLORS.get("VSC")
             
-        if len(self.screen_inner_points) > 1:
-            arcade.draw_line_strip(self.screen_inner_points, track_color, 4)
-        if len(self.screen_outer_points) > 1:
-            arcade.draw_line_strip(self.screen_outer_points, track_color, 4)
+        # Only re-upload the track edges when the status colour changes
+        if self._track_shapes is None or self._track_shapes_color != track_color:
+            self._build_track_shapes(track_color)
+        self._track_shapes.draw()
         
         # 2.5 Draw DRS Zones (green segments on outer track edge)
-        if hasattr(self, 'drs_zones') and self.drs_zones and self.toggle_drs_zones:
-            drs_color = (0, 255, 0)  # Bright green for DRS zones
-            
-            for _, zone in enumerate(self.drs_zones):
-                start_idx = zone["start"]["index"]
-                end_idx = zone["end"]["index"]
-                
-                # Extract the outer track points for this DRS zone segment
-                drs_outer_points = []
-                for i in range(start_idx, min(end_idx + 1, len(self.x_outer))):
-                    x = self.x_outer.iloc[i]
-                    y = self.y_outer.iloc[i]
-                    sx, sy = self.world_to_screen(x, y)
-                    drs_outer_points.append((sx, sy))
-                
-                # Draw the DRS zone segment
-                if len(drs_outer_points) > 1:
-                    arcade.draw_line_strip(drs_outer_points, drs_color, 6)
+        if self.drs_zones and self.toggle_drs_zones:
+            if self._drs_shapes is None:
+                self._build_drs_shapes()
+            self._drs_shapes.draw()
+
+        if self._finish_line_shapes is None:
+            self._build_finish_line_shapes()
+        self._finish_line_shapes.draw()
 
-        draw_finish_line(self)
         # 3. Draw Cars
         frame = self.frames[idx]
         
@@ -385,28 +363,39 @@ class F1RaceReplayWindow(arcade.Window):
         if not selected_drivers and getattr(self, "selected_driver", None):
             selected_drivers = [self.selected_driver]
 
-        for i, (code, pos) in enumerate(frame["drivers"].items()):
-            sx, sy = self.world_to_screen(pos["x"], pos["y"])
+        # Cars missing from this frame (legacy caches drop retired drivers) are hidden
+        for sprite in self.car_sprites:
+            sprite.visible = False
+
+        drivers = frame["drivers"]
+        codes = list(drivers)
+        # Cars are placed at the fractional frame index, interpolated between
+        # the stored frames, so they move smoothly at any playback speed
+        columns = [self.frames.driver_index(code) for code in codes]
+        world_xs = self.frames.sample("x", self.frame_index)[columns].astype(float)
+        world_ys = self.frames.sample("y", self.frame_index)[columns].astype(float)
+        car_xs, car_ys = self.transform.apply(world_xs, world_ys)
+
+        # Project every car onto the reference line in one call for the label
+        # normals (rotated to screen space; the scale is uniform, so divide it back out)
+        if self.show_driver_labels or selected_drivers:
+            projection = self.track_projection.project(world_xs, world_ys, keys=codes)
+            label_nx, label_ny = self.transform.apply_vector(projection.nx, projection.ny)
+            label_nx = label_nx / self.transform.scale
+            label_ny = label_ny / self.transform.scale
+
+        for i, (code, pos) in enumerate(drivers.items()):
+            sx, sy = float(car_xs[i]), float(car_ys[i])
             color = self.driver_colors.get(code, arcade.color.WHITE)
+            sprite = self._car_sprite(code)
+            sprite.position = (sx, sy)
+            sprite.visible = True
             
             is_selected = code in selected_drivers
             
             if self.show_driver_labels or is_selected:
-                # Find closest point index on reference track
-                r_dx = self._ref_xs - pos["x"]
-                r_dy = self._ref_ys - pos["y"]
-                idx = int(np.argmin(r_dx*r_dx + r_dy*r_dy))
-                
-                # Get normal vector in world space
-                nx = self._ref_nx[idx]
-                ny = self._ref_ny[idx]
-                
-                # Rotate normal to screen space
-                if self._rot_rad:
-                    snx = nx * self._cos_rot - ny * self._sin_rot
-                    sny = nx * self._sin_rot + ny * self._cos_rot
-                else:
-                    snx, sny = nx, ny
+                # Normal of the reference track at the car, in screen space
+                snx, sny = float(label_nx[i]), float(label_ny[i])
                 
                 offset_dist = 45 if i % 2 == 0 else 75
                 
@@ -417,38 +406,19 @@ class F1RaceReplayWindow(arcade.Window):
                 
                 anchor_x = "left" if snx >= 0 else "right"
                 text_padding = 3 if snx >= 0 else -3
-                arcade.draw_text(code, lx + text_padding, ly, color, 10, anchor_x=anchor_x, anchor_y="center", bold=True)
+                self.label_texts.draw(code, code, lx + text_padding, ly, color, 10, anchor_x=anchor_x, anchor_y="center", bold=True)
 
-            arcade.draw_circle_filled(sx, sy, 6, color)
+        # All cars in one batched draw, on top of the label leader lines
+        self.car_sprites.draw()
         
         # --- UI ELEMENTS (Dynamic Positioning) ---
         
-        # Determine Leader info using projected along-track distance (more robust than dist)
-        # Use the progress metric in metres for each driver and use that to order the leaderboard.
-        driver_progress = {}
-        for code, pos in frame["drivers"].items():
-            # parse lap defensively
-            lap_raw = pos.get("lap", 1)
-            try:
-                lap = int(lap_raw)
-            except Exception:
-                lap = 1
-
-            # Project (x,y) to reference and combine with lap count
-            projected_m = self._project_to_reference(pos.get("x", 0.0), pos.get("y", 0.0))
-
-            # progress in metres since race start: (lap-1) * lap_length + projected_m
-            progress_m = float((max(lap, 1) - 1) * self._ref_total_length + projected_m)
-
-            driver_progress[code] = progress_m
-
-        # Leader is the one with greatest progress_m
-        if driver_progress:
-            leader_code = max(driver_progress, key=lambda c: driver_progress[c])
-            leader_lap = frame["drivers"][leader_code].get("lap", 1)
-        else:
-            leader_code = None
-            leader_lap = 1
+        # Leaderboard order and along-track progress are computed by the
+        # pipeline for every frame, so this is just a lookup
+        order = self.frames.order[idx]
+        progress = self.frames.channels.get("progress", self.frames.channels["dist"])[idx]
+        leader_code = self.frames.codes[order[0]] if len(order) else None
+        leader_lap = frame["drivers"][leader_code].get("lap", 1) if leader_code in frame["drivers"] else 1
 
         # Time Calculation
         t = frame["t"]
@@ -466,21 +436,13 @@ class F1RaceReplayWindow(arcade.Window):
         if self.visible_hud:
             self.lap_text.text = lap_str
             self.time_text.text = f"Race Time: {time_str} (x{self.playback_speed})"
-            # default no status text
-            self.status_text.text = ""
-            # update status color and text if required
-            if current_track_status == "2":
-                self.status_text.text = "YELLOW FLAG"
-                self.status_text.color = arcade.color.YELLOW
-            elif current_track_status == "5":
-                self.status_text.text = "RED FLAG"
-                self.status_text.color = arcade.color.RED
-            elif current_track_status == "6":
-                self.status_text.text = "VIRTUAL SAFETY CAR"
-                self.status_text.color = arcade.color.ORANGE
-            elif current_track_status == "4":
-                self.status_text.text = "SAFETY CAR"
-                self.status_text.color = arcade.color.BROWN
+            # Status banner (no text under green); the colour setter re-lays
+            # the text out, so only touch it when the status changes
+            status_label, status_color = STATUS_LABELS.get(current_track_status, ("", None))
+            if status_label != self.status_text.text:
+                self.status_text.text = status_label
+                if status_color is not None:
+                    self.status_text.color = status_color
 
             self.lap_text.draw()
             self.time_text.draw()
@@ -496,11 +458,13 @@ class F1RaceReplayWindow(arcade.Window):
 
         # Draw leaderboard via component
         driver_list = []
-        for code, pos in frame["drivers"].items():
+        for j in order:
+            code = self.frames.codes[j]
+            pos = frame["drivers"].get(code)
+            if pos is None:
+                continue
             color = self.driver_colors.get(code, arcade.color.WHITE)
-            progress_m = driver_progress.get(code, float(pos.get("dist", 0.0)))
-            driver_list.append((code, color, pos, progress_m))
-        driver_list.sort(key=lambda x: x[3], reverse=True)
+            driver_list.append((code, color, pos, float(progress[j])))
         self.leaderboard_comp.set_entries(driver_list)
         self.leaderboard_comp.draw(self)
         # expose rects for existing hit test compatibility if needed
@@ -528,25 +492,34 @@ class F1RaceReplayWindow(arcade.Window):
         self.progress_bar_comp.draw_overlays(self)
                     
     def on_update(self, delta_time: float):
+        # Keep redrawing while a button flash fades out (including the tick it ends)
+        if self.race_controls_comp.animating:
+            self.invalidate()
         self.race_controls_comp.on_update(delta_time)
-        
+        previous_index = self.frame_index
+
         seek_speed = 3.0 * max(1.0, self.playback_speed) # Multiplier for seeking speed, scales with current playback speed
         if self.is_rewinding:
-            self.frame_index = max(0.0, self.frame_index - delta_time * FPS * seek_speed)
+            self._advance(-delta_time * seek_speed)
             self.race_controls_comp.flash_button('rewind')
         elif self.is_forwarding:
-            self.frame_index = min(self.n_frames - 1, self.frame_index + delta_time * FPS * seek_speed)
+            self._advance(delta_time * seek_speed)
             self.race_controls_comp.flash_button('forward')
 
-        if self.paused:
-            return
+        if not self.paused:
+            self._advance(delta_time * self.playback_speed)
 
-        self.frame_index += delta_time * FPS * self.playback_speed
-        
-        if self.frame_index >= self.n_frames:
-            self.frame_index = float(self.n_frames - 1)
+        if self.frame_index != previous_index:
+            self.invalidate()
+
+    def _advance(self, seconds: float):
+        # Move playback by race time rather than a fixed frame count: the
+        # timeline rate is stored with the frames and may vary (e.g. lower
+        # under a safety car). index_at clamps to the first/last frame.
+        self.frame_index = self.frames.index_at(self.frames.time_at(self.frame_index) + seconds)
 
     def on_key_press(self, symbol: int, modifiers: int):
+        self.invalidate()
         # Allow ESC to close window at any time
         if symbol == arcade.key.ESCAPE:
             arcade.close_window()
@@ -614,6 +587,7 @@ class F1RaceReplayWindow(arcade.Window):
             self.session_info_comp.toggle_visibility() # toggle session info banner
 
     def on_key_release(self, symbol: int, modifiers: int):
+        self.invalidate()
         if symbol == arcade.key.RIGHT:
             self.is_forwarding = False
             self.paused = self.was_paused_before_hold
@@ -622,12 +596,14 @@ class F1RaceReplayWindow(arcade.Window):
             self.paused = self.was_paused_before_hold
 
     def on_mouse_release(self, x: float, y: float, button: int, modifiers: int):
+        self.invalidate()
         if self.is_forwarding or self.is_rewinding:
             self.is_forwarding = False
             self.is_rewinding = False
             self.paused = self.was_paused_before_hold
 
     def on_mouse_press(self, x: float, y: float, button: int, modifiers: int):
+        self.invalidate()
         # forward to components; stop at first that handled it
         if self.controls_popup_comp.on_mouse_press(self, x, y, button, modifiers):
             return
@@ -644,5 +620,8 @@ class F1RaceReplayWindow(arcade.Window):
         
     def on_mouse_motion(self, x: float, y: float, dx: float, dy: float):
         """Handle mouse motion for hover effects on progress bar and controls."""
-        self.progress_bar_comp.on_mouse_motion(self, x, y, dx, dy)
-        self.race_controls_comp.on_mouse_motion(self, x, y, dx, dy)
\ No newline at end of file
+        # Components report whether their hover state changed; only then redraw
+        hover_changed = self.progress_bar_comp.on_mouse_motion(self, x, y, dx, dy)
+        hover_changed |= self.race_controls_comp.on_mouse_motion(self, x, y, dx, dy)
+        if hover_changed:
+            self.invalidate()
\ No newline at end of file
@@ -0,0 +1,232 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from src.lib.storage import MANIFEST_NAME
+
+# Content-addressed cache for computed_data/.
+#
+# Entries are keyed by everything that changes their contents (event, session
+# type, pipeline version, frame rate, ...) instead of the event name alone, so
+# a pipeline change never silently reuses stale data. Each entry's manifest
+# gains a "cache" section (key, creation time, FastF1 version, byte size, last
+# access) used by list() and by LRU eviction against a disk budget.
+
+DEFAULT_CACHE_DIR = "computed_data"
+
+
+class CacheKey:
+    """Identity of one cache entry. Two keys with equal fields share an entry."""
+
+    def __init__(self, year: int, round_number: int, session_type: str, kind: str,
+                 pipeline_version: int, fps: float, params: Optional[Dict[str, Any]] = None):
+        self.year = int(year)
+        self.round_number = int(round_number)
+        self.session_type = str(session_type)
+        self.kind = str(kind)
+        self.pipeline_version = int(pipeline_version)
+        self.fps = float(fps)
+        self.params = dict(params or {})
+
+    @classmethod
+    def for_session(cls, session, session_type: str, kind: str, pipeline_version: int,
+                    fps: float, params: Optional[Dict[str, Any]] = None) -> "CacheKey":
+        return cls(
+            year=session.event["EventDate"].year,
+            round_number=session.event["RoundNumber"],
+            session_type=session_type,
+            kind=kind,
+            pipeline_version=pipeline_version,
+            fps=fps,
+            params=params,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "year": self.year,
+            "round_number": self.round_number,
+            "session_type": self.session_type,
+            "kind": self.kind,
+            "pipeline_version": self.pipeline_version,
+            "fps": self.fps,
+            "params": self.params,
+        }
+
+    @property
+    def digest(self) -> str:
+        payload = json.dumps(self.to_dict(), sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    @property
+    def name(self) -> str:
+        # Readable prefix for humans browsing the folder, digest for identity
+        return f"{self.year}_{self.round_number:02d}_{self.session_type}_{self.kind}_{self.digest}"
+
+    def __eq__(self, other):
+        return isinstance(other, CacheKey) and self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash(self.digest)
+
+    def __repr__(self):
+        return f"CacheKey({self.name})"
+
+
+def _fastf1_version() -> Optional[str]:
+    try:
+        import fastf1
+        return getattr(fastf1, "__version__", None)
+    except ImportError:
+        return None
+
+
+def _directory_size(path: str) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            total += os.path.getsize(os.path.join(dirpath, filename))
+    return total
+
+
+class CacheManager:
+    """
+    get/put/invalidate/list over the entries in ``root``.
+
+    ``budget_bytes`` caps the total size of the cache; after every put the
+    least recently used entries are removed until it fits again. None means
+    no limit.
+    """
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR, budget_bytes: Optional[int] = None):
+        self.root = root
+        self.budget_bytes = budget_bytes
+
+    def path(self, key: CacheKey) -> str:
+        return os.path.join(self.root, key.name)
+
+    # --- manifest helpers ---------------------------------------------------
+
+    def _read_manifest(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(path, MANIFEST_NAME)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write_manifest(self, path: str, manifest: Dict[str, Any]) -> None:
+        manifest_path = os.path.join(path, MANIFEST_NAME)
+        tmp_path = f"{manifest_path}.tmp-{os.getpid()}"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+
+    def _touch(self, path: str) -> None:
+        manifest = self._read_manifest(path)
+        if manifest is None or "cache" not in manifest:
+            return
+        manifest["cache"]["last_access"] = time.time()
+        try:
+            self._write_manifest(path, manifest)
+        except OSError:
+            pass  # read-only cache: LRU order just won't update
+
+    # --- public API ---------------------------------------------------------
+
+    def contains(self, key: CacheKey) -> bool:
+        return self._read_manifest(self.path(key)) is not None
+
+    def get(self, key: CacheKey, load: Callable[[str], Optional[Any]]) -> Optional[Any]:
+        """Load the entry for ``key`` with ``load(directory)``; None on a miss."""
+        path = self.path(key)
+        if self._read_manifest(path) is None:
+            return None
+
+        data = load(path)
+        if data is not None:
+            self._touch(path)
+        return data
+
+    def put(self, key: CacheKey, data: Any, save: Callable[[str, Any], None]) -> str:
+        """Write ``data`` with ``save(directory, data)``, stamp the manifest and enforce the budget."""
+        os.makedirs(self.root, exist_ok=True)
+        path = self.path(key)
+        save(path, data)
+
+        manifest = self._read_manifest(path) or {}
+        now = time.time()
+        manifest["cache"] = {
+            "key": key.to_dict(),
+            "digest": key.digest,
+            "created_at": now,
+            "last_access": now,
+            "fastf1_version": _fastf1_version(),
+            "byte_size": _directory_size(path),
+        }
+        self._write_manifest(path, manifest)
+
+        self.evict(keep=path)
+        return path
+
+    def invalidate(self, key: Optional[CacheKey] = None, **fields) -> int:
+        """
+        Remove the entry for ``key``, or every entry whose key matches all of
+        ``fields`` (e.g. ``invalidate(year=2024, round_number=5)``).
+        Returns the number of entries removed.
+        """
+        if key is not None:
+            path = self.path(key)
+            if not os.path.exists(path):
+                return 0
+            shutil.rmtree(path, ignore_errors=True)
+            return 1
+
+        removed = 0
+        for entry in self.list():
+            if all(entry["key"].get(name) == value for name, value in fields.items()):
+                shutil.rmtree(entry["path"], ignore_errors=True)
+                removed += 1
+        return removed
+
+    def list(self) -> List[Dict[str, Any]]:
+        """All managed entries, least recently used first."""
+        if not os.path.isdir(self.root):
+            return []
+
+        entries = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if not os.path.isdir(path):
+                continue
+            manifest = self._read_manifest(path)
+            if manifest is None or "cache" not in manifest:
+                continue  # not written by the cache manager (or still being written)
+            entries.append({"name": name, "path": path, **manifest["cache"]})
+
+        entries.sort(key=lambda entry: entry.get("last_access", 0))
+        return entries
+
+    def total_bytes(self) -> int:
+        return sum(entry.get("byte_size", 0) for entry in self.list())
+
+    def evict(self, budget_bytes: Optional[int] = None, keep: Optional[str] = None) -> List[str]:
+        """Drop least recently used entries until the cache fits the budget."""
+        budget = self.budget_bytes if budget_bytes is None else budget_bytes
+        if budget is None:
+            return []
+
+        entries = self.list()
+        total = sum(entry.get("byte_size", 0) for entry in entries)
+        removed = []
+        for entry in entries:
+            if total <= budget:
+                break
+            if keep is not None and os.path.abspath(entry["path"]) == os.path.abspath(keep):
+                continue
+            shutil.rmtree(entry["path"], ignore_errors=True)
+            total -= entry.get("byte_size", 0)
+            removed.append(entry["name"])
+            print(f"Evicted cached telemetry {entry['name']} ({entry.get('byte_size', 0) / 1e6:.1f} MB)")
+        return removed
@@ -0,0 +1,645 @@
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.lib.projection import TrackProjection
+from src.lib.time import format_time
+
+# Per-driver channels, stored as (n_frames, n_drivers) arrays.
+# The dtype is the smallest one that keeps the values the replay needs.
+DRIVER_CHANNELS = {
+    "x": np.float32,
+    "y": np.float32,
+    "dist": np.float64,        # distance into the current lap (metres), paired with "lap"
+    "rel_dist": np.float32,
+    "lap": np.int16,
+    "tyre": np.float32,        # kept as float so "1.0" style texture keys still match
+    "speed": np.float32,
+    "gear": np.int8,
+    "drs": np.int8,
+    "throttle": np.float32,
+    "brake": np.float32,
+    "tyre_age": np.int16,
+    "in_pit": np.bool_,
+    "position": np.int8,
+    # Gap data (NaN / 0 where the frame dict used to hold None)
+    "gap_to_leader": np.float32,
+    "gap_to_leader_dist": np.float32,
+    "interval": np.float32,
+    "interval_dist": np.float32,
+    "laps_behind": np.int16,
+}
+
+# Channels that vary smoothly between frames and can be interpolated at a
+# fractional frame index (rel_dist wraps at the line; the rest are discrete)
+CONTINUOUS_CHANNELS = ("x", "y", "dist", "speed", "throttle", "brake", "progress")
+
+# Session-wide channels, stored as (n_frames,) arrays
+WEATHER_CHANNELS = ("track_temp", "air_temp", "humidity", "wind_speed", "wind_direction", "rainfall")
+
+
+def _none_if_nan(value, digits):
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+def _weather_snapshot(weather: Optional[Dict[str, np.ndarray]], i: int) -> Optional[Dict[str, Any]]:
+    """Legacy per-frame weather dict built from the weather series."""
+    if not weather:
+        return None
+
+    def _value(name):
+        series = weather.get(name)
+        return float(series[i]) if series is not None else None
+
+    rain_val = _value("rainfall") or 0.0
+    return {
+        "track_temp": _value("track_temp"),
+        "air_temp": _value("air_temp"),
+        "humidity": _value("humidity"),
+        "wind_speed": _value("wind_speed"),
+        "wind_direction": _value("wind_direction"),
+        "rain_state": "RAINING" if rain_val >= 0.5 else "DRY",
+    }
+
+
+def _weather_from_frame_dicts(frames: List[Dict[str, Any]]) -> Optional[Dict[str, np.ndarray]]:
+    if not any("weather" in frame for frame in frames):
+        return None
+
+    n_frames = len(frames)
+    weather = {name: np.zeros(n_frames, dtype=np.float32) for name in WEATHER_CHANNELS}
+    for i, frame in enumerate(frames):
+        w = frame.get("weather") or {}
+        for name in WEATHER_CHANNELS[:-1]:
+            value = w.get(name)
+            weather[name][i] = value if value is not None else np.nan
+        weather["rainfall"][i] = 1.0 if w.get("rain_state") == "RAINING" else 0.0
+    return weather
+
+
+class RaceFrames:
+    """
+    Columnar store for the race replay timeline.
+
+    Every driver channel is one (n_frames, n_drivers) NumPy array, so a full
+    race costs a few hundred MB less than the old list of nested dicts and
+    is stored on disk as one memory-mapped .npy file per channel.
+
+    Indexing (``frames[i]``) and iteration return the familiar per-frame
+    dict shape ({"t", "lap", "drivers", "weather"}), built lazily on access,
+    so code written against the list-of-dicts output keeps working.
+
+    ``fps`` is the rate the timeline was computed at. Frames are not
+    necessarily evenly spaced (the rate can drop under a safety car), so
+    playback should go through time_at/index_at rather than assume it.
+
+    ``order`` holds the leaderboard order of every frame as driver indices
+    (see compute_progress); without it the order follows ``position``.
+    """
+
+    def __init__(self, t: np.ndarray, codes: Sequence[str], channels: Dict[str, np.ndarray],
+                 leader_lap: np.ndarray, weather: Optional[Dict[str, np.ndarray]] = None,
+                 fps: Optional[float] = None, order: Optional[np.ndarray] = None):
+        self.t = t
+        if fps is None:
+            # Older caches did not store the rate; the typical frame spacing gives it back
+            fps = 1.0 / float(np.median(np.diff(t[:1000]))) if len(t) > 1 else 25.0
+        self.fps = float(fps)
+        self.codes = list(codes)
+        self.channels = channels
+        self.leader_lap = leader_lap
+        self.weather = weather or None
+        self._order = order
+        self._code_index = {code: j for j, code in enumerate(self.codes)}
+        self._cached_index = None
+        self._cached_frame = None
+
+    # --- container protocol -------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.frame(i) for i in range(*index.indices(len(self)))]
+        return self.frame(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.frame(i)
+
+    def __getattr__(self, name):
+        # Expose channels as attributes (frames.x, frames.position, ...)
+        channels = self.__dict__.get("channels")
+        if channels is not None and name in channels:
+            return channels[name]
+        raise AttributeError(name)
+
+    @property
+    def n_drivers(self) -> int:
+        return len(self.codes)
+
+    @property
+    def has_weather(self) -> bool:
+        return bool(self.weather)
+
+    def driver_index(self, code: str) -> Optional[int]:
+        return self._code_index.get(code)
+
+    @property
+    def order(self) -> np.ndarray:
+        """(n_frames, n_drivers) driver indices in leaderboard order, leader first."""
+        if self._order is None:
+            self._order = np.argsort(self.channels["position"], axis=1, kind="stable")
+        return self._order
+
+    @property
+    def duration(self) -> float:
+        return float(self.t[-1]) if len(self.t) else 0.0
+
+    def time_at(self, index: float) -> float:
+        """Timeline time (seconds) at a fractional frame index."""
+        n = len(self.t)
+        if n < 2:
+            return float(self.t[0]) if n else 0.0
+        index = min(max(float(index), 0.0), n - 1.0)
+        i = min(int(index), n - 2)
+        return float(self.t[i] + (self.t[i + 1] - self.t[i]) * (index - i))
+
+    def index_at(self, seconds: float) -> float:
+        """Fractional frame index at a timeline time, clamped to the timeline."""
+        n = len(self.t)
+        if n < 2:
+            return 0.0
+        i = int(np.searchsorted(self.t, seconds, side="right")) - 1
+        if i < 0:
+            return 0.0
+        if i >= n - 1:
+            return float(n - 1)
+        span = float(self.t[i + 1] - self.t[i])
+        return i + (float(seconds) - float(self.t[i])) / span if span > 0 else float(i)
+
+    def sample(self, name: str, index: float) -> np.ndarray:
+        """
+        Per-driver values of channel ``name`` at a fractional frame index.
+
+        Continuous channels (CONTINUOUS_CHANNELS) are interpolated linearly
+        between the two neighbouring frames, so cars move smoothly even when
+        the display runs faster than the stored timeline rate. Other
+        channels take the value of the earlier frame.
+        """
+        channel = self.channels[name]
+        n = len(self.t)
+        index = min(max(float(index), 0.0), max(n - 1.0, 0.0))
+        i = int(index)
+        frac = index - i
+        if frac == 0.0 or i >= n - 1 or name not in CONTINUOUS_CHANNELS:
+            return channel[i]
+
+        a = channel[i].astype(np.float64)
+        b = channel[i + 1].astype(np.float64)
+        # Keep the earlier value where the next frame has no data
+        return np.where(np.isnan(b), a, a + (b - a) * frac)
+
+    def lap_start_frames(self, total_laps: Optional[int] = None) -> np.ndarray:
+        """
+        First frame of each leader lap, lap 1 first (capped at ``total_laps``
+        when given). The leader lap is made monotonic first so a leader change
+        to a car a lap down can not move a lap start later.
+        """
+        if not len(self.leader_lap):
+            return np.empty(0, dtype=np.int64)
+        leader_lap = np.maximum.accumulate(self.leader_lap.astype(np.int64))
+        n_laps = int(leader_lap[-1])
+        if total_laps:
+            n_laps = min(n_laps, int(total_laps))
+        return np.searchsorted(leader_lap, np.arange(1, n_laps + 1), side="left")
+
+    # --- per-frame views ----------------------------------------------------
+
+    def frame(self, i: int) -> Dict[str, Any]:
+        """Build the legacy dict view of frame ``i`` (drivers ordered by position)."""
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        if i == self._cached_index:
+            return self._cached_frame
+
+        c = self.channels
+        drivers = {}
+        for j in np.argsort(c["position"][i], kind="stable"):
+            position = int(c["position"][i, j])
+            laps_behind = int(c["laps_behind"][i, j])
+            drivers[self.codes[j]] = {
+                "x": float(c["x"][i, j]),
+                "y": float(c["y"][i, j]),
+                "dist": float(c["dist"][i, j]),
+                "lap": int(c["lap"][i, j]),
+                "rel_dist": round(float(c["rel_dist"][i, j]), 4),
+                "tyre": float(c["tyre"][i, j]),
+                "position": position,
+                "speed": float(c["speed"][i, j]),
+                "gear": int(c["gear"][i, j]),
+                "drs": int(c["drs"][i, j]),
+                "throttle": float(c["throttle"][i, j]),
+                "brake": float(c["brake"][i, j]),
+                "tyre_age": int(c["tyre_age"][i, j]),
+                "in_pit": bool(c["in_pit"][i, j]),
+                "gap_to_leader": _none_if_nan(c["gap_to_leader"][i, j], 3),
+                "gap_to_leader_dist": _none_if_nan(c["gap_to_leader_dist"][i, j], 1),
+                "interval": _none_if_nan(c["interval"][i, j], 3),
+                "interval_dist": _none_if_nan(c["interval_dist"][i, j], 1),
+                "laps_behind": laps_behind if laps_behind > 0 else None,
+            }
+
+        payload = {
+            "t": round(float(self.t[i]), 3),
+            "lap": int(self.leader_lap[i]),
+            "drivers": drivers,
+        }
+        weather = self.weather_at(i)
+        if weather:
+            payload["weather"] = weather
+
+        self._cached_index = i
+        self._cached_frame = payload
+        return payload
+
+    def weather_at(self, i: int) -> Optional[Dict[str, Any]]:
+        return _weather_snapshot(self.weather, i)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Materialise every frame as a dict (used for JSON responses)."""
+        return [self.frame(i) for i in range(len(self))]
+
+    # --- construction helpers -------------------------------------------------
+
+    @classmethod
+    def empty_channels(cls, n_frames: int, n_drivers: int) -> Dict[str, np.ndarray]:
+        channels = {}
+        for name, dtype in DRIVER_CHANNELS.items():
+            if np.issubdtype(dtype, np.floating):
+                channels[name] = np.full((n_frames, n_drivers), np.nan, dtype=dtype)
+            else:
+                channels[name] = np.zeros((n_frames, n_drivers), dtype=dtype)
+        return channels
+
+    @classmethod
+    def from_frame_dicts(cls, frames: List[Dict[str, Any]]) -> "RaceFrames":
+        """Convert the legacy list-of-dicts output (e.g. an old pickle) into columns."""
+        codes = []
+        for frame in frames:
+            for code in frame.get("drivers", {}):
+                if code not in codes:
+                    codes.append(code)
+        index = {code: j for j, code in enumerate(codes)}
+
+        n_frames = len(frames)
+        channels = cls.empty_channels(n_frames, len(codes))
+        t = np.zeros(n_frames, dtype=np.float64)
+        leader_lap = np.zeros(n_frames, dtype=np.int16)
+
+        for i, frame in enumerate(frames):
+            t[i] = frame.get("t", 0.0)
+            leader_lap[i] = frame.get("lap", 0) or 0
+            for code, car in frame.get("drivers", {}).items():
+                j = index[code]
+                for name in DRIVER_CHANNELS:
+                    value = car.get(name)
+                    if value is None:
+                        continue
+                    channels[name][i, j] = value
+
+        weather = _weather_from_frame_dicts(frames)
+        return cls(t=t, codes=codes, channels=channels, leader_lap=leader_lap, weather=weather)
+
+
+# Per-sample channels of a single lap (qualifying telemetry)
+LAP_CHANNELS = {
+    "x": np.float64,
+    "y": np.float64,
+    "dist": np.float64,
+    "rel_dist": np.float64,
+    "speed": np.float64,
+    "gear": np.int8,
+    "throttle": np.float64,
+    "brake": np.float64,
+    "drs": np.int8,
+}
+
+
+class LapFrames:
+    """
+    Columnar frames for one qualifying lap.
+
+    Same idea as RaceFrames: the channels live in flat arrays (possibly
+    memory-mapped) and ``frames[i]`` builds the legacy
+    {"t", "telemetry", "weather"} dict on access.
+
+    Weather is held once for the whole lap (length-1 arrays per
+    WEATHER_CHANNELS name); per-frame series are reduced to their first
+    sample, so every frame of the lap reports the same conditions.
+    """
+
+    def __init__(self, t: np.ndarray, telemetry: Dict[str, np.ndarray],
+                 weather: Optional[Dict[str, np.ndarray]] = None):
+        self.t = t
+        self.telemetry = telemetry
+        self.weather = {name: series[:1] for name, series in weather.items()} if weather else None
+        self._weather_snapshot = _weather_snapshot(self.weather, 0)
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.frame(i) for i in range(*index.indices(len(self)))]
+        return self.frame(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.frame(i)
+
+    def frame(self, i: int) -> Dict[str, Any]:
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+
+        telemetry = {}
+        for name, dtype in LAP_CHANNELS.items():
+            value = self.telemetry[name][i]
+            telemetry[name] = int(value) if np.issubdtype(dtype, np.integer) else float(value)
+
+        payload = {
+            "t": round(float(self.t[i]), 3),
+            "telemetry": telemetry,
+        }
+        if self._weather_snapshot:
+            payload["weather"] = dict(self._weather_snapshot)
+        return payload
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return [self.frame(i) for i in range(len(self))]
+
+    @classmethod
+    def from_frame_dicts(cls, frames: List[Dict[str, Any]]) -> "LapFrames":
+        t = np.array([frame.get("t", 0.0) for frame in frames], dtype=np.float64)
+        telemetry = {
+            name: np.array([(frame.get("telemetry") or {}).get(name, 0) for frame in frames], dtype=dtype)
+            for name, dtype in LAP_CHANNELS.items()
+        }
+        return cls(t=t, telemetry=telemetry, weather=_weather_from_frame_dicts(frames))
+
+
+# ~200 km/h, used for time gaps when a car is (almost) stationary
+AVG_SPEED_MS = 200 * 1000 / 3600
+
+
+def compute_standings(lap: np.ndarray, dist: np.ndarray, speed: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute positions, gaps and intervals for every frame at once.
+
+    Inputs are (n_frames, n_drivers) arrays. Cars are ordered by (lap, dist)
+    descending with a single lexsort; gaps to the leader and intervals to the
+    car ahead are then plain array arithmetic on that order. Returns the
+    standings channels of RaceFrames plus the leader's lap per frame.
+    """
+    n_frames, n_drivers = lap.shape
+    rows = np.arange(n_frames)[:, None]
+
+    # lexsort sorts by the last key first; negate for a stable descending order
+    order = np.lexsort((-dist, -lap.astype(np.int32)), axis=-1)
+
+    position = np.empty((n_frames, n_drivers), dtype=np.int8)
+    position[rows, order] = np.arange(1, n_drivers + 1, dtype=np.int8)
+
+    leader_idx = order[:, 0]
+    leader_lap = lap[np.arange(n_frames), leader_idx]
+    leader_dist = dist[np.arange(n_frames), leader_idx]
+
+    sorted_dist = np.take_along_axis(dist, order, axis=1)
+    interval_dist = np.full((n_frames, n_drivers), np.nan)
+    interval_dist[rows, order[:, 1:]] = sorted_dist[:, :-1] - sorted_dist[:, 1:]
+
+    gap_dist = leader_dist[:, None] - dist
+    gap_dist[position == 1] = np.nan
+
+    # Use actual speed for more accurate gap calculation (if speed > 10 km/h)
+    speed_ms = np.where(speed > 10, speed / 3.6, AVG_SPEED_MS)
+
+    laps_behind = np.maximum(0, leader_lap[:, None].astype(np.int32) - lap)
+
+    return {
+        "position": position,
+        "gap_to_leader": (gap_dist / speed_ms).astype(np.float32),
+        "gap_to_leader_dist": gap_dist.astype(np.float32),
+        "interval": (interval_dist / speed_ms).astype(np.float32),
+        "interval_dist": interval_dist.astype(np.float32),
+        "laps_behind": laps_behind.astype(np.int16),
+        "leader_lap": leader_lap.astype(np.int16),
+    }
+
+
+# Reference line resolution used for projecting cars (matches the replay window)
+REFERENCE_POINTS = 4000
+
+
+def reference_lap(t: np.ndarray, x: np.ndarray, y: np.ndarray, lap: np.ndarray,
+                  in_pit: np.ndarray) -> Optional[np.ndarray]:
+    """
+    (x, y) points of the fastest clean lap on the timeline, or None.
+
+    Inputs are the timeline's (n_frames, n_drivers) channels. Lap 1 (grid
+    start), laps with a pit stop and each driver's last lap (unfinished or
+    after retirement) are skipped.
+    """
+    best = None
+    for j in range(lap.shape[1]):
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(lap[:, j])) + 1))
+        ends = np.append(starts[1:], len(t))
+        pit_count = np.concatenate(([0], np.cumsum(in_pit[:, j])))
+        for start, end in zip(starts[:-1], ends[:-1]):
+            if lap[start, j] < 2 or end - start < 10 or pit_count[end] > pit_count[start]:
+                continue
+            duration = t[end] - t[start]
+            if best is None or duration < best[0]:
+                best = (duration, j, start, end)
+
+    if best is None:
+        return None
+    _, j, start, end = best
+    # The lap runs from its first frame to the first frame of the next lap
+    return np.column_stack((x[start:end + 1, j], y[start:end + 1, j])).astype(float)
+
+
+def compute_progress(t: np.ndarray, x: np.ndarray, y: np.ndarray, lap: np.ndarray,
+                     in_pit: np.ndarray, dist: np.ndarray, position: np.ndarray,
+                     chunk_frames: int = 20000) -> Dict[str, np.ndarray]:
+    """
+    Along-track race progress and the leaderboard order for every frame.
+
+    Cars are projected onto the fastest clean lap of the race in batches
+    through a TrackProjection; progress is (lap - 1) * lap length plus the
+    projected distance. The order is by progress during the first lap (when
+    race distance is least reliable) and by position afterwards, which is
+    what the replay leaderboard used to work out on every drawn frame.
+    """
+    n_frames, n_drivers = lap.shape
+    reference = reference_lap(t, x, y, lap, in_pit)
+
+    if reference is None:
+        # No clean lap to project onto: race distance is the next best measure
+        progress = dist.astype(np.float64)
+    else:
+        t_old = np.linspace(0, 1, len(reference))
+        t_new = np.linspace(0, 1, REFERENCE_POINTS)
+        projection = TrackProjection(np.interp(t_new, t_old, reference[:, 0]),
+                                     np.interp(t_new, t_old, reference[:, 1]))
+        projected = np.empty((n_frames, n_drivers))
+        for start in range(0, n_frames, chunk_frames):
+            end = min(start + chunk_frames, n_frames)
+            xs = np.nan_to_num(x[start:end].astype(float)).ravel()
+            ys = np.nan_to_num(y[start:end].astype(float)).ravel()
+            projected[start:end] = projection.project(xs, ys).distance.reshape(end - start, n_drivers)
+        progress = (np.maximum(lap, 1) - 1) * projection.total_length + projected
+
+    first_lap = ~(lap > 1).any(axis=1)
+    order = np.argsort(position, axis=1, kind="stable")
+    order[first_lap] = np.argsort(-progress[first_lap], axis=1, kind="stable")
+
+    return {"progress": progress, "order": order.astype(np.int8)}
+
+
+# Race event detection (see compute_race_events)
+MOVING_SPEED_MS = 1.0        # below this a car counts as stopped
+EVENT_SAMPLE_SECONDS = 1.0   # leader changes and overtakes are checked about once a second
+LEADER_HOLD_SECONDS = 5.0    # a new leader has to stay in front this long
+OVERTAKE_HOLD_SAMPLES = 3    # ... and a pass has to stick for this many samples
+
+
+def _stop_frames(t: np.ndarray, dist: np.ndarray) -> np.ndarray:
+    """First frame from which each driver no longer moves (n_frames if still moving at the end)."""
+    n_frames, n_drivers = dist.shape
+    if n_frames < 2:
+        return np.full(n_drivers, n_frames)
+    # The timeline holds a driver's last sample once their data ends, so
+    # race distance stops changing when a car retires (or parks after the flag)
+    moving = np.diff(dist, axis=0) > MOVING_SPEED_MS * np.diff(t)[:, None]
+    last_moving = n_frames - 2 - np.argmax(moving[::-1], axis=0)
+    stop = np.where(last_moving == n_frames - 2, n_frames, last_moving + 1)
+    stop[~moving.any(axis=0)] = 0
+    return stop
+
+
+def _held_for(mask: np.ndarray, start: np.ndarray, length: int) -> np.ndarray:
+    """Whether ``mask`` is True on every row start .. start + length - 1 (per column)."""
+    counts = np.concatenate((np.zeros((1,) + mask.shape[1:], dtype=np.int32),
+                             np.cumsum(mask, axis=0, dtype=np.int32)))
+    return counts[start + length] - counts[start] == length
+
+
+def compute_race_events(t: np.ndarray, lap: np.ndarray, dist: np.ndarray, in_pit: np.ndarray,
+                        position: np.ndarray, order: np.ndarray, codes: Sequence[str], total_laps: int,
+                        lap_times: Optional[Dict[str, Dict[int, float]]] = None) -> List[Dict[str, Any]]:
+    """
+    Race events for the progress bar, found in one pass over the timeline.
+
+    Inputs are the timeline's (n_frames, n_drivers) channels, the standings
+    positions and the leaderboard order (see compute_progress). Each event
+    is {"type", "frame", "label", "lap"}, sorted by frame:
+
+    - "dnf": a car stops moving for good before the leader starts the last lap
+    - "leader_change": a new car leads (and stays in front for a few seconds)
+    - "overtake": a car passes another on track from lap 2 on; swaps while
+      either car is in the pit lane or has stopped are not counted
+    - "pit": a car enters the pit lane
+    - "fastest_lap": a new fastest lap of the race so far (``lap_times``,
+      {code: {lap: seconds}}, gives the official times; otherwise they are
+      measured on the timeline)
+
+    Leader changes and overtakes are only looked for until the winner takes
+    the flag.
+    """
+    n_frames, n_drivers = lap.shape
+    if n_frames < 2 or n_drivers == 0:
+        return []
+    events = []
+
+    def _add(kind, frames, labels, laps):
+        events.extend(
+            {"type": kind, "frame": int(frame), "label": label, "lap": int(lap_number)}
+            for frame, label, lap_number in zip(frames, labels, laps)
+        )
+
+    stop = _stop_frames(t, dist)
+    final_lap = np.flatnonzero(lap.max(axis=1) >= total_laps)
+    finish_frame = int(final_lap[0]) if len(final_lap) else n_frames
+    # Finishers' data ends at the line, so the race order is settled once the first of them stops
+    finishers = lap[-1] >= total_laps
+    race_end = int(stop[finishers].min()) if finishers.any() else n_frames
+
+    # Retirements
+    retired = np.flatnonzero((stop > 0) & (stop < finish_frame))
+    _add("dnf", stop[retired], [codes[j] for j in retired], lap[stop[retired], retired])
+
+    # Pit lane entries
+    entry_frames, entry_drivers = np.nonzero(in_pit[1:] & ~in_pit[:-1])
+    entry_frames += 1
+    _add("pit", entry_frames, [codes[j] for j in entry_drivers],
+         lap[entry_frames, entry_drivers])
+
+    samples = np.unique(np.searchsorted(t, np.arange(t[0], t[-1], EVENT_SAMPLE_SECONDS)))
+    samples = samples[samples < race_end]
+    sample_t = t[samples]
+
+    # Leader changes: runs of the same leader, ignoring the ones too short to count
+    if len(samples):
+        leader = order[samples, 0]
+        run_starts = np.flatnonzero(np.concatenate(([True], leader[1:] != leader[:-1])))
+        run_ends = np.append(sample_t[run_starts[1:]], t[-1])
+        kept = run_starts[run_ends - sample_t[run_starts] >= LEADER_HOLD_SECONDS]
+        changes = kept[1:][leader[kept[1:]] != leader[kept[:-1]]]
+        new_leaders = leader[changes]
+        _add("leader_change", samples[changes], [codes[j] for j in new_leaders],
+             lap[samples[changes], new_leaders])
+
+    # Overtakes: car a moves ahead of car b between two samples and stays
+    # there, with both cars racing (on track, past lap 1, not stopped)
+    hold = OVERTAKE_HOLD_SAMPLES
+    if len(samples) > hold + 1:
+        pos = position[samples]
+        ahead = pos[:, :, None] < pos[:, None, :]
+        racing = ~in_pit[samples] & (lap[samples] >= 2) & (samples[:, None] < stop[None, :])
+        k = np.arange(1, len(samples) - hold + 1)
+        racing_held = _held_for(racing, k - 1, hold + 1)
+        passes = (~ahead[k - 1] & _held_for(ahead, k, hold)
+                  & racing_held[:, :, None] & racing_held[:, None, :])
+        pass_k, passer, passed = np.nonzero(passes)
+        pass_frames = samples[k[pass_k]]
+        _add("overtake", pass_frames,
+             [f"{codes[a]} passes {codes[b]}" for a, b in zip(passer, passed)],
+             lap[pass_frames, passer])
+
+    # Fastest laps: completions grouped by driver in frame order, so each
+    # lap time is the gap to the same driver's previous lap start
+    lap_drivers, lap_frames = np.nonzero((lap[1:] > lap[:-1]).T)
+    lap_frames += 1  # first frame of the next lap
+    completed = lap[lap_frames - 1, lap_drivers].astype(np.int64)
+    lap_start = t[lap_frames]
+    same_driver = np.concatenate(([False], lap_drivers[1:] == lap_drivers[:-1]))
+    lap_time = np.where(same_driver, lap_start - np.concatenate(([np.nan], lap_start[:-1])), np.nan)
+    if lap_times:
+        official = np.array([lap_times.get(codes[j], {}).get(int(number), np.nan)
+                             for j, number in zip(lap_drivers, completed)], dtype=float)
+        lap_time = np.where(np.isnan(official), lap_time, official)
+    valid = np.flatnonzero(~np.isnan(lap_time) & (completed >= 2))
+    by_time = valid[np.argsort(lap_frames[valid], kind="stable")]
+    best_before = np.concatenate(([np.inf], np.minimum.accumulate(lap_time[by_time])[:-1]))
+    records = by_time[lap_time[by_time] < best_before]
+    _add("fastest_lap", lap_frames[records],
+         [f"{codes[j]} {format_time(float(lap_time[i]))}" for i, j in zip(records, lap_drivers[records])],
+         completed[records])
+
+    events.sort(key=lambda event: event["frame"])
+    return events
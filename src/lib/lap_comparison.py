@@ -0,0 +1,79 @@
+import numpy as np
+from typing import Dict, Hashable, List
+
+from src.lib.frames import LapFrames
+
+# Channels resampled onto the shared distance grid (gear is step-sampled)
+ALIGNED_CHANNELS = ("x", "y", "speed", "gear", "throttle", "brake")
+
+
+class LapComparison:
+    """
+    Several laps resampled onto one shared distance grid.
+
+    The grid is the fraction of the lap covered (rel_dist, 0 at the line and
+    1 at the end of the lap), so laps of different length or frame count
+    line up point for point. Every channel is held as an (n_laps, n_points)
+    array, together with the elapsed lap time at each grid point and the
+    running time delta to the reference lap (positive = behind).
+
+    Built once per selection of laps; the per-frame lookups (where each car
+    is after a given lap time, the delta there) are a few array operations
+    over all laps at once.
+    """
+
+    def __init__(self, laps: Dict[Hashable, LapFrames], reference: Hashable, n_points: int = 1000):
+        if reference not in laps:
+            raise ValueError("the reference lap must be one of the compared laps")
+
+        self.keys: List[Hashable] = list(laps)
+        self.reference = reference
+        self.grid = np.linspace(0.0, 1.0, n_points)
+
+        n_laps = len(self.keys)
+        self.time = np.empty((n_laps, n_points))
+        self.channels = {name: np.empty((n_laps, n_points)) for name in ALIGNED_CHANNELS}
+        for row, key in enumerate(self.keys):
+            lap = laps[key]
+            # rel_dist can dip by a few centimetres in noisy telemetry; the
+            # grid lookup needs it non-decreasing
+            rel_dist = np.maximum.accumulate(np.asarray(lap.telemetry["rel_dist"], dtype=float))
+            self.time[row] = np.interp(self.grid, rel_dist, np.asarray(lap.t, dtype=float) - float(lap.t[0]))
+
+            last = np.clip(np.searchsorted(rel_dist, self.grid, side="right") - 1, 0, len(rel_dist) - 1)
+            for name in ALIGNED_CHANNELS:
+                values = np.asarray(lap.telemetry[name], dtype=float)
+                self.channels[name][row] = values[last] if name == "gear" else np.interp(self.grid, rel_dist, values)
+
+        # Time lost to the reference lap at each point of the lap
+        self.delta = self.time - self.time[self.keys.index(reference)]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def row(self, key: Hashable) -> int:
+        return self.keys.index(key)
+
+    def index_at(self, elapsed: float) -> np.ndarray:
+        """Fractional grid index of every lap after ``elapsed`` seconds of its lap."""
+        n_points = len(self.grid)
+        rows = np.arange(len(self.keys))
+        # The elapsed time never decreases along the grid
+        i = np.clip((self.time <= elapsed).sum(axis=1) - 1, 0, n_points - 2)
+        t0 = self.time[rows, i]
+        t1 = self.time[rows, i + 1]
+        span = np.where(t1 > t0, t1 - t0, 1.0)
+        return i + np.clip((elapsed - t0) / span, 0.0, 1.0)
+
+    def sample(self, name: str, index: np.ndarray) -> np.ndarray:
+        """Per-lap values of ``name`` (a channel, "time" or "delta") at fractional grid indices."""
+        values = self.time if name == "time" else self.delta if name == "delta" else self.channels[name]
+        index = np.clip(np.asarray(index, dtype=float), 0.0, len(self.grid) - 1.0)
+        i = np.minimum(index.astype(int), len(self.grid) - 2)
+        frac = index - i
+        rows = np.arange(len(self.keys))
+        return values[rows, i] + (values[rows, i + 1] - values[rows, i]) * frac
+
+    def fraction(self, index: np.ndarray) -> np.ndarray:
+        """Fraction of the lap (the grid's x) at fractional grid indices."""
+        return np.asarray(index, dtype=float) / (len(self.grid) - 1)
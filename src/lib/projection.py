@@ -0,0 +1,123 @@
+import numpy as np
+from typing import Hashable, NamedTuple, Optional, Sequence
+from scipy.spatial import cKDTree
+
+
+class Projection(NamedTuple):
+    """Per-car result of TrackProjection.project (all arrays have one entry per car)."""
+    distance: np.ndarray  # along-track distance from the start of the reference line
+    nx: np.ndarray        # outward unit normal of the reference line at the nearest point
+    ny: np.ndarray
+    index: np.ndarray     # index of the nearest reference point (start of its segment)
+
+
+class TrackProjection:
+    """
+    Spatial index over a reference polyline for projecting car positions onto it.
+
+    Nearest points are found with a KD-tree over the reference points. When
+    cars are given stable keys (driver codes), each car's next search starts
+    from its previous index and only scans a small window around it, which is
+    both cheaper and keeps a car on its own part of the track where the
+    circuit passes close to itself; the KD-tree is the fallback when the car
+    has moved outside the window (e.g. after seeking).
+    """
+
+    def __init__(self, xs: Sequence[float], ys: Sequence[float], window: int = 32):
+        self.xs = np.asarray(xs, dtype=float)
+        self.ys = np.asarray(ys, dtype=float)
+        self.window = window
+        n = len(self.xs)
+
+        # cumulative distances along the reference polyline
+        seg_dx = np.diff(self.xs)
+        seg_dy = np.diff(self.ys)
+        self.seg_len = np.sqrt(seg_dx**2 + seg_dy**2)
+        self.cumdist = np.concatenate(([0.0], np.cumsum(self.seg_len)))
+        self.total_length = float(self.cumdist[-1]) if n > 0 else 0.0
+        # Segment i runs from point i to point i + 1; the last point has none
+        self._seg_dx = np.append(seg_dx, 0.0)
+        self._seg_dy = np.append(seg_dy, 0.0)
+        self._seg_len2 = self._seg_dx**2 + self._seg_dy**2
+
+        # Normals of the reference line
+        dx = np.gradient(self.xs) if n > 1 else np.zeros(n)
+        dy = np.gradient(self.ys) if n > 1 else np.zeros(n)
+        norm = np.sqrt(dx**2 + dy**2)
+        norm[norm == 0] = 1.0
+        self.nx = -dy / norm
+        self.ny = dx / norm
+
+        # Determine track winding using the shoelace formula to ensure normals point outwards.
+        # A positive area indicates counter-clockwise winding (normals point Left=Inside, so we flip).
+        # A negative area indicates clockwise winding (normals point Left=Outside, so we keep).
+        if n > 1:
+            signed_area = np.sum(self.xs[:-1] * self.ys[1:] - self.xs[1:] * self.ys[:-1])
+            signed_area += (self.xs[-1] * self.ys[0] - self.xs[0] * self.ys[-1])
+            if signed_area > 0:
+                self.nx = -self.nx
+                self.ny = -self.ny
+
+        # A car this far from the best point in its window is treated as lost
+        spacing = self.total_length / max(1, n - 1)
+        self._max_warm_distance2 = (spacing * window / 2) ** 2
+
+        self._tree = cKDTree(np.column_stack((self.xs, self.ys))) if n > 0 else None
+        self._last_index = {}
+
+    def reset(self):
+        """Forget the warm-start indices (the next call searches the whole track)."""
+        self._last_index = {}
+
+    def nearest(self, xs, ys, keys: Optional[Sequence[Hashable]] = None) -> np.ndarray:
+        """Index of the nearest reference point for each (x, y)."""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        n = len(self.xs)
+        index = np.full(len(xs), -1, dtype=np.int64)
+
+        if keys is not None and self._last_index:
+            previous = np.array([self._last_index.get(key, -1) for key in keys], dtype=np.int64)
+            warm = np.flatnonzero(previous >= 0)
+            if len(warm):
+                # Reference lines are a closed lap, so the window wraps around
+                offsets = np.arange(-self.window, self.window + 1)
+                candidates = (previous[warm, None] + offsets) % n
+                d2 = (self.xs[candidates] - xs[warm, None])**2 + (self.ys[candidates] - ys[warm, None])**2
+                best = np.argmin(d2, axis=1)
+                rows = np.arange(len(warm))
+                # Accept local minima inside the window that are close enough to the line
+                ok = (best > 0) & (best < len(offsets) - 1) & (d2[rows, best] <= self._max_warm_distance2)
+                index[warm[ok]] = candidates[rows, best][ok]
+
+        cold = np.flatnonzero(index < 0)
+        if len(cold):
+            _, found = self._tree.query(np.column_stack((xs[cold], ys[cold])))
+            index[cold] = found
+
+        if keys is not None:
+            self._last_index.update(zip(keys, index.tolist()))
+        return index
+
+    def project(self, xs, ys, keys: Optional[Sequence[Hashable]] = None) -> Projection:
+        """
+        Project car positions onto the reference line in one batched call.
+
+        Each car is projected onto the segment that starts at its nearest
+        reference point, giving its along-track distance, the outward normal
+        at that point and the segment index. Pass ``keys`` (one per car) to
+        warm-start the search from the previous call's indices.
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if len(self.xs) == 0 or len(xs) == 0:
+            empty = np.zeros(len(xs))
+            return Projection(empty, empty, empty, np.zeros(len(xs), dtype=np.int64))
+
+        index = self.nearest(xs, ys, keys)
+        seg_len2 = self._seg_len2[index]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t = ((xs - self.xs[index]) * self._seg_dx[index] + (ys - self.ys[index]) * self._seg_dy[index]) / seg_len2
+        t = np.where(seg_len2 > 0, np.clip(t, 0.0, 1.0), 0.0)
+        distance = self.cumdist[index] + t * np.sqrt(seg_len2)
+        return Projection(distance, self.nx[index], self.ny[index], index)
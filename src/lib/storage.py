@@ -0,0 +1,230 @@
+import json
+import os
+import shutil
+import numpy as np
+from typing import Any, Dict, Optional, Tuple
+
+from src.lib.frames import DRIVER_CHANNELS, LAP_CHANNELS, WEATHER_CHANNELS, LapFrames, RaceFrames
+
+# On-disk layout for computed telemetry: one directory per entry holding a
+# small manifest.json plus one .npy file per array. Arrays are opened with
+# np.load(mmap_mode='r'), so a replay only pages in the frames it shows.
+# Bump FORMAT_VERSION whenever the layout changes; older entries are ignored.
+FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+
+def _json_default(value):
+    # NumPy scalars leak into metadata (lap numbers, speeds...); store them as plain numbers
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def write_entry(directory: str, kind: str, arrays: Dict[str, np.ndarray], metadata: Dict[str, Any]) -> None:
+    """
+    Write arrays + metadata to ``directory``.
+
+    The entry is built in a temporary sibling directory and moved into place
+    at the end, so readers never see a half-written cache.
+    """
+    tmp_dir = f"{directory}.tmp-{os.getpid()}"
+    if os.path.exists(tmp_dir):
+        shutil.rmtree(tmp_dir)
+    os.makedirs(tmp_dir)
+
+    files = {}
+    for name, array in arrays.items():
+        filename = f"{name}.npy"
+        np.save(os.path.join(tmp_dir, filename), np.ascontiguousarray(array), allow_pickle=False)
+        files[name] = filename
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "kind": kind,
+        "arrays": files,
+        "metadata": metadata,
+    }
+    with open(os.path.join(tmp_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, default=_json_default)
+
+    if os.path.exists(directory):
+        shutil.rmtree(directory)
+    os.replace(tmp_dir, directory)
+
+
+def read_entry(directory: str, kind: str, mmap_mode: Optional[str] = "r") -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, Any]]]:
+    """
+    Open an entry written by write_entry.
+
+    Returns (arrays, metadata), or None if the entry is missing, of another
+    kind, or was written by a different format version.
+    """
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return None
+
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    if manifest.get("format_version") != FORMAT_VERSION or manifest.get("kind") != kind:
+        return None
+
+    arrays = {
+        name: np.load(os.path.join(directory, filename), mmap_mode=mmap_mode, allow_pickle=False)
+        for name, filename in manifest["arrays"].items()
+    }
+    return arrays, manifest["metadata"]
+
+
+def _int_keys(mapping: Dict[str, Any]) -> Dict[int, Any]:
+    # JSON object keys are strings; lap numbers were ints before saving
+    return {int(key): value for key, value in mapping.items()}
+
+
+# --- pipeline stages ------------------------------------------------------------
+
+def save_stage(directory: str, result: Dict[str, Any]) -> None:
+    """A stage result is {"arrays": {name: ndarray}, "metadata": {...JSON-able...}}."""
+    write_entry(directory, "stage", result.get("arrays", {}), result.get("metadata", {}))
+
+
+def load_stage(directory: str) -> Optional[Dict[str, Any]]:
+    entry = read_entry(directory, "stage")
+    if entry is None:
+        return None
+    arrays, metadata = entry
+    return {"arrays": arrays, "metadata": metadata}
+
+
+# --- race / sprint (single-entry layout, read when migrating older caches) ------
+
+def load_race_data(directory: str) -> Optional[Dict[str, Any]]:
+    entry = read_entry(directory, "race")
+    if entry is None:
+        return None
+    arrays, metadata = entry
+
+    channels = {name: arrays[f"driver.{name}"] for name in DRIVER_CHANNELS}
+    weather = {
+        name: arrays[f"weather.{name}"]
+        for name in WEATHER_CHANNELS
+        if f"weather.{name}" in arrays
+    }
+
+    data = dict(metadata)
+    codes = data.pop("codes")
+    data["frames"] = RaceFrames(
+        t=arrays["t"],
+        codes=codes,
+        channels=channels,
+        leader_lap=arrays["leader_lap"],
+        weather=weather,
+    )
+
+    # Restore the Python types that JSON flattened
+    data["driver_colors"] = {code: tuple(rgb) for code, rgb in data.get("driver_colors", {}).items()}
+    data["lap_times"] = {code: _int_keys(laps) for code, laps in data.get("lap_times", {}).items()}
+    data["sector_times"] = {code: _int_keys(laps) for code, laps in data.get("sector_times", {}).items()}
+    return data
+
+
+# --- qualifying / sprint qualifying ---------------------------------------------
+
+def save_quali_data(directory: str, data: Dict[str, Any]) -> None:
+    """
+    Every driver's Q1/Q2/Q3 lap frames are concatenated into one array per
+    channel; the manifest records each lap's [start, stop) slice. Weather
+    holds one row per lap and the manifest records the lap's row.
+    """
+    laps = []
+    telemetry_meta = {}
+    offset = 0
+
+    for code, driver_block in data["telemetry"].items():
+        telemetry_meta[code] = {}
+        for key, segment in driver_block.items():
+            if not isinstance(segment, dict):
+                telemetry_meta[code][key] = segment
+                continue
+
+            segment_meta = {name: value for name, value in segment.items() if name != "frames"}
+            frames = segment.get("frames") or []
+            if len(frames) > 0:
+                lap = frames if isinstance(frames, LapFrames) else LapFrames.from_frame_dicts(frames)
+                segment_meta["frames"] = [offset, offset + len(lap)]
+                segment_meta["weather"] = len(laps) if lap.weather else None
+                offset += len(lap)
+                laps.append(lap)
+            else:
+                segment_meta["frames"] = None
+            telemetry_meta[code][key] = segment_meta
+
+    arrays = {"t": np.concatenate([lap.t for lap in laps]) if laps else np.zeros(0)}
+    for name, dtype in LAP_CHANNELS.items():
+        arrays[f"lap.{name}"] = (
+            np.concatenate([lap.telemetry[name] for lap in laps]).astype(dtype) if laps else np.zeros(0, dtype=dtype)
+        )
+    if any(lap.weather for lap in laps):
+        for name in WEATHER_CHANNELS:
+            arrays[f"weather.{name}"] = np.array([
+                lap.weather[name][0] if lap.weather and name in lap.weather else np.nan
+                for lap in laps
+            ], dtype=np.float32)
+
+    metadata = {key: value for key, value in data.items() if key != "telemetry"}
+    metadata["telemetry"] = telemetry_meta
+
+    write_entry(directory, "quali", arrays, metadata)
+
+
+def load_quali_data(directory: str) -> Optional[Dict[str, Any]]:
+    entry = read_entry(directory, "quali")
+    if entry is None:
+        return None
+    arrays, metadata = entry
+
+    data = dict(metadata)
+    telemetry = {}
+    for code, driver_block in metadata["telemetry"].items():
+        telemetry[code] = {}
+        for key, segment in driver_block.items():
+            if not isinstance(segment, dict):
+                telemetry[code][key] = segment
+                continue
+
+            segment = dict(segment)
+            bounds = segment.pop("frames")
+            weather_row = segment.pop("weather", None)
+            # Entries written before per-lap weather hold one row per frame
+            if segment.pop("has_weather", False) and bounds is not None:
+                weather_row = bounds[0]
+            if bounds is None:
+                segment["frames"] = []
+            else:
+                start, stop = bounds
+                weather = None
+                if weather_row is not None:
+                    weather = {
+                        name: arrays[f"weather.{name}"][weather_row:weather_row + 1]
+                        for name in WEATHER_CHANNELS
+                        if f"weather.{name}" in arrays
+                    }
+                segment["frames"] = LapFrames(
+                    t=arrays["t"][start:stop],
+                    telemetry={name: arrays[f"lap.{name}"][start:stop] for name in LAP_CHANNELS},
+                    weather=weather,
+                )
+            telemetry[code][key] = segment
+
+    data["telemetry"] = telemetry
+    for result in data.get("results", []):
+        if isinstance(result.get("color"), list):
+            result["color"] = tuple(result["color"])
+    return data
@@ -0,0 +1,77 @@
+import numpy as np
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+# FastF1 track status codes
+GREEN = "1"
+YELLOW = "2"
+SAFETY_CAR = "4"
+RED_FLAG = "5"
+VSC = ("6", "7")  # deployed / ending
+
+
+class TrackStatusIndex:
+    """
+    Track status periods (yellow, safety car, VSC, red flag) as sorted
+    interval arrays.
+
+    Built once from the ``track_statuses`` list produced by the pipeline
+    ({"status", "start_time", "end_time"} in timeline seconds; the last
+    period has no end). Looking up the status at a time is a single
+    np.searchsorted over the start times, so races with many status changes
+    cost no more per frame than races with few. When the timeline's frame
+    times are given, the intervals are also held as frame indices for
+    per-frame lookups and the progress bar.
+    """
+
+    def __init__(self, track_statuses: List[dict], frame_times: Optional[Sequence[float]] = None):
+        records = sorted(track_statuses or [], key=lambda status: float(status.get("start_time", 0.0)))
+        self.codes = [str(status.get("status", "")) for status in records]
+        self.starts = np.array([float(status.get("start_time", 0.0)) for status in records])
+        self.ends = np.array([np.inf if status.get("end_time") is None else float(status["end_time"])
+                              for status in records])
+        # A period ends at the next one's start at the latest, so the
+        # intervals never overlap and a search over the starts finds the match
+        if len(self.starts) > 1:
+            self.ends[:-1] = np.minimum(self.ends[:-1], self.starts[1:])
+
+        self.n_frames = None
+        self.start_frames = None
+        self.end_frames = None
+        if frame_times is not None:
+            frame_times = np.asarray(frame_times, dtype=float)
+            self.n_frames = len(frame_times)
+            # First frame at or after each boundary (an open end maps past the last frame)
+            self.start_frames = np.searchsorted(frame_times, self.starts, side="left")
+            self.end_frames = np.searchsorted(frame_times, self.ends, side="left")
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def _lookup(self, starts: np.ndarray, ends: np.ndarray, value: float) -> str:
+        i = int(np.searchsorted(starts, value, side="right")) - 1
+        if i < 0 or value >= ends[i]:
+            return GREEN
+        return self.codes[i]
+
+    def status_at(self, seconds: float) -> str:
+        """Status code at a timeline time (green outside any period)."""
+        return self._lookup(self.starts, self.ends, seconds)
+
+    def status_at_frame(self, index: int) -> str:
+        """Status code at a frame index."""
+        if self.start_frames is None:
+            raise ValueError("TrackStatusIndex was built without frame times")
+        return self._lookup(self.start_frames, self.end_frames, int(index))
+
+    def frame_segments(self) -> Iterator[Tuple[str, int, int]]:
+        """
+        (status, start_frame, end_frame) for every period that overlaps the
+        timeline; end_frame is exclusive and clamped to the number of frames.
+        """
+        if self.start_frames is None:
+            raise ValueError("TrackStatusIndex was built without frame times")
+        for code, start, end in zip(self.codes, self.start_frames.tolist(), self.end_frames.tolist()):
+            # Periods that ended before the first frame (pre-race statuses) are skipped
+            if end <= 0:
+                continue
+            yield code, start, min(end, self.n_frames)
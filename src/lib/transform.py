@@ -0,0 +1,104 @@
+import numpy as np
+from typing import Optional, Tuple
+
+
+class ScreenTransform:
+    """
+    Affine world -> screen mapping held as a 3x3 matrix.
+
+    The replay windows fit the track (rotated about its centre) into the area
+    between their side panels. Building the matrix once per resize lets the
+    whole track outline, a DRS zone or every car be mapped with a single
+    NumPy call instead of one Python call per point.
+    """
+
+    def __init__(self, matrix: Optional[np.ndarray] = None):
+        self.matrix = np.eye(3) if matrix is None else np.asarray(matrix, dtype=float)
+
+    @classmethod
+    def rotation(cls, degrees: float, center: Tuple[float, float] = (0.0, 0.0)) -> "ScreenTransform":
+        """Rotation by ``degrees`` (counter-clockwise) about ``center``."""
+        rad = float(np.deg2rad(degrees)) if degrees else 0.0
+        cos_r, sin_r = np.cos(rad), np.sin(rad)
+        cx, cy = center
+        return cls([
+            [cos_r, -sin_r, cx - cos_r * cx + sin_r * cy],
+            [sin_r, cos_r, cy - sin_r * cx - cos_r * cy],
+            [0.0, 0.0, 1.0],
+        ])
+
+    @classmethod
+    def scale_translate(cls, sx: float, sy: float, tx: float = 0.0, ty: float = 0.0) -> "ScreenTransform":
+        return cls([
+            [sx, 0.0, tx],
+            [0.0, sy, ty],
+            [0.0, 0.0, 1.0],
+        ])
+
+    @classmethod
+    def fit(cls, xs, ys, left: float, bottom: float, width: float, height: float,
+            rotation: float = 0.0, padding: float = 0.05,
+            center: Optional[Tuple[float, float]] = None) -> "ScreenTransform":
+        """
+        Fit the points ``xs``/``ys`` into the screen box (left, bottom, width,
+        height), keeping the aspect ratio.
+
+        The points are rotated by ``rotation`` degrees about ``center`` (the
+        middle of their bounding box by default) and scaled to fit the padded
+        box, with ``center`` placed at the middle of the box.
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if center is None:
+            center = ((xs.min() + xs.max()) / 2, (ys.min() + ys.max()) / 2) if xs.size else (0.0, 0.0)
+
+        rotate = cls.rotation(rotation, center)
+        if xs.size:
+            rx, ry = rotate.apply(xs, ys)
+            world_w = max(1.0, float(rx.max() - rx.min()))
+            world_h = max(1.0, float(ry.max() - ry.min()))
+        else:
+            world_w = world_h = 1.0
+
+        usable_w = width * (1 - 2 * padding)
+        usable_h = height * (1 - 2 * padding)
+        scale = min(usable_w / world_w, usable_h / world_h)
+
+        screen_cx = left + width / 2
+        screen_cy = bottom + height / 2
+        place = cls.scale_translate(scale, scale, screen_cx - scale * center[0], screen_cy - scale * center[1])
+        return place @ rotate
+
+    def __matmul__(self, other: "ScreenTransform") -> "ScreenTransform":
+        # (self @ other) applies ``other`` first, then ``self``
+        return ScreenTransform(self.matrix @ other.matrix)
+
+    @property
+    def scale(self) -> float:
+        """Uniform scale factor (screen pixels per world unit)."""
+        return float(np.sqrt(abs(np.linalg.det(self.matrix[:2, :2]))))
+
+    def inverse(self) -> "ScreenTransform":
+        return ScreenTransform(np.linalg.inv(self.matrix))
+
+    def apply(self, xs, ys) -> Tuple[np.ndarray, np.ndarray]:
+        """Map arrays of world coordinates to screen coordinates."""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        m = self.matrix
+        return m[0, 0] * xs + m[0, 1] * ys + m[0, 2], m[1, 0] * xs + m[1, 1] * ys + m[1, 2]
+
+    def apply_point(self, x: float, y: float) -> Tuple[float, float]:
+        m = self.matrix
+        return (float(m[0, 0] * x + m[0, 1] * y + m[0, 2]),
+                float(m[1, 0] * x + m[1, 1] * y + m[1, 2]))
+
+    def apply_points(self, xs, ys) -> list:
+        """Like ``apply``, as a list of (x, y) tuples for arcade's point lists."""
+        sx, sy = self.apply(xs, ys)
+        return list(zip(sx.tolist(), sy.tolist()))
+
+    def apply_vector(self, dx, dy) -> Tuple[np.ndarray, np.ndarray]:
+        """Map direction vectors (rotation and scale only, no translation)."""
+        m = self.matrix
+        return m[0, 0] * dx + m[0, 1] * dy, m[1, 0] * dx + m[1, 1] * dy
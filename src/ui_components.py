@@ -2,8 +2,14 @@ import arcade
 from typing import List, Literal, Tuple, Optional
 from typing import Sequence, Optional, Tuple
 from src.lib.time import format_time
+from src.lib.transform import ScreenTransform
+from src.lib.track_status import TrackStatusIndex, YELLOW, SAFETY_CAR, RED_FLAG, VSC
 import numpy as np
 import os
+from arcade.shape_list import (
+    ShapeElementList, create_line, create_lines, create_polygon,
+    create_rectangle_filled, create_rectangle_outline, create_ellipse_filled,
+)
 
 def _format_wind_direction(degrees: Optional[float]) -> str:
   if degrees is None:
@@ -20,6 +26,43 @@ class BaseComponent:
     def on_resize(self, window): pass
     def draw(self, window): pass
     def on_mouse_press(self, window, x: float, y: float, button: int, modifiers: int) -> bool: return False
+    # Returns True when the hover state changed and the window needs a redraw
+    def on_mouse_motion(self, window, x: float, y: float, dx: float, dy: float) -> bool: return False
+
+class TextPool:
+    """
+    Persistent arcade.Text objects keyed by slot (e.g. ("row", 3)).
+
+    Creating an arcade.Text lays the string out with pyglet, so drawing a new
+    one per label per frame is expensive. A slot keeps its Text across
+    frames and only updates the string, colour or position when they
+    change; a different font size or style rebuilds it.
+    """
+    def __init__(self):
+        self._slots = {}
+
+    def get(self, slot, text, x: float, y: float, color=arcade.color.WHITE, font_size: float = 12, **style) -> arcade.Text:
+        text = str(text)
+        entry = self._slots.get(slot)
+        if entry is None or entry[1] != (font_size, style):
+            obj = arcade.Text(text, x, y, color, font_size, **style)
+            self._slots[slot] = (obj, (font_size, style), text, (x, y), color)
+            return obj
+
+        obj, key, last_text, last_position, last_color = entry
+        if text != last_text:
+            obj.text = text
+        if (x, y) != last_position:
+            obj.position = (x, y)
+        if color != last_color:
+            obj.color = color
+        self._slots[slot] = (obj, key, text, (x, y), color)
+        return obj
+
+    def draw(self, slot, text, x: float, y: float, color=arcade.color.WHITE, font_size: float = 12, **style) -> arcade.Text:
+        obj = self.get(slot, text, x, y, color, font_size, **style)
+        obj.draw()
+        return obj
 
 class LegendComponent(BaseComponent):
     def __init__(self, x: int = 20, y: int = 220, visible=True): # Increased y to 220 to fit all lines
@@ -155,7 +198,7 @@ class WeatherComponent(BaseComponent):
                     texture_path = os.path.join(weather_folder, filename)
                     self._weather_icon_textures[texture_name] = arcade.load_texture(texture_path)
 
-        self._text = arcade.Text("", self.left + 12, 0, arcade.color.LIGHT_GRAY, 14, anchor_y="top")
+        self._texts = TextPool()
 
     def set_info(self, info: Optional[dict]):
         self.info = info
@@ -188,7 +231,6 @@ class WeatherComponent(BaseComponent):
         panel_top = window.height - self.top_offset
         if not self.info and not getattr(window, "has_weather", False):
             return
-        arcade.Text("Weather", self.left + 12, panel_top - 10, arcade.color.WHITE, 18, bold=True, anchor_y="top").draw()
         def _fmt(val, suffix="", precision=1):
             return f"{val:.{precision}f}{suffix}" if val is not None else "N/A"
         info = self.info or {}
@@ -204,10 +246,8 @@ class WeatherComponent(BaseComponent):
         start_y = panel_top - 36
         last_y = start_y
 
-        self._text.font_size = 18; self._text.bold = True; self._text.color = arcade.color.WHITE
-        self._text.text = "Weather"
-        self._text.x = self.left + 12; self._text.y = panel_top - 10
-        self._text.draw()
+        self._texts.draw("title", "Weather", self.left + 12, panel_top - 10, arcade.color.WHITE, 18,
+                         bold=True, anchor_y="top")
 
         for idx, (label, value, icon_key) in enumerate(weather_lines):
             line_y = start_y - idx * 22
@@ -230,10 +270,8 @@ class WeatherComponent(BaseComponent):
 
             line_text = f"{label}: {value}"
             
-            self._text.font_size = 14; self._text.bold = False; self._text.color = arcade.color.LIGHT_GRAY
-            self._text.text = line_text
-            self._text.x = self.left + 38; self._text.y = line_y
-            self._text.draw()
+            self._texts.draw(("line", idx), line_text, self.left + 38, line_y, arcade.color.LIGHT_GRAY, 14,
+                             anchor_y="top")
 
         # Track the bottom of the weather panel so info boxes can stack below it
         window.weather_bottom = last_y - 20
@@ -246,6 +284,7 @@ class LeaderboardComponent(BaseComponent):
         self.rects = []    # clickable rects per entry
         self.selected = []  # Changed to list for multiple selection
         self.row_height = 25
+        self._texts = TextPool()
         self._tyre_textures = {}
         self._visible: bool = visible
         # Import the tyre textures from the images/tyres folder (all files)
@@ -279,7 +318,7 @@ class LeaderboardComponent(BaseComponent):
         self._visible = True
 
     def set_entries(self, entries: List[Tuple[str, Tuple[int,int,int], dict, float]]):
-        # entries sorted as expected
+        # entries already in leaderboard order (the pipeline's per-frame order)
         self.entries = entries
     def draw(self, window):
         # Skip rendering entirely if hidden
@@ -287,22 +326,10 @@ class LeaderboardComponent(BaseComponent):
             return
         self.selected = getattr(window, "selected_drivers", [])
         leaderboard_y = window.height - 40
-        arcade.Text("Leaderboard", self.x, leaderboard_y, arcade.color.WHITE, 20, bold=True, anchor_x="left", anchor_y="top").draw()
+        self._texts.draw("title", "Leaderboard", self.x, leaderboard_y, arcade.color.WHITE, 20, bold=True, anchor_x="left", anchor_y="top")
         self.rects = []
 
-        # Sort entries by lap number an distance progressed
-        # If any of the entries have lap > 1, then sort
-
-        if any(e[2].get("lap", 0) > 1 for e in self.entries):
-            new_entries = sorted(
-                self.entries,
-                key=lambda e: (
-                    -e[2].get("lap", 0),  # Descending lap number
-                    -e[2].get("dist")                 # Descending distance progressed
-                )
-            )
-        else:
-            new_entries = self.entries
+        new_entries = self.entries
 
         for i, (code, color, pos, progress_m) in enumerate(new_entries):
             current_pos = i + 1
@@ -319,7 +346,7 @@ class LeaderboardComponent(BaseComponent):
             else:
                 text_color = color
             text = f"{current_pos}. {code}" if pos.get("rel_dist",0) != 1 else f"{current_pos}. {code}   OUT"
-            arcade.Text(text, left_x, top_y, text_color, 16, anchor_x="left", anchor_y="top").draw()
+            self._texts.draw(("row", i), text, left_x, top_y, text_color, 16, anchor_x="left", anchor_y="top")
 
              # Tyre Icons
             tyre_texture = self._tyre_textures.get(str(pos.get("tyre", "?")).upper())
@@ -353,10 +380,10 @@ class LeaderboardComponent(BaseComponent):
                 arcade.draw_circle_filled(drs_dot_x, drs_dot_y, 4, drs_color)
 
         # Add text at the bottom of the leaderboard during lap 1 to alert the user to potential mis-ordering
-        if new_entries[0][2].get("lap", 0) == 1:
-            arcade.Text("May be inaccurate during Lap 1",
-                        self.x, leaderboard_y - 30 - (len(new_entries) * self.row_height) - 20,
-                        arcade.color.YELLOW, 12, anchor_x="left", anchor_y="top").draw()
+        if new_entries and new_entries[0][2].get("lap", 0) == 1:
+            self._texts.draw("lap1_warning", "May be inaccurate during Lap 1",
+                             self.x, leaderboard_y - 30 - (len(new_entries) * self.row_height) - 20,
+                             arcade.color.YELLOW, 12, anchor_x="left", anchor_y="top")
 
     def on_mouse_press(self, window, x: float, y: float, button: int, modifiers: int):
         for code, left, bottom, right, top in self.rects:
@@ -391,6 +418,7 @@ class LapTimeLeaderboardComponent(BaseComponent):
         self.selected = []  # Changed to list
         self.row_height = 25
         self._visible = True
+        self._texts = TextPool()
 
     def set_entries(self, entries: List[dict]):
         """Accept a list of dicts with keys: pos, code, color, time"""
@@ -417,7 +445,7 @@ class LapTimeLeaderboardComponent(BaseComponent):
             return
         self.selected = getattr(window, "selected_drivers", [])
         leaderboard_y = window.height - 40
-        arcade.Text("Lap Times", self.x, leaderboard_y, arcade.color.WHITE, 20, bold=True, anchor_x="left", anchor_y="top").draw()
+        self._texts.draw("title", "Lap Times", self.x, leaderboard_y, arcade.color.WHITE, 20, bold=True, anchor_x="left", anchor_y="top")
         self.rects = []
         for i, entry in enumerate(self.entries):
             pos = entry.get('pos', i + 1)
@@ -442,8 +470,8 @@ class LapTimeLeaderboardComponent(BaseComponent):
                 text_color = tuple(color) if isinstance(color, (list, tuple)) else arcade.color.WHITE
 
             # Draw code on left, time right-aligned
-            arcade.Text(f"{pos}. {code}", left_x + 8, top_y, text_color, 16, anchor_x="left", anchor_y="top").draw()
-            arcade.Text(time_str, right_x - 8, top_y, text_color, 14, anchor_x="right", anchor_y="top").draw()
+            self._texts.draw(("code", i), f"{pos}. {code}", left_x + 8, top_y, text_color, 16, anchor_x="left", anchor_y="top")
+            self._texts.draw(("time", i), time_str, right_x - 8, top_y, text_color, 14, anchor_x="right", anchor_y="top")
 
     def on_mouse_press(self, window, x: float, y: float, button: int, modifiers: int):
         for code, left, bottom, right, top in self.rects:
@@ -618,6 +646,7 @@ class DriverInfoComponent(BaseComponent):
         self.left = left
         self.width = width
         self.min_top = min_top
+        self._texts = TextPool()
 
     def draw(self, window):
         # Support multiple selection via window.selected_drivers
@@ -660,24 +689,26 @@ class DriverInfoComponent(BaseComponent):
         header_height = 30
         header_cy = top - (header_height / 2)
         arcade.draw_rect_filled(arcade.XYWH(center_x, header_cy, box_width, header_height), team_color)
-        arcade.Text(f"Driver: {code}", left + 10, header_cy, arcade.color.BLACK, 14, anchor_y="center",
-                    bold=True).draw()
+        texts = self._texts
+        texts.draw((code, "header"), f"Driver: {code}", left + 10, header_cy, arcade.color.BLACK, 14,
+                   anchor_y="center", bold=True)
 
         cursor_y, row_gap = top - header_height - 25, 25
         left_text_x = left + 15
 
         # Telemetry Text
         speed = driver_pos.get('speed', 0)
-        arcade.Text(f"Speed: {speed:.0f} km/h", left + 15, cursor_y, arcade.color.WHITE, 12, anchor_y="center").draw()
+        texts.draw((code, "speed"), f"Speed: {speed:.0f} km/h", left + 15, cursor_y, arcade.color.WHITE, 12,
+                   anchor_y="center")
         cursor_y -= row_gap
-        arcade.Text(f"Gear: {driver_pos.get('gear', '-')}", left + 15, cursor_y, arcade.color.WHITE, 12,
-                    anchor_y="center").draw()
+        texts.draw((code, "gear"), f"Gear: {driver_pos.get('gear', '-')}", left + 15, cursor_y, arcade.color.WHITE, 12,
+                   anchor_y="center")
         cursor_y -= row_gap
 
         drs_val = driver_pos.get('drs', 0)
         drs_str, drs_color = ("DRS: ON", arcade.color.GREEN) if drs_val in [10, 12, 14] else \
             ("DRS: AVAIL", arcade.color.YELLOW) if drs_val == 8 else ("DRS: OFF", arcade.color.GRAY)
-        arcade.Text(drs_str, left + 15, cursor_y, drs_color, 12, anchor_y="center", bold=True).draw()
+        texts.draw((code, "drs"), drs_str, left + 15, cursor_y, drs_color, 12, anchor_y="center", bold=True)
         cursor_y -= row_gap
 
         # Gaps (Calculated from Leaderboard)
@@ -725,9 +756,9 @@ class DriverInfoComponent(BaseComponent):
             except (StopIteration, IndexError):
                 pass
 
-        arcade.Text(gap_ahead, left_text_x, cursor_y, arcade.color.LIGHT_GRAY, 11, anchor_y="center").draw()
+        texts.draw((code, "gap_ahead"), gap_ahead, left_text_x, cursor_y, arcade.color.LIGHT_GRAY, 11, anchor_y="center")
         cursor_y -= 22
-        arcade.Text(gap_behind, left_text_x, cursor_y, arcade.color.LIGHT_GRAY, 11, anchor_y="center").draw()
+        texts.draw((code, "gap_behind"), gap_behind, left_text_x, cursor_y, arcade.color.LIGHT_GRAY, 11, anchor_y="center")
 
         # Graphs
         thr, brk = driver_pos.get('throttle', 0), driver_pos.get('brake', 0)
@@ -736,12 +767,12 @@ class DriverInfoComponent(BaseComponent):
         r_center = right - 50
 
         # Throttle
-        arcade.Text("THR", r_center - 15, b_y - 20, arcade.color.WHITE, 10, anchor_x="center").draw()
+        texts.draw((code, "thr"), "THR", r_center - 15, b_y - 20, arcade.color.WHITE, 10, anchor_x="center")
         arcade.draw_rect_filled(arcade.XYWH(r_center - 15, b_y + bar_h / 2, bar_w, bar_h), arcade.color.DARK_GRAY)
         if t_r > 0: arcade.draw_rect_filled(arcade.XYWH(r_center - 15, b_y + (bar_h * t_r) / 2, bar_w, bar_h * t_r),
                                             arcade.color.GREEN)
         # Brake
-        arcade.Text("BRK", r_center + 15, b_y - 20, arcade.color.WHITE, 10, anchor_x="center").draw()
+        texts.draw((code, "brk"), "BRK", r_center + 15, b_y - 20, arcade.color.WHITE, 10, anchor_x="center")
         arcade.draw_rect_filled(arcade.XYWH(r_center + 15, b_y + bar_h / 2, bar_w, bar_h), arcade.color.DARK_GRAY)
         if b_r > 0: arcade.draw_rect_filled(arcade.XYWH(r_center + 15, b_y + (bar_h * b_r) / 2, bar_w, bar_h * b_r),
                                             arcade.color.RED)
@@ -967,6 +998,8 @@ class RaceProgressBarComponent(BaseComponent):
     """
     A visual progress bar showing race timeline with event markers:
     - DNF markers (red X)
+    - Leader changes (gold triangles) and new fastest laps (purple dots)
+    - Overtakes and pit entries (short ticks inside the bar)
     - Lap transition markers (vertical lines)
     - Flag markers (red/yellow rectangles)
     
@@ -978,6 +1011,10 @@ class RaceProgressBarComponent(BaseComponent):
     
     # Event type constants for clear identification
     EVENT_DNF = "dnf"
+    EVENT_LEADER_CHANGE = "leader_change"
+    EVENT_OVERTAKE = "overtake"
+    EVENT_PIT = "pit"
+    EVENT_FASTEST_LAP = "fastest_lap"
     EVENT_LAP = "lap"
     EVENT_YELLOW_FLAG = "yellow_flag"
     EVENT_RED_FLAG = "red_flag"
@@ -990,6 +1027,10 @@ class RaceProgressBarComponent(BaseComponent):
         "progress_fill": (0, 180, 0),
         "progress_border": (100, 100, 100),
         "dnf": (220, 50, 50),
+        "leader_change": (255, 215, 0),
+        "overtake": (120, 200, 120),
+        "pit": (80, 160, 255),
+        "fastest_lap": (170, 60, 220),
         "lap_marker": (80, 80, 80),
         "yellow_flag": (255, 220, 0),
         "red_flag": (220, 30, 30),
@@ -1029,6 +1070,22 @@ class RaceProgressBarComponent(BaseComponent):
         self._total_laps: int = 0
         self._bar_left: float = 0
         self._bar_width: float = 0
+
+        # Frame -> bar x mapping and the marker positions it produces, rebuilt
+        # only when the bar is resized or given new race data
+        self._transform = ScreenTransform()
+        self._geometry_key = None
+        self._lap_frames: Optional[np.ndarray] = None
+        self._lap_xs = np.empty(0)
+        self._lap_labels: List[Tuple[int, float]] = []
+        self._event_xs = np.empty(0)
+        self._texts = TextPool()
+
+        # Static layers (background, lap ticks, flags, event markers) uploaded
+        # to the GPU once and rebuilt only when the geometry above changes;
+        # only the fill and the playhead are drawn per frame
+        self._background_shapes: Optional[ShapeElementList] = None
+        self._marker_shapes: Optional[ShapeElementList] = None
         
         # Hover state for tooltips
         self._hover_event: Optional[dict] = None
@@ -1038,17 +1095,22 @@ class RaceProgressBarComponent(BaseComponent):
     def set_race_data(self, 
                       total_frames: int, 
                       total_laps: int,
-                      events: List[dict]):
+                      events: List[dict],
+                      lap_frames: Optional[Sequence[int]] = None):
         """
         set the race data for the progress bar so the calc for markers can be done once time
         
         - total_frames: Total number of frames in the race
         - total_laps: Total number of laps in the race
         - events: List of event dictionaries with keys
+        - lap_frames: First frame of each lap (lap 1 first); without it the
+          lap ticks are spaced evenly
         """
         self._total_frames = max(1, total_frames)
         self._total_laps = total_laps or 1
         self._events = sorted(events, key=lambda e: e.get("frame", 0))
+        self._lap_frames = None if lap_frames is None else np.asarray(lap_frames)
+        self._geometry_key = None
     
     @property
     def visible(self) -> bool:
@@ -1074,6 +1136,36 @@ class RaceProgressBarComponent(BaseComponent):
     def _calculate_bar_dimensions(self, window):
         self._bar_left = self.left_margin
         self._bar_width = max(100, window.width - self.left_margin - self.right_margin)
+
+        key = (self._bar_left, self._bar_width, self._total_frames, self._total_laps, len(self._events))
+        if key == self._geometry_key:
+            return
+        self._geometry_key = key
+        self._transform = ScreenTransform.scale_translate(
+            self._bar_width / max(1, self._total_frames), 1.0, self._bar_left, 0.0
+        )
+        # Lap markers: the real lap starts when known, otherwise the
+        # approximate frame at which each lap ends
+        if self._lap_frames is not None:
+            laps = np.arange(1, len(self._lap_frames) + 1)
+            lap_frames = self._lap_frames
+        else:
+            laps = np.arange(1, self._total_laps + 1) if self._total_laps > 1 else np.empty(0, dtype=int)
+            lap_frames = (laps / self._total_laps * self._total_frames).astype(int)
+        if self._total_laps <= 1:
+            laps, lap_frames = laps[:0], lap_frames[:0]
+        event_frames = np.array([event.get("frame", 0) for event in self._events], dtype=float)
+        self._lap_xs = self._frame_to_x(lap_frames)
+        self._event_xs = self._frame_to_x(event_frames)
+
+        # Lap numbers below the bar for the first, last and every 10th lap
+        last_lap = int(laps[-1]) if len(laps) else 0
+        self._lap_labels = [
+            (lap, lap_x) for lap, lap_x in zip(laps.tolist(), self._lap_xs.tolist())
+            if lap == 1 or lap == last_lap or lap % 10 == 0
+        ]
+        self._background_shapes = None
+        self._marker_shapes = None
         
     def _frame_to_x(self, frame: int, clamp: bool = True) -> float:
         """
@@ -1084,21 +1176,22 @@ class RaceProgressBarComponent(BaseComponent):
             clamp: Whether to clamp frame to valid range [0, total_frames]
         """
         if self._total_frames <= 0:
-            return self._bar_left
+            return self._bar_left if np.ndim(frame) == 0 else np.full(np.shape(frame), float(self._bar_left))
         
         # here we use Clamp frame to valid range to prevent rendering outside bar bounds
+        # (frame may also be an array of frames, mapped in one call)
         if clamp:
-            frame = max(0, min(frame, self._total_frames))
+            frame = np.clip(frame, 0, self._total_frames)
         
-        progress = frame / self._total_frames
-        return self._bar_left + (progress * self._bar_width)
+        x, _ = self._transform.apply(frame, 0.0)
+        return x if np.ndim(x) else float(x)
     
     def _x_to_frame(self, x: float) -> int:
         # reverse of _frame_to_x
         if self._bar_width <= 0:
             return 0
-        progress = (x - self._bar_left) / self._bar_width
-        return int(progress * self._total_frames)
+        frame, _ = self._transform.inverse().apply_point(x, 0.0)
+        return int(frame)
         
     def on_resize(self, window):
         self._calculate_bar_dimensions(window)
@@ -1110,20 +1203,15 @@ class RaceProgressBarComponent(BaseComponent):
             return
             
         self._calculate_bar_dimensions(window)
+        if self._background_shapes is None:
+            self._build_static_shapes()
         
         current_frame = int(getattr(window, 'frame_index', 0))
         
         bar_center_y = self.bottom + self.height / 2
         
-        # 1. Draw background bar
-        bg_rect = arcade.XYWH(
-            self._bar_left + self._bar_width / 2,
-            bar_center_y,
-            self._bar_width,
-            self.height
-        )
-        arcade.draw_rect_filled(bg_rect, self.COLORS["background"])
-        arcade.draw_rect_outline(bg_rect, self.COLORS["progress_border"], 2)
+        # 1. Background bar (static layer)
+        self._background_shapes.draw()
         
         # 2. Draw progress fill
         if self._total_frames > 0:
@@ -1138,33 +1226,15 @@ class RaceProgressBarComponent(BaseComponent):
                 )
                 arcade.draw_rect_filled(progress_rect, self.COLORS["progress_fill"])
         
-        # 3. Draw lap markers (vertical lines)
-        if self._total_laps > 1:
-            for lap in range(1, self._total_laps + 1):
-                # Approximate frame for lap transition
-                lap_frame = int((lap / self._total_laps) * self._total_frames)
-                lap_x = self._frame_to_x(lap_frame)
-                
-                # Draw subtle vertical line
-                arcade.draw_line(
-                    lap_x, self.bottom + 2,
-                    lap_x, self.bottom + self.height - 2,
-                    self.COLORS["lap_marker"], 1
-                )
-                
-                # Draw lap number below for major laps (every 5 laps or first/last)
-                if lap == 1 or lap == self._total_laps or lap % 10 == 0:
-                    arcade.Text(
-                        str(lap),
-                        lap_x, self.bottom - 4,
-                        self.COLORS["text"], 9,
-                        anchor_x="center", anchor_y="top"
-                    ).draw()
-        
-        # 4. Draw event markers
-        for event in self._events:
-            event_x = self._frame_to_x(event.get("frame", 0))
-            self._draw_event_marker(event, event_x, bar_center_y)
+        # 3-4. Lap markers, flag segments and event markers (static layer)
+        self._marker_shapes.draw()
+        for lap, lap_x in self._lap_labels:
+            self._texts.draw(
+                ("lap", lap), str(lap),
+                lap_x, self.bottom - 4,
+                self.COLORS["text"], 9,
+                anchor_x="center", anchor_y="top"
+            )
         
         # 5. Draw current position indicator (playhead)
         current_x = self._frame_to_x(current_frame)
@@ -1176,6 +1246,36 @@ class RaceProgressBarComponent(BaseComponent):
         
         # 6. Draw legend
         self._draw_legend(window)
+
+    def _build_static_shapes(self):
+        """Upload the background, lap ticks, flag segments and event markers as shape lists."""
+        bar_center_x = self._bar_left + self._bar_width / 2
+        bar_center_y = self.bottom + self.height / 2
+
+        self._background_shapes = ShapeElementList()
+        self._background_shapes.append(create_rectangle_filled(
+            bar_center_x, bar_center_y, self._bar_width, self.height, self.COLORS["background"]))
+        self._background_shapes.append(create_rectangle_outline(
+            bar_center_x, bar_center_y, self._bar_width, self.height, self.COLORS["progress_border"], 2))
+
+        markers = ShapeElementList()
+        # Thin ticks of one colour go into a single line batch each
+        ticks = {"lap_marker": [], self.EVENT_OVERTAKE: [], self.EVENT_PIT: []}
+        for lap_x in self._lap_xs.tolist():
+            ticks["lap_marker"] += [(lap_x, self.bottom + 2), (lap_x, self.bottom + self.height - 2)]
+        for event, event_x in zip(self._events, self._event_xs.tolist()):
+            event_type = event.get("type", "")
+            if event_type == self.EVENT_OVERTAKE:
+                ticks[event_type] += [(event_x, bar_center_y + 2), (event_x, self.bottom + self.height - 2)]
+            elif event_type == self.EVENT_PIT:
+                ticks[event_type] += [(event_x, self.bottom + 2), (event_x, bar_center_y - 2)]
+            else:
+                for shape in self._event_marker_shapes(event, event_x):
+                    markers.append(shape)
+        for color_key, points in ticks.items():
+            if points:
+                markers.append(create_lines(points, self.COLORS[color_key]))
+        self._marker_shapes = markers
     
     # 7. Draw tooltips and overlays after the main draw to prevent them being occluded
     def draw_overlays(self, window):
@@ -1186,37 +1286,42 @@ class RaceProgressBarComponent(BaseComponent):
         if self._hover_event:
             self._draw_tooltip(window, self._hover_event)
             
-    def _draw_event_marker(self, event: dict, x: float, center_y: float):
-        """Draw a single event marker based on type."""
+    def _event_marker_shapes(self, event: dict, x: float) -> list:
+        """Shapes for a single event marker based on type (ticks are batched by the caller)."""
         event_type = event.get("type", "")
         marker_top = self.bottom + self.height + self.marker_height
-        marker_bottom = self.bottom + self.height
         
         if event_type == self.EVENT_DNF:
-            # Draw red X marker above the bar
+            # Red X marker above the bar
             size = 6
             color = self.COLORS["dnf"]
             y = marker_top - size
-            arcade.draw_line(x - size, y - size, x + size, y + size, color, 2)
-            arcade.draw_line(x - size, y + size, x + size, y - size, color, 2)
-            
-        elif event_type == self.EVENT_YELLOW_FLAG:
-            # Draw yellow flag indicator on the bar
-            self._draw_flag_segment(event, self.COLORS["yellow_flag"])
-            
-        elif event_type == self.EVENT_RED_FLAG:
-            # Draw red flag indicator on the bar
-            self._draw_flag_segment(event, self.COLORS["red_flag"])
-            
-        elif event_type == self.EVENT_SAFETY_CAR:
-            # Draw orange segment for safety car
-            self._draw_flag_segment(event, self.COLORS["safety_car"])
+            return [
+                create_line(x - size, y - size, x + size, y + size, color, 2),
+                create_line(x - size, y + size, x + size, y - size, color, 2),
+            ]
+
+        elif event_type == self.EVENT_LEADER_CHANGE:
+            # Gold triangle above the bar
+            y = marker_top - 6
+            return [create_polygon([(x - 5, y - 4), (x + 5, y - 4), (x, y + 5)], self.COLORS["leader_change"])]
+
+        elif event_type == self.EVENT_FASTEST_LAP:
+            # Purple dot above the bar
+            return [create_ellipse_filled(x, marker_top - 6, 6, 6, self.COLORS["fastest_lap"])]
             
-        elif event_type == self.EVENT_VSC:
-            # Draw amber segment for VSC
-            self._draw_flag_segment(event, self.COLORS["vsc"])
+        flag_colors = {
+            self.EVENT_YELLOW_FLAG: self.COLORS["yellow_flag"],
+            self.EVENT_RED_FLAG: self.COLORS["red_flag"],
+            self.EVENT_SAFETY_CAR: self.COLORS["safety_car"],
+            self.EVENT_VSC: self.COLORS["vsc"],
+        }
+        if event_type in flag_colors:
+            segment = self._flag_segment_shape(event, flag_colors[event_type])
+            return [segment] if segment is not None else []
+        return []
             
-    def _draw_flag_segment(self, event: dict, color: tuple):
+    def _flag_segment_shape(self, event: dict, color: tuple):
         start_frame = event.get("frame", 0)
         end_frame = event.get("end_frame", start_frame + 100)  # default duration
         
@@ -1226,7 +1331,7 @@ class RaceProgressBarComponent(BaseComponent):
         if clamped_start >= clamped_end:
             # after clamping, if start >= end, the segment is fully outside the
             # visible race window (e.g., flag ended before frame 0)
-            return
+            return None
         
         # Convert clamped frames to X positions
         start_x = self._frame_to_x(clamped_start)
@@ -1244,19 +1349,19 @@ class RaceProgressBarComponent(BaseComponent):
         
         # Skip segments with zero or negative visible width after clamping
         if segment_width <= 0:
-            return
+            return None
         
         # Ensure minimum width for visibility (thin flags are hard to see)
         segment_width = max(4, segment_width)
         
-        # Draw as a thin bar above the main progress bar
-        segment_rect = arcade.XYWH(
+        # A thin bar above the main progress bar
+        return create_rectangle_filled(
             start_x + segment_width / 2,
             self.bottom + self.height + 4,
             segment_width,
-            6
+            6,
+            color
         )
-        arcade.draw_rect_filled(segment_rect, color)
         
     def _draw_tooltip(self, window, event: dict):
         event_type = event.get("type", "")
@@ -1266,6 +1371,10 @@ class RaceProgressBarComponent(BaseComponent):
         # Build tooltip text
         type_names = {
             self.EVENT_DNF: "DNF",
+            self.EVENT_LEADER_CHANGE: "New Leader",
+            self.EVENT_OVERTAKE: "Overtake",
+            self.EVENT_PIT: "Pit Entry",
+            self.EVENT_FASTEST_LAP: "Fastest Lap",
             self.EVENT_YELLOW_FLAG: "Yellow Flag",
             self.EVENT_RED_FLAG: "Red Flag",
             self.EVENT_SAFETY_CAR: "Safety Car",
@@ -1285,7 +1394,8 @@ class RaceProgressBarComponent(BaseComponent):
         
         # Draw tooltip background
         padding = 8
-        text_obj = arcade.Text(tooltip_text, 0, 0, (255, 255, 255), 12)
+        text_obj = self._texts.get("tooltip", tooltip_text, tooltip_x, tooltip_y, (255, 255, 255), 12,
+                                   anchor_x="center", anchor_y="center")
         text_width = text_obj.content_width
         
         bg_rect = arcade.XYWH(
@@ -1298,12 +1408,7 @@ class RaceProgressBarComponent(BaseComponent):
         arcade.draw_rect_outline(bg_rect, (100, 100, 100), 1)
         
         # Draw text
-        arcade.Text(
-            tooltip_text,
-            tooltip_x, tooltip_y,
-            (255, 255, 255), 12,
-            anchor_x="center", anchor_y="center"
-        ).draw()
+        text_obj.draw()
         
     def _draw_legend(self, window):
         """Draw a small legend explaining the markers."""
@@ -1319,26 +1424,27 @@ class RaceProgressBarComponent(BaseComponent):
         
         for i, (color, symbol, label) in enumerate(legend_items):
             x = legend_x + (i * 45)
-            arcade.Text(
-                symbol,
+            self._texts.draw(
+                ("legend_symbol", i), symbol,
                 x, legend_y + 2,
                 color, 10, bold=True,
                 anchor_x="center", anchor_y="center"
-            ).draw()
-            arcade.Text(
-                label,
+            )
+            self._texts.draw(
+                ("legend_label", i), label,
                 x, legend_y - 10,
                 self.COLORS["text"], 8,
                 anchor_x="center", anchor_y="top"
-            ).draw()
+            )
         
     def on_mouse_motion(self, window, x: float, y: float, dx: float, dy: float):
-        """Handle mouse motion for hover effects."""
+        """Handle mouse motion for hover effects. Returns True if the hovered event changed."""
         if not self._visible:
-            return
+            return False
             
         self._mouse_x = x
         self._mouse_y = y
+        previous_event = self._hover_event
         
         # Check if mouse is over the progress bar area
         if (self._bar_left <= x <= self._bar_left + self._bar_width and
@@ -1359,6 +1465,7 @@ class RaceProgressBarComponent(BaseComponent):
             self._hover_event = nearest_event
         else:
             self._hover_event = None
+        return self._hover_event is not previous_event
             
     def on_mouse_press(self, window, x: float, y: float, button: int, modifiers: int):
         """Handle mouse click to seek to position."""
@@ -1393,6 +1500,7 @@ class RaceControlsComponent(BaseComponent):
         self.button_spacing = 70
         self.speed_container_offset = 200
         self._hide_speed_text = False
+        self._texts = TextPool()
         self._control_textures = {}
         self._visible = visible
         
@@ -1453,6 +1561,11 @@ class RaceControlsComponent(BaseComponent):
             if self._flash_timer == 0:
                 self._flash_button = None
     
+    @property
+    def animating(self) -> bool:
+        """True while a button flash is fading out."""
+        return self._flash_timer > 0
+
     def flash_button(self, button_name: str):
         """Trigger a visual flash effect for a button (used for keyboard feedback)."""
         self._flash_button = button_name
@@ -1583,10 +1696,10 @@ class RaceControlsComponent(BaseComponent):
             
             # Draw speed text in center
             if not self._hide_speed_text:
-                arcade.Text(f"{speed}x", x, y - 5,
-                            arcade.color.WHITE, 11,
-                            anchor_x="center",
-                            bold=True).draw()
+                self._texts.draw("speed", f"{speed}x", x, y - 5,
+                                 arcade.color.WHITE, 11,
+                                 anchor_x="center",
+                                 bold=True)
             
             # Draw plus button
             arcade.draw_texture_rect(
@@ -1602,7 +1715,8 @@ class RaceControlsComponent(BaseComponent):
             
 
     def on_mouse_motion(self, window, x: float, y: float, dx: float, dy: float):
-        """Handle mouse hover effects."""
+        """Handle mouse hover effects. Returns True if the hovered button changed."""
+        previous_button = self.hover_button
         if self._point_in_rect(x, y, self.rewind_rect):
             self.hover_button = 'rewind'
         elif self._point_in_rect(x, y, self.play_pause_rect):
@@ -1615,7 +1729,7 @@ class RaceControlsComponent(BaseComponent):
             self.hover_button = 'speed_decrease'
         else:
             self.hover_button = None
-        return False
+        return self.hover_button != previous_button
     
     def on_mouse_press(self, window, x: float, y: float, button: int, modifiers: int):
         """Handle button clicks."""
@@ -1678,6 +1792,7 @@ class QualifyingLapTimeComponent(BaseComponent):
         self._tyre_textures = {}
         self._time_elapsed = 0.0
         self._delta_sector = None
+        self._texts = TextPool()
         self._last_completed_sector = -1
         # Import the tyre textures from the images/tyres folder (all files)
         tyres_folder = os.path.join("images", "tyres")
@@ -1688,6 +1803,11 @@ class QualifyingLapTimeComponent(BaseComponent):
                     texture_path = os.path.join(tyres_folder, filename)
                     self._tyre_textures[texture_name] = arcade.load_texture(texture_path)
 
+    @property
+    def animating(self) -> bool:
+        """True while a sector delta is on screen (it disappears after a second)."""
+        return self._delta_sector is not None
+
     def on_update(self, delta_time: float):
         """
         Update logic for time difference in fastest driver and current driver (Delta sector time)
@@ -1741,7 +1861,7 @@ class QualifyingLapTimeComponent(BaseComponent):
         
         arcade.draw_rect_filled(rect, (20, 20, 20, 255))
 
-        arcade.Text(f"{driver_full_name}", self.x + 10, self.y - 30, driver_color, 16, bold=True).draw()
+        self._texts.draw("driver", f"{driver_full_name}", self.x + 10, self.y - 30, driver_color, 16, bold=True)
         
         #Display tyre compound texture
         rect = arcade.XYWH(self.x + 220, self.y - 22, 24, 24)
@@ -1758,11 +1878,11 @@ class QualifyingLapTimeComponent(BaseComponent):
 
         arcade.draw_line(self.x, self.y - 40, self.x + 250, self.y - 40, arcade.color.ANTI_FLASH_WHITE, 3)
 
-        arcade.Text(f"{formatted_time}", self.x + 10, self.y - 70, arcade.color.ANTI_FLASH_WHITE, 18, anchor_x="left", bold=True).draw()
+        self._texts.draw("time", f"{formatted_time}", self.x + 10, self.y - 70, arcade.color.ANTI_FLASH_WHITE, 18, anchor_x="left", bold=True)
 
         if self.fastest_driver_sector_times and fastest_driver_full_name and fastest_driver_full_name != driver_full_name:
             fastest_last_name = fastest_driver_full_name.split(" ")[-1]
-            arcade.Text(f"{fastest_last_name}", self.x + 150, self.y - 85, arcade.color.LIGHT_GRAY, 13, anchor_x="left").draw()
+            self._texts.draw("fastest_driver", f"{fastest_last_name}", self.x + 150, self.y - 85, arcade.color.LIGHT_GRAY, 13, anchor_x="left")
 
         #show sector times over the labels
         sector_configs = [
@@ -1802,16 +1922,16 @@ class QualifyingLapTimeComponent(BaseComponent):
                 bar_width = 40 if sector_idx == 0 else 45
                 arcade.draw_line(x_pos - 45, self.y - 125, x_pos + bar_width, self.y - 125, arcade.color.GREEN, 3)
                 if sector_idx == 2 and fastest_sector_time is not None:
-                    arcade.Text(f"{formatted_fastest_sector_time}s", self.x + 150, self.y - 65, arcade.color.LIGHT_GRAY, 13, anchor_x="left").draw()
+                    self._texts.draw("fastest_time", f"{formatted_fastest_sector_time}s", self.x + 150, self.y - 65, arcade.color.LIGHT_GRAY, 13, anchor_x="left")
 
             # Sector in progress - show current elapsed time
             else:
                 text = f"{elapsed_in_sector:.1f}s"
                 if fastest_sector_time is not None:
-                    arcade.Text(f"{formatted_fastest_sector_time}s", self.x + 150, self.y - 65, arcade.color.LIGHT_GRAY, 13, anchor_x="left").draw()
+                    self._texts.draw("fastest_time", f"{formatted_fastest_sector_time}s", self.x + 150, self.y - 65, arcade.color.LIGHT_GRAY, 13, anchor_x="left")
             
             # Always draw the sector time text
-            arcade.Text(text, x_pos, self.y - 105, text_color, 12, anchor_x="center", bold=True).draw()
+            self._texts.draw(("sector", sector_idx), text, x_pos, self.y - 105, text_color, 12, anchor_x="center", bold=True)
             
             # Always update cumulative time for next sector
             if sector_time is not None:
@@ -1823,17 +1943,17 @@ class QualifyingLapTimeComponent(BaseComponent):
     def draw_sector_labels(self, sector_times, current_t):
         s1_time = sector_times.get("sector1") or 0
         s1_color = arcade.color.GREEN if s1_time > 0 and current_t >= s1_time else arcade.color.LIGHT_GRAY
-        arcade.Text("S1", self.x + 35, self.y - 120, s1_color, 9, bold=True).draw()
+        self._texts.draw("S1", "S1", self.x + 35, self.y - 120, s1_color, 9, bold=True)
 
         s2_val = sector_times.get("sector2") or 0
         s2_time = s1_time + s2_val
         s2_color = arcade.color.GREEN if s2_time > 0 and current_t >= s2_time else arcade.color.LIGHT_GRAY
-        arcade.Text("S2", self.x + 115, self.y - 120, s2_color, 9, bold=True).draw()
+        self._texts.draw("S2", "S2", self.x + 115, self.y - 120, s2_color, 9, bold=True)
         
         s3_val = sector_times.get("sector3") or 0
         s3_time = s2_time + s3_val
         s3_color = arcade.color.GREEN if s3_time > 0 and current_t >= s3_time else arcade.color.LIGHT_GRAY
-        arcade.Text("S3", self.x + 200, self.y - 120, s3_color, 9, bold=True).draw()      
+        self._texts.draw("S3", "S3", self.x + 200, self.y - 120, s3_color, 9, bold=True)      
     
     def show_delta_sector_times(self, sector_idx: int, sector_time: float, delta_sector_time: float | None, text_color: tuple):
         if self._delta_sector == sector_idx and self._time_elapsed < 1.0 and delta_sector_time is not None:
@@ -1853,90 +1973,29 @@ class QualifyingLapTimeComponent(BaseComponent):
                 self._last_completed_sector = sector_idx
         return text, text_color
 
-def extract_race_events(frames: List[dict], track_statuses: List[dict], total_laps: int) -> List[dict]:
+def flag_events(track_statuses: TrackStatusIndex) -> List[dict]:
     """
-    Extract race events from frame data for the progress bar.
-    
-    This function analyzes the telemetry frames to identify:
-    - DNF events (when a driver stops appearing)
-    - Leader changes (when the P1 position changes hands)
-    - Flag events (from track_statuses)
-    
+    Flag periods (yellow, safety car, VSC, red) as progress bar events.
+
+    The other race events (retirements, leader changes, overtakes, pit
+    entries, fastest laps) are found by the telemetry pipeline and cached
+    with the race data, so the window only has to add these.
+
     Args:
-        frames: List of frame dictionaries from telemetry
-        track_statuses: List of track status events
-        total_laps: Total number of laps in the race
-        
+        track_statuses: Track status intervals, built with the timeline's frame times
+
     Returns:
         List of event dictionaries for the progress bar
     """
+    flag_types = {
+        YELLOW: RaceProgressBarComponent.EVENT_YELLOW_FLAG,
+        SAFETY_CAR: RaceProgressBarComponent.EVENT_SAFETY_CAR,
+        RED_FLAG: RaceProgressBarComponent.EVENT_RED_FLAG,
+        **{code: RaceProgressBarComponent.EVENT_VSC for code in VSC},
+    }
     events = []
-    
-    if not frames:
-        return events
-        
-    n_frames = len(frames)
-    
-    # Track drivers present in each frame
-    prev_drivers = set()
-    
-    # Sample frames at regular intervals for performance (every 25 frames = 1 second)
-    sample_rate = 25
-    
-    for i in range(0, n_frames, sample_rate):
-        frame = frames[i]
-        drivers_data = frame.get("drivers", {})
-        current_drivers = set(drivers_data.keys())
-        
-        # Detect DNFs (drivers who disappeared)
-        if prev_drivers:
-            dnf_drivers = prev_drivers - current_drivers
-            for driver_code in dnf_drivers:
-                # Get the lap from previous frame if available
-                prev_frame = frames[max(0, i - sample_rate)]
-                driver_info = prev_frame.get("drivers", {}).get(driver_code, {})
-                lap = driver_info.get("lap", "?")
-                
-                events.append({
-                    "type": RaceProgressBarComponent.EVENT_DNF,
-                    "frame": i,
-                    "label": driver_code,
-                    "lap": lap,
-                })
-        
-        prev_drivers = current_drivers
-    
-    # Add flag events from track_statuses
-    for status in track_statuses:
-        status_code = str(status.get("status", ""))
-        start_time = status.get("start_time", 0)
-        end_time = status.get("end_time")
-        
-        # Convert time to frame (assuming 25 FPS)
-        fps = 25
-        start_frame = int(start_time * fps)
-        end_frame = int(end_time * fps) if end_time else start_frame + 250  # Default 10 seconds
-        
-        # This prevents rendering artifacts from pre-race track status events
-        # that shouldn't appear on the timeline... Events that span frame 0
-        # (start < 0 but end > 0) are kept; the drawing code will clamp them
-        if end_frame <= 0:
-            continue
-        
-        # Note: The drawing code also clamps, but normalizing here improves data quality
-        if n_frames > 0:
-            end_frame = min(end_frame, n_frames)
-        
-        event_type = None
-        if status_code == "2":  # Yellow flag
-            event_type = RaceProgressBarComponent.EVENT_YELLOW_FLAG
-        elif status_code == "4":  # Safety Car
-            event_type = RaceProgressBarComponent.EVENT_SAFETY_CAR
-        elif status_code == "5":  # Red flag
-            event_type = RaceProgressBarComponent.EVENT_RED_FLAG
-        elif status_code in ("6", "7"):  # VSC
-            event_type = RaceProgressBarComponent.EVENT_VSC
-            
+    for status_code, start_frame, end_frame in track_statuses.frame_segments():
+        event_type = flag_types.get(status_code)
         if event_type:
             events.append({
                 "type": event_type,
@@ -1945,7 +2004,6 @@ def extract_race_events(frames: List[dict], track_statuses: List[dict], total_la
                 "label": "",
                 "lap": None,
             })
-    
     return events
 
 # Build track geometry from example lap telemetry
@@ -2012,10 +2070,11 @@ def plotDRSzones(example_lap):
    
    return drs_zones
 
-def draw_finish_line(self, session_type = 'R'):
+def _finish_line_segments(self, session_type = 'R'):
+    """Checkered finish line squares as (x1, y1, x2, y2, color) in screen space."""
     if(session_type not in ['R', 'Q']):
         print("Invalid session type for finish line drawing...")
-        return
+        return []
 
     start_inner = None
     start_outer = None
@@ -2027,38 +2086,39 @@ def draw_finish_line(self, session_type = 'R'):
         start_inner = self.screen_inner_points[0]
         start_outer = self.screen_outer_points[0]
     else:
-        return
+        return []
     
-    # Draw checkered finish line
-    if start_inner and start_outer:
-        num_squares = 20
-        extension = 20
-            
-        # Calculate direction vector and normalize
-        dx = start_outer[0] - start_inner[0]
-        dy = start_outer[1] - start_inner[1]
-        length = np.sqrt(dx**2 + dy**2)
-            
-        if length > 0:
-            # Normalize direction (unit vector)
-            dx_norm = dx / length
-            dy_norm = dy / length
-                
-            # Extend line beyond track limits
-            extended_inner = (start_inner[0] - extension * dx_norm, 
-                             start_inner[1] - extension * dy_norm)
-            extended_outer = (start_outer[0] + extension * dx_norm, 
-                             start_outer[1] + extension * dy_norm)
-            
-            # Draw checkered pattern across extended line
-            for i in range(num_squares):
-                t1 = i / num_squares # start of segment
-                t2 = (i + 1) / num_squares # end of segment
-                
-                x1 = extended_inner[0] + t1 * (extended_outer[0] - extended_inner[0])
-                y1 = extended_inner[1] + t1 * (extended_outer[1] - extended_inner[1])
-                x2 = extended_inner[0] + t2 * (extended_outer[0] - extended_inner[0])
-                y2 = extended_inner[1] + t2 * (extended_outer[1] - extended_inner[1])
-                
-                color = arcade.color.WHITE if i % 2 == 0 else arcade.color.BLACK
-                arcade.draw_line(x1, y1, x2, y2, color, 6)
\ No newline at end of file
+    # Checkered finish line
+    num_squares = 20
+    extension = 20
+
+    # Calculate direction vector and normalize
+    inner = np.asarray(start_inner, dtype=float)
+    outer = np.asarray(start_outer, dtype=float)
+    direction = outer - inner
+    length = np.hypot(*direction)
+    if length <= 0:
+        return []
+
+    # Extend line beyond track limits, then split it into equal squares
+    direction /= length
+    extended_inner = inner - extension * direction
+    extended_outer = outer + extension * direction
+    ts = np.linspace(0.0, 1.0, num_squares + 1)[:, None]
+    ends = extended_inner + ts * (extended_outer - extended_inner)
+
+    return [
+        (x1, y1, x2, y2, arcade.color.WHITE if i % 2 == 0 else arcade.color.BLACK)
+        for i, ((x1, y1), (x2, y2)) in enumerate(zip(ends[:-1].tolist(), ends[1:].tolist()))
+    ]
+
+def draw_finish_line(self, session_type = 'R'):
+    for x1, y1, x2, y2, color in _finish_line_segments(self, session_type):
+        arcade.draw_line(x1, y1, x2, y2, color, 6)
+
+def create_finish_line_shapes(self, session_type = 'R'):
+    """Same squares as draw_finish_line, as shapes for a ShapeElementList (built once per resize)."""
+    return [
+        create_line(x1, y1, x2, y2, color, 6)
+        for x1, y1, x2, y2, color in _finish_line_segments(self, session_type)
+    ]